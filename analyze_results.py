@@ -1,4 +1,5 @@
 import csv
+import json
 import sys
 import os
 
@@ -36,7 +37,17 @@ def analyze_results(csv_path="results/benchmark_results.csv"):
                 'throughput_samples_per_sec': float(row['throughput_samples_per_sec']),
                 'peak_memory_mb': float(row['peak_memory_mb']),
                 'avg_memory_mb': float(row['avg_memory_mb']),
-                'compile_time_sec': row.get('compile_time_sec', 'N/A')
+                'compile_time_sec': row.get('compile_time_sec', 'N/A'),
+                'first_call_ms': row.get('first_call_ms', 'N/A'),
+                'cold_start_sec': row.get('cold_start_sec', 'N/A'),
+                'compile_peak_rss_mb': row.get('compile_peak_rss_mb', 'N/A'),
+                'artifact_size_mb': row.get('artifact_size_mb', 'N/A'),
+                'latency_cold_mean_ms': row.get('latency_cold_mean_ms', 'N/A'),
+                'latency_cold_p95_ms': row.get('latency_cold_p95_ms', 'N/A'),
+                'energy_per_inference_j': row.get('energy_per_inference_j', 'N/A'),
+                'energy_per_sample_j': row.get('energy_per_sample_j', 'N/A'),
+                'avg_package_power_w': row.get('avg_package_power_w', 'N/A'),
+                'compile_phases': json.loads(row['compile_phases']) if row.get('compile_phases', 'N/A') != 'N/A' else []
             }
     
     compilers = sorted(all_compilers)
@@ -73,15 +84,33 @@ def analyze_results(csv_path="results/benchmark_results.csv"):
                 print(f"    Batch Size {batch_size}:")
                 print(f"      Latency (mean ± std): {stat['latency_mean_ms']:.3f} ± {stat['latency_std_ms']:.3f} ms")
                 print(f"      Latency (p50/p95):    {stat['latency_p50_ms']:.3f} / {stat['latency_p95_ms']:.3f} ms")
+                if stat['latency_cold_mean_ms'] != 'N/A':
+                    cold_mean = float(stat['latency_cold_mean_ms'])
+                    print(f"      Cache-cold (mean/p95): {cold_mean:.3f} / {float(stat['latency_cold_p95_ms']):.3f} ms "
+                          f"({cold_mean / stat['latency_mean_ms']:.2f}x warm)")
                 print(f"      Throughput:           {stat['throughput_samples_per_sec']:.2f} samples/sec")
                 print(f"      Peak Memory:          {stat['peak_memory_mb']:.2f} MB")
                 print(f"      Avg Memory:           {stat['avg_memory_mb']:.2f} MB")
+                if stat['energy_per_inference_j'] != 'N/A':
+                    print(f"      Energy:               {float(stat['energy_per_inference_j']):.4f} J/inference "
+                          f"({float(stat['energy_per_sample_j']):.4f} J/sample, "
+                          f"{float(stat['avg_package_power_w']):.1f} W package)")
                 
                 if stat['compile_time_sec'] != 'N/A':
                     compile_time = float(stat['compile_time_sec'])
                     print(f"      Compile Time:         {compile_time:.3f} s")
                 else:
                     print(f"      Compile Time:         N/A")
+                for phase in stat['compile_phases']:
+                    print(f"        {phase['name']:<20} {phase['duration_sec']:.3f} s (peak RSS {phase['peak_rss_mb']:.1f} MB)")
+                if stat['first_call_ms'] != 'N/A':
+                    print(f"      First Call:           {float(stat['first_call_ms']):.3f} ms")
+                if stat['cold_start_sec'] != 'N/A':
+                    print(f"      Cold Start:           {float(stat['cold_start_sec']):.3f} s")
+                if stat['compile_peak_rss_mb'] != 'N/A':
+                    print(f"      Compile Peak RSS:     {float(stat['compile_peak_rss_mb']):.2f} MB")
+                if stat['artifact_size_mb'] != 'N/A':
+                    print(f"      Artifact Size:        {float(stat['artifact_size_mb']):.2f} MB")
                 print()
         
         eager_compiler = 'pytorch_eager'
@@ -116,13 +145,15 @@ def analyze_results(csv_path="results/benchmark_results.csv"):
                             print(f"      Compile Cost: {compile_time:.2f} s")
                         print()
     
+    print_cold_start_comparison(by_model, compilers, batch_sizes)
+    
     print("="*80)
     print("SUMMARY TABLE")
     print("="*80)
     print()
     
-    print(f"{'Model':<20} {'Compiler':<25} {'Batch':<6} {'Latency(ms)':<12} {'Throughput':<15} {'Memory(MB)':<12} {'Compile(s)':<12}")
-    print("-" * 110)
+    print(f"{'Model':<20} {'Compiler':<25} {'Batch':<6} {'Latency(ms)':<12} {'Throughput':<15} {'Memory(MB)':<12} {'Compile(s)':<12} {'ColdStart(s)':<12}")
+    print("-" * 123)
     
     for model in sorted(by_model.keys()):
         results = by_model[model]
@@ -132,11 +163,40 @@ def analyze_results(csv_path="results/benchmark_results.csv"):
                 if key in results:
                     stat = results[key]
                     compile_str = f"{float(stat['compile_time_sec']):.2f}" if stat['compile_time_sec'] != 'N/A' else "N/A"
-                    print(f"{model:<20} {compiler:<25} {batch_size:<6} {stat['latency_mean_ms']:<12.3f} {stat['throughput_samples_per_sec']:<15.2f} {stat['peak_memory_mb']:<12.2f} {compile_str:<12}")
+                    cold_start_str = f"{float(stat['cold_start_sec']):.2f}" if stat['cold_start_sec'] != 'N/A' else "N/A"
+                    print(f"{model:<20} {compiler:<25} {batch_size:<6} {stat['latency_mean_ms']:<12.3f} {stat['throughput_samples_per_sec']:<15.2f} {stat['peak_memory_mb']:<12.2f} {compile_str:<12} {cold_start_str:<12}")
     
     print("="*80)
 
 
+def print_cold_start_comparison(by_model, compilers, batch_sizes):
+    print("="*80)
+    print("COLD START vs STEADY STATE")
+    print("="*80)
+    print()
+    
+    for model in sorted(by_model.keys()):
+        results = by_model[model]
+        for batch_size in batch_sizes:
+            rows = []
+            for compiler in compilers:
+                stat = results.get((compiler, batch_size))
+                if stat is None or stat['cold_start_sec'] == 'N/A':
+                    continue
+                rows.append((float(stat['cold_start_sec']), compiler, stat))
+            if not rows:
+                continue
+            
+            print(f"  {model} (Batch {batch_size}):")
+            for cold_start, compiler, stat in sorted(rows):
+                load_phases = [p for p in stat['compile_phases'] if p['name'] == 'load']
+                load_str = f"{load_phases[0]['duration_sec']:.3f} s" if load_phases else "N/A"
+                print(f"    {compiler:<32} cold start {cold_start:>9.3f} s | "
+                      f"first call {float(stat['first_call_ms']):>10.3f} ms | "
+                      f"load {load_str:>9} | steady {stat['latency_mean_ms']:>8.3f} ms")
+            print()
+
+
 if __name__ == "__main__":
     csv_path = sys.argv[1] if len(sys.argv) > 1 else "results/benchmark_results.csv"
     analyze_results(csv_path)
@@ -0,0 +1,92 @@
+import argparse
+import json
+import os
+import torch
+from benchmark.core.metrics import format_optional
+from benchmark.core.roofline import RooflinePoint, profile_model
+from benchmark.core.selection import load_results
+from benchmark.registry import get_model
+from benchmark.utils.host_peaks import DEFAULT_CACHE_PATH, load_host_peaks
+from benchmark.utils.output import ResultsWriter
+
+def main():
+    parser = argparse.ArgumentParser(description="Place each benchmark result on the host roofline")
+    parser.add_argument("csv_path", nargs="?", default="results/benchmark_results.csv")
+    parser.add_argument("--device", default=None,
+                        help="device for results without a device column (older CSVs); newer rows record their own")
+    parser.add_argument("--peaks-cache", default=DEFAULT_CACHE_PATH)
+    parser.add_argument("--refresh-peaks", action="store_true", help="re-run the GEMM/bandwidth microbenchmarks")
+    parser.add_argument("--overhead-threshold", type=float, default=20.0,
+                        help="below this %% of the roofline a configuration is classified overhead-bound")
+    parser.add_argument("--output", default="results/roofline.csv")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.csv_path):
+        print(f"Error: Results file not found")
+        return
+    
+    rows = [row for row in load_results(args.csv_path) if row['model_config']]
+    if not rows:
+        print("No results with a model_config column; re-run the benchmark to record it.")
+        return
+    
+    # Peaks must come from the device each row was measured on, not this host's default.
+    unrecorded = [row for row in rows if row.get('device') in (None, "", "N/A")]
+    if unrecorded and args.device is None:
+        print(f"{len(unrecorded)} result(s) have no device column; pass --device to say where they were measured.")
+        return
+    peaks_by_device = {}
+    
+    # FLOP/byte accounting depends only on the model and batch size, so profile each pair once.
+    costs = {}
+    wrappers = {}
+    points = []
+    for row in rows:
+        spec = row['model_config']
+        spec_key = json.dumps(spec, sort_keys=True)
+        cost_key = (spec_key, row['batch_size'])
+        if cost_key not in costs:
+            if spec_key not in wrappers:
+                wrappers[spec_key] = get_model(spec['name'], spec['input_shape'], spec.get('params'))
+            print(f"Profiling {row['model']} at batch size {row['batch_size']}...")
+            costs[cost_key] = profile_model(wrappers[spec_key], row['batch_size'])
+        device_type = args.device if row.get('device') in (None, "", "N/A") else row['device']
+        if device_type not in peaks_by_device:
+            peaks_by_device[device_type] = load_host_peaks(
+                torch.device(device_type), args.peaks_cache, refresh=args.refresh_peaks
+            )
+        peaks = peaks_by_device[device_type]
+        points.append(RooflinePoint(
+            model_name=row['model'],
+            compiler_name=row['compiler'],
+            batch_size=row['batch_size'],
+            cost=costs[cost_key],
+            latency_mean_ms=row['latency_mean_ms'],
+            peak_gflops=peaks['peak_gflops'],
+            memory_bandwidth_gbs=peaks['memory_bandwidth_gbs'],
+            overhead_threshold_pct=args.overhead_threshold,
+            device=device_type,
+        ))
+    
+    for device_type, peaks in sorted(peaks_by_device.items()):
+        ridge = peaks['peak_gflops'] / peaks['memory_bandwidth_gbs']
+        print("\n" + "="*110)
+        print(f"ROOFLINE ({device_type}: peak {peaks['peak_gflops']:.1f} GFLOP/s, "
+              f"{peaks['memory_bandwidth_gbs']:.1f} GB/s, ridge point {ridge:.1f} FLOP/byte)")
+        print("="*110)
+        print(f"{'Model':<24} {'Compiler':<25} {'Batch':<6} {'GFLOPs':<9} {'FLOP/B':<8} {'Achieved':<10} {'Roof':<10} {'%Roof':<7} {'Bound':<9}")
+        print("-" * 110)
+        device_points = [point for point in points if point.device == device_type]
+        # Points without a FLOP count sort last within their model/batch group.
+        for point in sorted(device_points, key=lambda p: (p.model_name, p.batch_size, p.pct_of_roofline is None,
+                                                          -(p.pct_of_roofline or 0))):
+            gflops = point.cost.flops / 1e9 if point.cost.flops is not None else None
+            print(f"{point.model_name:<24} {point.compiler_name:<25} {point.batch_size:<6} "
+                  f"{format_optional(gflops, '.3f'):<9} {format_optional(point.cost.arithmetic_intensity, '.1f'):<8} "
+                  f"{format_optional(point.achieved_gflops, '.1f'):<10} {point.attainable_gflops:<10.1f} "
+                  f"{format_optional(point.pct_of_roofline, '.1f'):<7} {point.bound or 'N/A':<9}")
+    
+    ResultsWriter.write_csv(points, args.output)
+
+if __name__ == "__main__":
+    main()
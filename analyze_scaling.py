@@ -0,0 +1,74 @@
+import csv
+import math
+import re
+import sys
+import os
+from benchmark.core.metrics import MetricsCollector
+
+FAMILY_PATTERN = re.compile(r"^(synthetic_[a-z]+)_")
+
+def analyze_scaling(csv_path="results/benchmark_results.csv", baseline="pytorch_eager"):
+    if not os.path.exists(csv_path):
+        print(f"Error: Results file not found")
+        return
+    
+    # family -> batch_size -> model -> {compiler: row}
+    families = {}
+    with open(csv_path, 'r') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            match = FAMILY_PATTERN.match(row.get('model', ''))
+            if not match or row.get('gflops', 'N/A') == 'N/A':
+                continue
+            by_batch = families.setdefault(match.group(1), {})
+            by_model = by_batch.setdefault(int(row['batch_size']), {})
+            by_model.setdefault(row['model'], {})[row['compiler']] = row
+    
+    if not families:
+        print("No synthetic model results with FLOP counts found.")
+        return
+    
+    print("="*80)
+    print(f"SCALING ANALYSIS (speedup vs {baseline})")
+    print("="*80)
+    
+    for family in sorted(families):
+        for batch_size in sorted(families[family]):
+            models = families[family][batch_size]
+            compilers = sorted({c for rows in models.values() for c in rows if c != baseline})
+            ordered = sorted(models.items(), key=lambda item: float(next(iter(item[1].values()))['gflops']))
+            
+            print(f"\n{family} (Batch {batch_size})")
+            header = f"  {'Model':<36} {'Params(M)':>10} {'GFLOPs':>10}"
+            for compiler in compilers:
+                header += f" {compiler[:22]:>23}"
+            print(header)
+            print("  " + "-" * (len(header) - 2))
+            
+            speedups = {compiler: [] for compiler in compilers}
+            for model, rows in ordered:
+                any_row = next(iter(rows.values()))
+                gflops = float(any_row['gflops'])
+                params_m = int(any_row['num_parameters']) / 1e6 if any_row['num_parameters'] != 'N/A' else float('nan')
+                line = f"  {model:<36} {params_m:>10.2f} {gflops:>10.3f}"
+                for compiler in compilers:
+                    if baseline in rows and compiler in rows:
+                        speedup = float(rows[baseline]['latency_mean_ms']) / float(rows[compiler]['latency_mean_ms'])
+                        speedups[compiler].append((gflops, speedup))
+                        line += f" {speedup:>22.2f}x"
+                    else:
+                        line += f" {'N/A':>23}"
+                print(line)
+            
+            trend = f"  {'slope d(speedup)/d(log10 GFLOPs)':<58}"
+            for compiler in compilers:
+                points = [(math.log10(g), s) for g, s in speedups[compiler] if g > 0]
+                slope = MetricsCollector.linear_slope([p[0] for p in points], [p[1] for p in points])
+                trend += f" {slope:>+23.3f}" if slope is not None else f" {'N/A':>23}"
+            print(trend)
+    
+    print("\n" + "="*80)
+
+if __name__ == "__main__":
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else "results/benchmark_results.csv"
+    analyze_scaling(csv_path)
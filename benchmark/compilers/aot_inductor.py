@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import weakref
+
+import torch
+import torch.nn as nn
+
+from .base import Compiler
+
+
+class AOTInductorCompiler(Compiler):
+
+    def __init__(self):
+        try:
+            import torch._export
+            import torch._inductor
+        except ImportError as exc:
+            raise RuntimeError("AOTInductor is not available in this torch build") from exc
+
+        if hasattr(torch._inductor, "aoti_compile_and_package") and hasattr(torch._inductor, "aoti_load_package"):
+            self._api = "package"
+        elif hasattr(torch, "export") and hasattr(torch._export, "aot_compile") and hasattr(torch._export, "aot_load"):
+            self._api = "shared_library"
+        else:
+            raise RuntimeError(
+                f"AOTInductor requires torch>=2.3 with torch.export support (found {torch.__version__})"
+            )
+
+    def compile(self, model: nn.Module, example_input: torch.Tensor) -> nn.Module:
+        artifact_dir = tempfile.mkdtemp(prefix="aot_inductor_")
+
+        try:
+            artifact_path = self._build(model, example_input, artifact_dir)
+            with self.phase("load"):
+                if self._api == "package":
+                    runner = torch._inductor.aoti_load_package(artifact_path)
+                else:
+                    runner = torch._export.aot_load(artifact_path, example_input.device.type)
+        except Exception:
+            shutil.rmtree(artifact_dir, ignore_errors=True)
+            raise
+
+        compiled_model = _AOTInductorModule(runner, artifact_path)
+        weakref.finalize(compiled_model, shutil.rmtree, artifact_dir, True)
+        return compiled_model
+
+    def supports_export(self) -> bool:
+        return True
+
+    def export_artifact(self, model, example_input, output_dir):
+        artifact_path = self._build(model, example_input, output_dir)
+        return {'format': "aot_inductor", 'file': os.path.basename(artifact_path)}
+
+    def _build(self, model, example_input, artifact_dir):
+        model.eval()
+        with torch.no_grad():
+            if self._api == "package":
+                with self.phase("export"):
+                    exported = torch.export.export(model, (example_input,))
+                with self.phase("aot_compile"):
+                    return torch._inductor.aoti_compile_and_package(
+                        exported,
+                        package_path=os.path.join(artifact_dir, "model.pt2"),
+                    )
+            with self.phase("export_and_aot_compile"):
+                return torch._export.aot_compile(
+                    model,
+                    (example_input,),
+                    options={"aot_inductor.output_path": os.path.join(artifact_dir, "model.so")},
+                )
+
+    def get_name(self) -> str:
+        return "aot_inductor"
+
+    def get_artifact_size(self, compiled_model):
+        return os.path.getsize(compiled_model.artifact_path)
+
+    def supports_dynamic_shapes(self) -> bool:
+        return False
+
+
+class _AOTInductorModule(nn.Module):
+
+    def __init__(self, runner, artifact_path: str):
+        super().__init__()
+        self.runner = runner
+        self.artifact_path = artifact_path
+
+    def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        outputs = self.runner(inputs)
+        if isinstance(outputs, (list, tuple)) and len(outputs) == 1:
+            return outputs[0]
+        return outputs
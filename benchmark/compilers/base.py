@@ -1,16 +1,96 @@
+import copy
+import itertools
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
 import torch
 import torch.nn as nn
 
+from ..utils.device import PeakRSSSampler
+
+
+@dataclass
+class CompilePhase:
+    name: str
+    duration_sec: float
+    peak_rss_bytes: int
+    peak_gpu_bytes: int
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'duration_sec': round(self.duration_sec, 6),
+            'peak_rss_mb': round(self.peak_rss_bytes / (1024 ** 2), 2),
+            'peak_gpu_mb': round(self.peak_gpu_bytes / (1024 ** 2), 2),
+        }
+
+
+def _copy_sharing_tensors(model: nn.Module) -> nn.Module:
+    memo = {id(tensor): tensor for tensor in itertools.chain(model.parameters(), model.buffers())}
+    return copy.deepcopy(model, memo)
+
+
 class Compiler(ABC):
-    
+
     @abstractmethod
     def compile(self, model: nn.Module, example_input: torch.Tensor) -> nn.Module:
         pass
-    
+
     @abstractmethod
     def get_name(self) -> str:
         pass
-    
+
     def supports_dynamic_shapes(self) -> bool:
-        return False
\ No newline at end of file
+        return False
+
+    def get_artifact_size(self, compiled_model: nn.Module) -> Optional[int]:
+        return None
+
+    def get_config(self) -> dict:
+        return {'name': self.get_name()}
+
+    def supports_export(self) -> bool:
+        return False
+
+    def export_artifact(self, model: nn.Module, example_input: torch.Tensor, output_dir: str) -> dict:
+        # Returns the bundle's ``artifact`` metadata: at least ``format`` and ``file`` (relative to output_dir).
+        raise ValueError(f"{self.get_name()} does not produce a deployable artifact")
+
+    def iter_replicas(self, model: nn.Module, example_input: torch.Tensor, count: int,
+                      share_weights: bool = False) -> Iterator[nn.Module]:
+        # Shared copies reuse the original parameter tensors; backends that bake weights in override this.
+        for _ in range(count):
+            replica_model = _copy_sharing_tensors(model) if share_weights else copy.deepcopy(model)
+            yield self.compile(replica_model, example_input)
+
+    def reset_compile_phases(self):
+        self._compile_phases = []
+
+    def get_compile_phases(self) -> List[CompilePhase]:
+        return list(getattr(self, "_compile_phases", []))
+
+    @contextmanager
+    def phase(self, name: str):
+        if not hasattr(self, "_compile_phases"):
+            self._compile_phases = []
+
+        use_cuda = torch.cuda.is_available()
+        if use_cuda:
+            torch.cuda.synchronize()
+            torch.cuda.reset_peak_memory_stats()
+
+        sampler = PeakRSSSampler()
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if use_cuda:
+                torch.cuda.synchronize()
+            duration = time.perf_counter() - start
+            peak_rss = sampler.stop()
+            peak_gpu = torch.cuda.max_memory_allocated() if use_cuda else 0
+            self._compile_phases.append(CompilePhase(name, duration, peak_rss, peak_gpu))
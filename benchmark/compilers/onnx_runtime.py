@@ -10,14 +10,41 @@ from .base import Compiler
 
 class OnnxRuntimeCompiler(Compiler):
 
-    def __init__(self, providers=None, opset_version: int = 17):
+    OPTIMIZATION_LEVELS = {
+        "disabled": "ORT_DISABLE_ALL",
+        "basic": "ORT_ENABLE_BASIC",
+        "extended": "ORT_ENABLE_EXTENDED",
+        "all": "ORT_ENABLE_ALL",
+    }
+
+    def __init__(
+        self,
+        providers=None,
+        opset_version: int = 17,
+        graph_optimization_level: str | None = None,
+        disabled_optimizers: List[str] | None = None,
+        session_config: dict | None = None,
+        optimized_model_dir: str | None = None,
+        tag: str | None = None,
+    ):
         try:
             import onnxruntime as ort
         except ImportError as exc:
             raise RuntimeError("onnxruntime-gpu is not installed") from exc
 
+        if graph_optimization_level is not None and graph_optimization_level not in self.OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown graph_optimization_level: {graph_optimization_level} "
+                f"(expected one of {', '.join(self.OPTIMIZATION_LEVELS)})"
+            )
+
         self.providers = providers
         self.opset_version = opset_version
+        self.graph_optimization_level = graph_optimization_level
+        self.disabled_optimizers = list(disabled_optimizers or [])
+        self.session_config = dict(session_config or {})
+        self.optimized_model_dir = optimized_model_dir
+        self.tag = tag
         self.input_name = "input"
         self.output_name = "output"
 
@@ -31,6 +58,103 @@ class OnnxRuntimeCompiler(Compiler):
         with tempfile.NamedTemporaryFile(suffix=".onnx", delete=False) as tmp:
             onnx_path = tmp.name
 
+        with self.phase("onnx_export"):
+            self._export_onnx(model_cpu, example_cpu, onnx_path)
+        artifact_size = os.path.getsize(onnx_path)
+
+        session = self._create_session(ort, onnx_path, model_cpu, example_cpu)
+        os.unlink(onnx_path)
+
+        return _OnnxRuntimeModule(
+            session=session,
+            input_name=session.get_inputs()[0].name,
+            output_names=[output.name for output in session.get_outputs()],
+            artifact_size_bytes=artifact_size,
+        )
+
+    def iter_replicas(self, model, example_input, count, share_weights=False):
+        import onnxruntime as ort
+
+        model.eval()
+        model_cpu = model.to("cpu")
+        example_cpu = example_input.detach().to("cpu")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            onnx_path = os.path.join(tmp_dir, "model.onnx")
+            with self.phase("onnx_export"):
+                self._export_onnx(model_cpu, example_cpu, onnx_path)
+            artifact_size = os.path.getsize(onnx_path)
+            shared_initializers = _load_shared_initializers(ort, onnx_path) if share_weights else None
+            if share_weights and "CUDAExecutionProvider" in self._resolve_providers():
+                # add_initializer only takes CPU OrtValues; the CUDA EP still copies them to the device per session.
+                print("Note: ORT weight sharing is host-side only; each CUDA session keeps its own device copy.")
+
+            for _ in range(count):
+                session = self._create_session(ort, onnx_path, model_cpu, example_cpu, shared_initializers)
+                yield _OnnxRuntimeModule(
+                    session=session,
+                    input_name=session.get_inputs()[0].name,
+                    output_names=[output.name for output in session.get_outputs()],
+                    artifact_size_bytes=artifact_size,
+                    shared_initializers=shared_initializers,
+                )
+
+    def _create_session(self, ort, onnx_path, model_cpu, example_cpu, shared_initializers=None):
+        providers = self._resolve_providers()
+        session_options = self._build_session_options(ort, model_cpu, example_cpu)
+        session_kwargs = {}
+        if self.disabled_optimizers:
+            session_kwargs["disabled_optimizers"] = self.disabled_optimizers
+        if shared_initializers is not None:
+            _register_env_allocator(ort)
+            session_options.add_session_config_entry("session.use_env_allocators", "1")
+            for name, (_, ort_value) in shared_initializers.items():
+                session_options.add_initializer(name, ort_value)
+
+        with self.phase("session_create"):
+            session = ort.InferenceSession(
+                onnx_path,
+                providers=providers,
+                sess_options=session_options,
+                **session_kwargs,
+            )
+
+        if session_options.optimized_model_filepath:
+            print(f"Saved optimized ONNX graph to: {session_options.optimized_model_filepath}")
+        return session
+
+    def get_config(self):
+        config = {'name': "onnxruntime", 'opset_version': self.opset_version}
+        optional = {
+            'providers': self.providers,
+            'graph_optimization_level': self.graph_optimization_level,
+            'disabled_optimizers': self.disabled_optimizers,
+            'session_config': self.session_config,
+            'tag': self.tag,
+        }
+        config.update({key: value for key, value in optional.items() if value})
+        return config
+
+    def supports_export(self):
+        return True
+
+    def export_artifact(self, model, example_input, output_dir):
+        model.eval()
+        self._export_onnx(model.to("cpu"), example_input.detach().to("cpu"), os.path.join(output_dir, "model.onnx"))
+        artifact = {
+            'format': "onnx",
+            'file': "model.onnx",
+            'providers': self.providers,
+            'graph_optimization_level': (
+                self.OPTIMIZATION_LEVELS[self.graph_optimization_level]
+                if self.graph_optimization_level is not None else None
+            ),
+            'disabled_optimizers': self.disabled_optimizers,
+            'session_config': self.session_config,
+        }
+        return artifact
+
+    def _export_onnx(self, model_cpu, example_cpu, onnx_path):
         torch.onnx.export(
             model_cpu,
             example_cpu,
@@ -45,41 +169,83 @@ class OnnxRuntimeCompiler(Compiler):
             do_constant_folding=True,
         )
 
-        providers = self.providers
-        if providers is None:
-            if torch.cuda.is_available():
-                providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
-            else:
-                providers = ["CPUExecutionProvider"]
+    def _resolve_providers(self):
+        if self.providers is not None:
+            return self.providers
+        if torch.cuda.is_available():
+            return ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        return ["CPUExecutionProvider"]
+
+    def get_name(self) -> str:
+        name = "onnxruntime"
+        if self.graph_optimization_level is not None:
+            name = f"{name}_{self.graph_optimization_level}"
+        if self.tag:
+            return f"{name}_{self.tag}"
+        # Without a tag, variants that differ only in these settings would otherwise share a name.
+        if self.disabled_optimizers:
+            name = f"{name}_no-{'-'.join(sorted(self.disabled_optimizers))}"
+        for key, value in sorted(self.session_config.items()):
+            name = f"{name}_{key.rsplit('.', 1)[-1]}={value}"
+        return name
 
+    def _build_session_options(self, ort, model, example_input):
         session_options = ort.SessionOptions()
-        session = ort.InferenceSession(
-            onnx_path,
-            providers=providers,
-            sess_options=session_options,
-        )
-        os.unlink(onnx_path)
+        if self.graph_optimization_level is not None:
+            level_name = self.OPTIMIZATION_LEVELS[self.graph_optimization_level]
+            session_options.graph_optimization_level = getattr(ort.GraphOptimizationLevel, level_name)
 
-        return _OnnxRuntimeModule(
-            session=session,
-            input_name=session.get_inputs()[0].name,
-            output_names=[output.name for output in session.get_outputs()],
-        )
+        for key, value in self.session_config.items():
+            session_options.add_session_config_entry(key, str(value))
 
-    def get_name(self) -> str:
-        return "onnxruntime"
+        if self.optimized_model_dir:
+            os.makedirs(self.optimized_model_dir, exist_ok=True)
+            batch_size = example_input.shape[0] if example_input.dim() > 0 else 1
+            file_name = f"{type(model).__name__.lower()}_b{batch_size}_{self.get_name()}.onnx"
+            session_options.optimized_model_filepath = os.path.join(self.optimized_model_dir, file_name)
+        return session_options
+
+    def get_artifact_size(self, compiled_model):
+        return getattr(compiled_model, "artifact_size_bytes", None)
 
     def supports_dynamic_shapes(self):
         return True
 
 
+_ENV_ALLOCATOR_REGISTERED = False
+
+
+def _register_env_allocator(ort):
+    global _ENV_ALLOCATOR_REGISTERED
+    if _ENV_ALLOCATOR_REGISTERED:
+        return
+    memory_info = ort.OrtMemoryInfo("Cpu", ort.OrtAllocatorType.ORT_ARENA_ALLOCATOR, 0, ort.OrtMemType.DEFAULT)
+    ort.create_and_register_allocator(memory_info, ort.OrtArenaCfg(0, -1, -1, -1))
+    _ENV_ALLOCATOR_REGISTERED = True
+
+
+def _load_shared_initializers(ort, onnx_path):
+    import onnx
+    from onnx import numpy_helper
+
+    graph = onnx.load(onnx_path).graph
+    shared = {}
+    for initializer in graph.initializer:
+        # OrtValue wraps the numpy buffer without copying, so keep the array alive alongside it.
+        array = numpy_helper.to_array(initializer)
+        shared[initializer.name] = (array, ort.OrtValue.ortvalue_from_numpy(array))
+    return shared
+
+
 class _OnnxRuntimeModule(nn.Module):
 
-    def __init__(self, session, input_name, output_names):
+    def __init__(self, session, input_name, output_names, artifact_size_bytes=None, shared_initializers=None):
         super().__init__()
         self.session = session
         self.input_name = input_name
         self.output_names = output_names
+        self.artifact_size_bytes = artifact_size_bytes
+        self.shared_initializers = shared_initializers
 
     def forward(self, inputs: torch.Tensor) -> torch.Tensor:
         input_np = inputs.detach().cpu().numpy()
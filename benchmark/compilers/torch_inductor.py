@@ -3,7 +3,11 @@ import torch.nn as nn
 from .base import Compiler
 
 class TorchInductorCompiler(Compiler):
+    MODES = ("default", "max-autotune", "reduce-overhead")
+    
     def __init__(self, mode="default"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown torch.compile mode: {mode} (expected one of {', '.join(self.MODES)})")
         self.mode = mode
         self._supports_triton = self._check_triton_support()
     
@@ -17,8 +21,15 @@ class TorchInductorCompiler(Compiler):
         except (RuntimeError, AttributeError):
             return False
     
+    def _falls_back_to_eager(self, device_type=None):
+        # Inductor generates C++/OpenMP kernels for CPU tensors and Triton kernels
+        # for CUDA tensors, so only CUDA devices without Triton support need eager.
+        if device_type is None:
+            device_type = "cuda" if torch.cuda.is_available() else "cpu"
+        return device_type == "cuda" and not self._supports_triton
+    
     def compile(self, model: nn.Module, example_input: torch.Tensor) -> nn.Module:
-        if not self._supports_triton:
+        if self._falls_back_to_eager(example_input.device.type):
             import warnings
             warnings.warn(
                 f"Device does not support Triton compiler (CUDA capability < 7.0). "
@@ -27,13 +38,20 @@ class TorchInductorCompiler(Compiler):
             )
             return model
         
-        compiled_model = torch.compile(model, mode=self.mode)
+        with self.phase("dynamo_wrap"):
+            compiled_model = torch.compile(model, mode=self.mode)
+        # torch.compile is lazy: tracing and Inductor codegen run on the first call.
+        with self.phase("inductor_codegen"), torch.no_grad():
+            _ = compiled_model(example_input)
         return compiled_model
     
     def get_name(self) -> str:
-        if not self._supports_triton:
+        if self._falls_back_to_eager():
             return f"torch_inductor_{self.mode}_fallback_eager"
         return f"torch_inductor_{self.mode}"
     
+    def get_config(self):
+        return {'name': "torch_inductor", 'mode': self.mode}
+    
     def supports_dynamic_shapes(self) -> bool:
         return True
\ No newline at end of file
@@ -1,3 +1,6 @@
+import copy
+import io
+import os
 import torch
 import torch.nn as nn
 from .base import Compiler
@@ -10,13 +13,17 @@ class TorchScriptCompiler(Compiler):
         model.eval()
         
         if self.method == "trace":
-            traced_model = torch.jit.trace(model, example_input, check_trace=False)
-            traced_model = torch.jit.optimize_for_inference(traced_model)
+            with self.phase("trace"):
+                traced_model = torch.jit.trace(model, example_input, check_trace=False)
+            with self.phase("optimize_for_inference"):
+                traced_model = torch.jit.optimize_for_inference(traced_model)
             return traced_model
         
         elif self.method == "script":
-            scripted_model = torch.jit.script(model)
-            scripted_model = torch.jit.optimize_for_inference(scripted_model)
+            with self.phase("script"):
+                scripted_model = torch.jit.script(model)
+            with self.phase("optimize_for_inference"):
+                scripted_model = torch.jit.optimize_for_inference(scripted_model)
             return scripted_model
         
         else:
@@ -25,6 +32,36 @@ class TorchScriptCompiler(Compiler):
     def get_name(self):
         return f"torchscript_{self.method}"
     
+    def get_artifact_size(self, compiled_model):
+        buffer = io.BytesIO()
+        torch.jit.save(compiled_model, buffer)
+        return buffer.getbuffer().nbytes
+    
+    def supports_export(self):
+        return True
+    
+    def export_artifact(self, model, example_input, output_dir):
+        compiled_model = self.compile(model, example_input)
+        torch.jit.save(compiled_model, os.path.join(output_dir, "model.pt"))
+        return {'format': "torchscript", 'file': "model.pt"}
+    
+    def iter_replicas(self, model, example_input, count, share_weights=False):
+        # Freezing in optimize_for_inference folds the weights into per-module
+        # constants, so shared replicas cannot be frozen. Unshared replicas are
+        # left unfrozen too, so the comparison measures sharing alone.
+        model.eval()
+        for _ in range(count):
+            replica_model = model if share_weights else copy.deepcopy(model)
+            if self.method == "trace":
+                with self.phase("trace"):
+                    replica = torch.jit.trace(replica_model, example_input, check_trace=False)
+            elif self.method == "script":
+                with self.phase("script"):
+                    replica = torch.jit.script(replica_model)
+            else:
+                raise ValueError(f"Unknown method: {self.method}")
+            yield replica
+    
     def supports_dynamic_shapes(self):
         return False
 
@@ -1,16 +1,19 @@
+import os
 import shutil
+import tempfile
 import warnings
 
 import torch
 import torch.nn as nn
 from torch.utils import dlpack
 
+from ..utils.cpu_features import host_llvm_target_string
 from .base import Compiler
 
 
 class TVMCompiler(Compiler):
 
-    def __init__(self, target: str | None = None, opt_level: int = 3):
+    def __init__(self, target: str | None = None, opt_level: int = 3, host_tuned: bool = True):
         try:
             import tvm
             from tvm import relay
@@ -25,6 +28,7 @@ class TVMCompiler(Compiler):
             tvm.get_global_func("target.build.cuda", allow_missing=True)
         )
         self._nvcc_available = shutil.which("nvcc") is not None
+        self.host_tuned = host_tuned
 
         default_target = "cuda" if torch.cuda.is_available() and self._tvm_cuda_enabled else "llvm"
         requested_target = target or default_target
@@ -33,20 +37,11 @@ class TVMCompiler(Compiler):
         self.input_name = "input0"
 
     def compile(self, model, example_input):
-        model.eval()
-        model_cpu = model.to("cpu")
-        example_cpu = example_input.detach().to("cpu")
-
-        traced = torch.jit.trace(model_cpu, example_cpu)
-
-        shape_list = [(self.input_name, tuple(example_cpu.shape))]
-        relay_mod, params = self._relay.frontend.from_pytorch(traced, shape_list)
+        lib = self._build(model, example_input)
 
-        with self._tvm.transform.PassContext(opt_level=self.opt_level):
-            lib = self._relay.build(relay_mod, target=self._tvm_target, params=params)
-
-        tvm_device = self._get_tvm_device()
-        graph_mod = self._graph_executor.GraphModule(lib["default"](tvm_device))
+        with self.phase("load"):
+            tvm_device = self._get_tvm_device()
+            graph_mod = self._graph_executor.GraphModule(lib["default"](tvm_device))
 
         return _TVMCompiledModule(
             graph_module=graph_mod,
@@ -54,11 +49,81 @@ class TVMCompiler(Compiler):
             target=self.target,
             tvm_device=tvm_device,
             input_name=self.input_name,
+            lib=lib,
         )
 
+    def iter_replicas(self, model, example_input, count, share_weights=False):
+        # Factory-created executors copy the parameters; shared ones point at the first executor's via share_params.
+        lib = self._build(model, example_input)
+        tvm_device = self._get_tvm_device()
+        first_module = None
+        params_bytes = None
+
+        for _ in range(count):
+            with self.phase("load"):
+                if first_module is None or not share_weights:
+                    graph_mod = self._graph_executor.GraphModule(lib["default"](tvm_device))
+                else:
+                    if params_bytes is None:
+                        params_bytes = self._tvm.runtime.save_param_dict(lib.get_params())
+                    graph_mod = self._graph_executor.create(lib.get_graph_json(), lib.get_lib(), tvm_device)
+                    graph_mod.share_params(first_module, params_bytes)
+            first_module = first_module or graph_mod
+            yield _TVMCompiledModule(
+                graph_module=graph_mod,
+                tvm_module=self._tvm,
+                target=self.target,
+                tvm_device=tvm_device,
+                input_name=self.input_name,
+                lib=lib,
+            )
+
+    def get_config(self):
+        return {'name': "tvm", 'target': self.target, 'opt_level': self.opt_level, 'host_tuned': self.host_tuned}
+
+    def supports_export(self) -> bool:
+        return True
+
+    def export_artifact(self, model, example_input, output_dir):
+        lib = self._build(model, example_input)
+        lib.export_library(os.path.join(output_dir, "model.so"))
+        return {'format': "tvm", 'file': "model.so", 'target': self.target, 'input_name': self.input_name}
+
+    def _build(self, model, example_input):
+        model.eval()
+        model_cpu = model.to("cpu")
+        example_cpu = example_input.detach().to("cpu")
+
+        with self.phase("trace"):
+            traced = torch.jit.trace(model_cpu, example_cpu)
+
+        input_dtype = str(example_cpu.dtype).replace("torch.", "")
+        shape_list = [(self.input_name, (tuple(example_cpu.shape), input_dtype))]
+        with self.phase("from_pytorch"):
+            relay_mod, params = self._relay.frontend.from_pytorch(traced, shape_list)
+
+        with self.phase("build"):
+            with self._tvm.transform.PassContext(opt_level=self.opt_level):
+                return self._relay.build(relay_mod, target=self._tvm_target, params=params)
+
     def get_name(self) -> str:
+        if self.target == "llvm":
+            return "tvm_llvm_generic"
+        if self.target.startswith("llvm"):
+            # aarch64 hosts resolve to -mcpu=generic, which must not collide with the bare target.
+            mcpu = self._tvm_target.attrs.get("mcpu")
+            return f"tvm_llvm_{mcpu}" if mcpu and mcpu != "generic" else "tvm_llvm_host"
         return f"tvm_{self.target}"
 
+    def get_artifact_size(self, compiled_model):
+        lib = getattr(compiled_model, "lib", None)
+        if lib is None:
+            return None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lib_path = os.path.join(tmp_dir, "model.so")
+            lib.export_library(lib_path)
+            return os.path.getsize(lib_path)
+
     def supports_dynamic_shapes(self) -> bool:
         return False
 
@@ -78,7 +143,7 @@ class TVMCompiler(Compiler):
                     "Falling back to 'llvm'.",
                     RuntimeWarning,
                 )
-                return "llvm", self._tvm.target.Target("llvm")
+                return self._cpu_target()
 
             if not self._tvm_cuda_enabled:
                 warnings.warn(
@@ -86,7 +151,7 @@ class TVMCompiler(Compiler):
                     "Reinstall TVM with the CUDA-enabled TLCPack wheel to target GPUs.",
                     RuntimeWarning,
                 )
-                return "llvm", self._tvm.target.Target("llvm")
+                return self._cpu_target()
 
             if not self._nvcc_available:
                 warnings.warn(
@@ -94,7 +159,7 @@ class TVMCompiler(Compiler):
                     "Install CUDA toolkit to enable GPU builds.",
                     RuntimeWarning,
                 )
-                return "llvm", self._tvm.target.Target("llvm")
+                return self._cpu_target()
 
             if "-arch" not in target_str:
                 arch = self._detect_cuda_arch()
@@ -102,8 +167,24 @@ class TVMCompiler(Compiler):
 
             return target_str, self._tvm.target.Target(target_str)
 
+        if target_str == "llvm":
+            return self._cpu_target()
+
         return target_str, self._tvm.target.Target(target_str)
 
+    def _cpu_target(self):
+        # A bare "llvm" target compiles for generic x86-64; add -mcpu/-mattr so
+        # AVX2/AVX-512/VNNI code paths are actually generated for this host.
+        target_str = host_llvm_target_string() if self.host_tuned else "llvm"
+        try:
+            return target_str, self._tvm.target.Target(target_str)
+        except Exception as exc:
+            warnings.warn(
+                f"TVM/LLVM rejected host target '{target_str}' ({exc}). Falling back to 'llvm'.",
+                RuntimeWarning,
+            )
+            return "llvm", self._tvm.target.Target("llvm")
+
     def _detect_cuda_arch(self):
         try:
             device_props = torch.cuda.get_device_properties(0)
@@ -115,9 +196,10 @@ class TVMCompiler(Compiler):
 
 class _TVMCompiledModule(nn.Module):
 
-    def __init__(self, graph_module, tvm_module, target: str, tvm_device, input_name: str):
+    def __init__(self, graph_module, tvm_module, target: str, tvm_device, input_name: str, lib=None):
         super().__init__()
         self.graph_module = graph_module
+        self.lib = lib
         self._tvm = tvm_module
         self.target = target
         self.tvm_device = tvm_device
@@ -1,74 +1,221 @@
 import time
+import numpy as np
 import torch
 import torch.nn as nn
 from ..compilers.base import Compiler
 from ..models.base import ModelWrapper
-from ..utils.device import GPUMonitor
+from ..utils.device import CacheFlusher, GPUMonitor, PeakRSSSampler, get_process_rss
+from ..utils.energy import DEFAULT_POWERCAP_ROOT, EnergyMonitor
+from ..utils.telemetry import NullTelemetry
 from .metrics import MetricsCollector, BenchmarkMetrics
 
 class BenchmarkRunner:
     
-    def __init__(self, device: torch.device, warmup_iters: int, measured_iters: int):
+    def __init__(self, device: torch.device, warmup_iters: int, measured_iters: int,
+                 telemetry=None, progress_interval: int = 25, input_pool_size: int = 1,
+                 cache_flush: bool = False, cache_flush_mb: int | None = None,
+                 measure_energy: bool = True, powercap_root: str = DEFAULT_POWERCAP_ROOT):
         self.device = device
         self.warmup_iters = warmup_iters
         self.measured_iters = measured_iters
         self.gpu_monitor = GPUMonitor(device)
+        self.telemetry = telemetry or NullTelemetry()
+        self.progress_interval = max(1, progress_interval)
+        self.input_pool_size = max(1, input_pool_size)
+        self.cache_flush = cache_flush
+        self.cache_flush_mb = cache_flush_mb
+        self.energy_monitor = None
+        if measure_energy and device.type == 'cpu':
+            self.energy_monitor = EnergyMonitor(powercap_root)
+            if not self.energy_monitor.available:
+                print(f"RAPL package counters not readable under {powercap_root}; energy columns will be N/A")
+                self.energy_monitor = None
     
-    def run_benchmark(self, model_wrapper, compiler, batch_size):
+    def run_benchmark(self, model_wrapper, compiler, batch_size, model_config=None):
         print(f"\n{'='*60}")
         print(f"Benchmarking: {model_wrapper.get_name()} | {compiler.get_name()} | batch_size={batch_size}")
         print(f"{'='*60}")
         
+        labels = {
+            'model': model_wrapper.get_name(),
+            'compiler': compiler.get_name(),
+            'batch_size': batch_size,
+        }
+        self.telemetry.emit("config_start", **labels)
+        
         model = model_wrapper.get_model().to(self.device)
-        example_input = model_wrapper.get_example_input(batch_size, self.device)
+        example_input, input_pool = self._make_input_pool(model_wrapper, batch_size)
         
         print("Compiling model...")
-        compile_start_time = time.time()
+        self.telemetry.emit("compile_start", **labels)
+        compiler.reset_compile_phases()
+        self.gpu_monitor.reset_peak_memory()
+        rss_sampler = PeakRSSSampler()
+        rss_sampler.start()
+        compile_start_time = time.perf_counter()
         compiled_model = compiler.compile(model, example_input)
+        self.gpu_monitor.synchronize()
+        compile_time = time.perf_counter() - compile_start_time
+        
+        first_call_time = self._first_call(compiled_model, example_input)
+        
+        compile_peak_rss = rss_sampler.stop()
+        phases = compiler.get_compile_phases()
+        compile_peak_gpu = max([self.gpu_monitor.get_peak_memory()] + [p.peak_gpu_bytes for p in phases])
+        artifact_size = compiler.get_artifact_size(compiled_model)
+        
+        metrics = self._benchmark_compiled(
+            model_wrapper, compiler, batch_size, compiled_model, input_pool, labels, model_config,
+            compile_time=compile_time,
+            first_call_time=first_call_time,
+            compile_peak_rss=compile_peak_rss,
+            compile_peak_gpu=compile_peak_gpu,
+            compile_phases=[phase.to_dict() for phase in phases],
+            artifact_size=artifact_size,
+        )
+        
+        del model, compiled_model, example_input, input_pool
+        if self.device.type == 'cuda':
+            torch.cuda.empty_cache()
+        
+        return metrics
+    
+    def run_precompiled(self, model_wrapper, compiler, batch_size, compiled_model, compile_stats, model_config=None):
+        # compile_stats comes from the process that produced the artifact; load_time_sec becomes a "load" phase.
+        print(f"\n{'='*60}")
+        print(f"Benchmarking: {model_wrapper.get_name()} | {compiler.get_name()} | batch_size={batch_size} (precompiled)")
+        print(f"{'='*60}")
         
+        labels = {
+            'model': model_wrapper.get_name(),
+            'compiler': compiler.get_name(),
+            'batch_size': batch_size,
+        }
+        self.telemetry.emit("config_start", precompiled=True, **labels)
+        
+        example_input, input_pool = self._make_input_pool(model_wrapper, batch_size)
+        self.gpu_monitor.reset_peak_memory()
+        first_call_time = self._first_call(compiled_model, example_input)
+        
+        load_phase = {
+            'name': "load",
+            'duration_sec': round(compile_stats.get('load_time_sec', 0.0), 6),
+            'peak_rss_mb': round(get_process_rss() / (1024 ** 2), 2),
+            'peak_gpu_mb': round(self.gpu_monitor.get_peak_memory() / (1024 ** 2), 2),
+        }
+        return self._benchmark_compiled(
+            model_wrapper, compiler, batch_size, compiled_model, input_pool, labels, model_config,
+            compile_time=compile_stats['compile_time_sec'],
+            first_call_time=first_call_time,
+            compile_peak_rss=compile_stats.get('compile_peak_rss_bytes', 0),
+            compile_peak_gpu=compile_stats.get('compile_peak_gpu_bytes', 0),
+            compile_phases=list(compile_stats.get('compile_phases', [])) + [load_phase],
+            artifact_size=compile_stats.get('artifact_size_bytes'),
+        )
+    
+    def _make_input_pool(self, model_wrapper, batch_size):
+        example_input = model_wrapper.get_example_input(batch_size, self.device)
+        input_pool = [example_input] + [
+            model_wrapper.get_example_input(batch_size, self.device) for _ in range(self.input_pool_size - 1)
+        ]
+        return example_input, input_pool
+    
+    def _first_call(self, compiled_model, example_input):
         with torch.no_grad():
+            first_call_start = time.perf_counter()
             _ = compiled_model(example_input)
             self.gpu_monitor.synchronize()
+            return time.perf_counter() - first_call_start
+    
+    def _benchmark_compiled(self, model_wrapper, compiler, batch_size, compiled_model, input_pool, labels,
+                            model_config, compile_time, first_call_time, compile_peak_rss, compile_peak_gpu,
+                            compile_phases, artifact_size):
+        cold_start_time = compile_time + first_call_time
         
-        compile_time = time.time() - compile_start_time
         print(f"Compilation time: {compile_time:.3f}s")
+        for phase in compile_phases:
+            print(f"  {phase['name']}: {phase['duration_sec']:.3f}s (peak RSS {phase['peak_rss_mb']:.1f} MB)")
+        print(f"First call latency: {first_call_time * 1000:.3f} ms")
+        print(f"Cold start (compile + first call): {cold_start_time:.3f}s")
+        if artifact_size is not None:
+            print(f"Artifact size: {artifact_size / (1024 ** 2):.2f} MB")
+        self.telemetry.emit(
+            "compile_end",
+            compile_time_sec=compile_time,
+            first_call_ms=first_call_time * 1000,
+            phases=compile_phases,
+            **labels,
+        )
         
         self.gpu_monitor.reset_peak_memory()
         
         print(f"Warming up ({self.warmup_iters} iterations)...")
+        self.telemetry.emit("warmup_start", iterations=self.warmup_iters, **labels)
         with torch.no_grad():
-            for _ in range(self.warmup_iters):
-                _ = compiled_model(example_input)
+            for i in range(self.warmup_iters):
+                _ = compiled_model(input_pool[i % len(input_pool)])
                 self.gpu_monitor.synchronize()
         
         self.gpu_monitor.reset_peak_memory()
+        self.telemetry.emit("measure_start", iterations=self.measured_iters, **labels)
         
-        print(f"Measuring ({self.measured_iters} iterations)...")
-        iter_latencies = []
+        pool_note = f", {len(input_pool)} rotating inputs" if len(input_pool) > 1 else ""
+        print(f"Measuring ({self.measured_iters} iterations{pool_note})...")
+        if self.energy_monitor is not None:
+            self.energy_monitor.start()
+        iter_latencies = self._measure(compiled_model, input_pool, labels)
+        peak_mem_bytes = self.gpu_monitor.get_peak_memory()
+        steady_rss = get_process_rss()
+        energy_stats = {}
+        if self.energy_monitor is not None:
+            energy = self.energy_monitor.stop()
+            energy_stats = {
+                'energy_per_inference_j': energy.joules / self.measured_iters,
+                'energy_per_sample_j': energy.joules / (self.measured_iters * batch_size),
+                'avg_package_power_w': energy.avg_power_w,
+            }
         
-        with torch.no_grad():
-            for i in range(self.measured_iters):
-                t0 = time.time()
-                _ = compiled_model(example_input)
-                self.gpu_monitor.synchronize()
-                latency = time.time() - t0
-                iter_latencies.append(latency)
-                
-                if (i + 1) % 25 == 0:
-                    print(f"  Progress: {i+1}/{self.measured_iters}")
+        cold_stats = {}
+        if self.cache_flush:
+            flush_bytes = self.cache_flush_mb * 1024 ** 2 if self.cache_flush_mb else None
+            flusher = CacheFlusher(self.device, size_bytes=flush_bytes)
+            print(f"Measuring cache-cold ({self.measured_iters} iterations, "
+                  f"{flusher.size_bytes / (1024 ** 2):.0f} MB flush between iterations)...")
+            cold_latencies = self._measure(compiled_model, input_pool, dict(labels, cache="cold"), flusher)
+            cold_ms = np.array(cold_latencies) * 1000
+            cold_stats = {
+                'latency_cold_mean': float(np.mean(cold_ms)),
+                'latency_cold_p50': float(np.percentile(cold_ms, 50)),
+                'latency_cold_p95': float(np.percentile(cold_ms, 95)),
+            }
+            del flusher
         
-        peak_mem_bytes = self.gpu_monitor.get_peak_memory()
         calc_stats = MetricsCollector.compute_metrics(
             latencies=iter_latencies,
             memory_readings=[peak_mem_bytes],
             batch_size=batch_size,
-            compile_time=compile_time if compiler.get_name() != "pytorch_eager" and compile_time > 0 else None
+            compile_time=compile_time
         )
         
         metrics = BenchmarkMetrics(
             compiler_name=compiler.get_name(),
             model_name=model_wrapper.get_name(),
             batch_size=batch_size,
+            first_call_ms=first_call_time * 1000,
+            cold_start_sec=cold_start_time,
+            compile_peak_rss_mb=compile_peak_rss / (1024 ** 2),
+            compile_peak_gpu_mb=compile_peak_gpu / (1024 ** 2),
+            artifact_size_mb=artifact_size / (1024 ** 2) if artifact_size is not None else None,
+            steady_rss_mb=steady_rss / (1024 ** 2),
+            compile_phases=compile_phases,
+            input_pool_size=len(input_pool),
+            num_parameters=model_wrapper.get_num_parameters(),
+            flops=model_wrapper.estimate_flops(batch_size),
+            device=self.device.type,
+            compiler_config=compiler.get_config(),
+            model_config=model_config,
+            **cold_stats,
+            **energy_stats,
             **calc_stats
         )
         
@@ -78,9 +225,61 @@ class BenchmarkRunner:
         print(f"  Throughput: {metrics.throughput:.2f} samples/sec")
         print(f"  Peak Memory: {metrics.peak_memory_mb:.2f} MB")
         print(f"  Avg Memory: {metrics.avg_memory_mb:.2f} MB")
+        if metrics.latency_cold_mean is not None:
+            print(f"  Cache-cold Latency (mean/p95): {metrics.latency_cold_mean:.3f} / {metrics.latency_cold_p95:.3f} ms")
+        if metrics.energy_per_inference_j is not None:
+            print(f"  Energy: {metrics.energy_per_inference_j:.4f} J/inference "
+                  f"({metrics.energy_per_sample_j:.4f} J/sample, avg package power {metrics.avg_package_power_w:.1f} W)")
+        self.telemetry.emit(
+            "config_end",
+            latency_mean_ms=metrics.latency_mean,
+            latency_p50_ms=metrics.latency_p50,
+            latency_p95_ms=metrics.latency_p95,
+            throughput=metrics.throughput,
+            peak_memory_mb=metrics.peak_memory_mb,
+            compile_time_sec=metrics.compile_time_sec,
+            **labels,
+        )
         
-        del model, compiled_model, example_input
-        if self.device.type == 'cuda':
-            torch.cuda.empty_cache()
+        return metrics
+    
+    def _measure(self, compiled_model, input_pool, labels, flusher=None):
+        iter_latencies = []
         
-        return metrics
\ No newline at end of file
+        with torch.no_grad():
+            for i in range(self.measured_iters):
+                inputs = input_pool[i % len(input_pool)]
+                if flusher is not None:
+                    flusher.flush()
+                
+                t0 = time.time()
+                _ = compiled_model(inputs)
+                self.gpu_monitor.synchronize()
+                latency = time.time() - t0
+                iter_latencies.append(latency)
+                
+                if (i + 1) % self.progress_interval == 0 or i + 1 == self.measured_iters:
+                    self._emit_progress(labels, i + 1, iter_latencies)
+                    if self.energy_monitor is not None:
+                        self.energy_monitor.sample()
+                
+                if (i + 1) % 25 == 0:
+                    print(f"  Progress: {i+1}/{self.measured_iters}")
+        
+        return iter_latencies
+    
+    def _emit_progress(self, labels, iteration, iter_latencies):
+        window_ms = np.array(iter_latencies[-self.progress_interval:]) * 1000
+        p50, p95, p99 = np.percentile(window_ms, [50, 95, 99])
+        self.telemetry.emit(
+            "progress",
+            iteration=iteration,
+            total=self.measured_iters,
+            latency_p50_ms=float(p50),
+            latency_p95_ms=float(p95),
+            latency_p99_ms=float(p99),
+            memory_bytes=self.gpu_monitor.get_current_memory(),
+            peak_memory_bytes=self.gpu_monitor.get_peak_memory(),
+            rss_bytes=get_process_rss(),
+            **labels,
+        )
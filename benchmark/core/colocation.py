@@ -0,0 +1,269 @@
+import multiprocessing as mp
+import os
+import queue
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import torch
+
+from ..utils.device import GPUMonitor
+from .metrics import MetricsCollector, format_optional
+
+
+@dataclass
+class ColocationResult:
+    strategy: str
+    model_name: str
+    compiler_name: str
+    batch_size: int
+    cores: List[int]
+
+    solo_latency_p95: float
+    colo_latency_p95: float
+    solo_latency_mean: float
+    colo_latency_mean: float
+    solo_throughput: float
+    colo_throughput: float
+
+    slo_ms: Optional[float] = None
+
+    @property
+    def latency_degradation(self):
+        return self.colo_latency_p95 / self.solo_latency_p95
+
+    @property
+    def throughput_degradation_pct(self):
+        return (1 - self.colo_throughput / self.solo_throughput) * 100
+
+    @property
+    def slo_met(self):
+        return self.slo_ms is None or self.colo_latency_p95 <= self.slo_ms
+
+    def to_dict(self):
+        return {
+            'strategy': self.strategy,
+            'model': self.model_name,
+            'compiler': self.compiler_name,
+            'batch_size': self.batch_size,
+            'cores': _format_cores(self.cores),
+            'solo_latency_mean_ms': f"{self.solo_latency_mean:.3f}",
+            'colo_latency_mean_ms': f"{self.colo_latency_mean:.3f}",
+            'solo_latency_p95_ms': f"{self.solo_latency_p95:.3f}",
+            'colo_latency_p95_ms': f"{self.colo_latency_p95:.3f}",
+            'latency_p95_degradation': f"{self.latency_degradation:.3f}",
+            'solo_throughput_samples_per_sec': f"{self.solo_throughput:.2f}",
+            'colo_throughput_samples_per_sec': f"{self.colo_throughput:.2f}",
+            'throughput_degradation_pct': f"{self.throughput_degradation_pct:.1f}",
+            'slo_ms': format_optional(self.slo_ms, ".3f"),
+            'slo_met': self.slo_met,
+        }
+
+
+def _format_cores(cores):
+    if not cores:
+        return ""
+    ranges = []
+    start = prev = cores[0]
+    for core in cores[1:]:
+        if core != prev + 1:
+            ranges.append(f"{start}-{prev}" if start != prev else str(start))
+            start = core
+        prev = core
+    ranges.append(f"{start}-{prev}" if start != prev else str(start))
+    return ",".join(ranges)
+
+
+def partition_cores(num_members: int, strategy: str, cores: List[int]) -> List[List[int]]:
+    if strategy == "shared":
+        return [list(cores) for _ in range(num_members)]
+    if strategy == "disjoint":
+        if len(cores) < num_members:
+            raise ValueError(f"Disjoint partitioning needs at least {num_members} cores, found {len(cores)}")
+        chunk, remainder = divmod(len(cores), num_members)
+        partitions, offset = [], 0
+        for i in range(num_members):
+            size = chunk + (1 if i < remainder else 0)
+            partitions.append(list(cores[offset:offset + size]))
+            offset += size
+        return partitions
+    raise ValueError(f"Unknown core partitioning strategy: {strategy}")
+
+
+def _run_member(member, cores, warmup_iters, duration_sec, barrier_timeout, start_barrier, result_queue, index):
+    try:
+        from ..registry import get_compiler, get_model
+
+        os.sched_setaffinity(0, cores)
+        torch.set_num_threads(len(cores))
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        gpu_monitor = GPUMonitor(device)
+
+        model_wrapper = get_model(member.model, member.input_shape, member.params)
+        compiler = get_compiler(member.compiler)
+        model = model_wrapper.get_model().to(device)
+        example_input = model_wrapper.get_example_input(member.batch_size, device)
+        compiled_model = compiler.compile(model, example_input)
+
+        latencies = []
+        with torch.no_grad():
+            for _ in range(warmup_iters):
+                _ = compiled_model(example_input)
+                gpu_monitor.synchronize()
+            gpu_monitor.reset_peak_memory()
+
+            start_barrier.wait(timeout=barrier_timeout)
+            deadline = time.perf_counter() + duration_sec
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                _ = compiled_model(example_input)
+                gpu_monitor.synchronize()
+                latencies.append(time.perf_counter() - t0)
+
+        stats = MetricsCollector.compute_metrics(
+            latencies=latencies,
+            memory_readings=[gpu_monitor.get_peak_memory()],
+            batch_size=member.batch_size,
+        )
+        result_queue.put((index, {
+            'model_name': model_wrapper.get_name(),
+            'compiler_name': compiler.get_name(),
+            'iterations': len(latencies),
+            'stats': stats,
+        }))
+    except Exception as exc:
+        start_barrier.abort()
+        result_queue.put((index, {'error': f"{type(exc).__name__}: {exc}"}))
+
+
+class ColocationRunner:
+
+    def __init__(self, colocation_config, cores: Optional[List[int]] = None):
+        self.config = colocation_config
+        self.cores = sorted(cores or os.sched_getaffinity(0))
+        self._ctx = mp.get_context("spawn")
+        self._solo_cache = {}
+
+    def run(self):
+        results = []
+        for strategy in self.config.strategies:
+            partitions = partition_cores(len(self.config.mix), strategy, self.cores)
+            print(f"\n{'='*70}")
+            print(f"CO-LOCATION STRATEGY: {strategy}")
+            print(f"{'='*70}")
+
+            solo = [self._run_solo(index, partitions[index]) for index in range(len(self.config.mix))]
+
+            print(f"\nRunning {len(self.config.mix)} workloads concurrently for {self.config.duration_sec:.0f}s...")
+            colo = self._run_group(list(enumerate(self.config.mix)), partitions)
+
+            for index, member in enumerate(self.config.mix):
+                if 'error' in solo[index] or 'error' in colo[index]:
+                    error = solo[index].get('error') or colo[index].get('error')
+                    print(f"  ERROR: {member.model} with {member.compiler}: {error}")
+                    continue
+                results.append(ColocationResult(
+                    strategy=strategy,
+                    model_name=colo[index]['model_name'],
+                    compiler_name=colo[index]['compiler_name'],
+                    batch_size=member.batch_size,
+                    cores=partitions[index],
+                    solo_latency_p95=solo[index]['stats']['latency_p95'],
+                    colo_latency_p95=colo[index]['stats']['latency_p95'],
+                    solo_latency_mean=solo[index]['stats']['latency_mean'],
+                    colo_latency_mean=colo[index]['stats']['latency_mean'],
+                    solo_throughput=solo[index]['stats']['throughput'],
+                    colo_throughput=colo[index]['stats']['throughput'],
+                    slo_ms=member.slo_ms,
+                ))
+        return results
+
+    def _run_solo(self, index, cores):
+        key = (index, tuple(cores))
+        if key not in self._solo_cache:
+            member = self.config.mix[index]
+            print(f"\nSolo run: {member.model} | {member.compiler} | batch_size={member.batch_size} "
+                  f"| cores {_format_cores(cores)}")
+            self._solo_cache[key] = self._run_group([(index, member)], {index: cores})[index]
+        return self._solo_cache[key]
+
+    def _run_group(self, indexed_members, partitions):
+        start_barrier = self._ctx.Barrier(len(indexed_members))
+        result_queue = self._ctx.Queue()
+        processes = {}
+
+        for index, member in indexed_members:
+            cores = partitions[index]
+            previous_omp = os.environ.get("OMP_NUM_THREADS")
+            os.environ["OMP_NUM_THREADS"] = str(len(cores))
+            process = self._ctx.Process(
+                target=_run_member,
+                args=(member, cores, self.config.warmup_iterations, self.config.duration_sec,
+                      self.config.barrier_timeout_sec, start_barrier, result_queue, index),
+            )
+            process.start()
+            if previous_omp is None:
+                del os.environ["OMP_NUM_THREADS"]
+            else:
+                os.environ["OMP_NUM_THREADS"] = previous_omp
+            processes[index] = process
+
+        results = {}
+        while len(results) < len(processes):
+            try:
+                index, payload = result_queue.get(timeout=5)
+                results[index] = payload
+                continue
+            except queue.Empty:
+                pass
+            dead = [index for index, process in processes.items()
+                    if index not in results and not process.is_alive()]
+            if dead:
+                # A member killed hard (segfault, OOM) never reaches the barrier; stop the rest of the group.
+                _drain_results(result_queue, results)
+                self._abort_group(start_barrier, processes, results)
+
+        for process in processes.values():
+            process.join()
+        return results
+
+    def _abort_group(self, start_barrier, processes, results):
+        dead = {index: process.exitcode for index, process in processes.items()
+                if index not in results and not process.is_alive()}
+        if not dead:
+            return
+        start_barrier.abort()
+        reason = ", ".join(f"member {index} exited with code {code}" for index, code in sorted(dead.items()))
+        for index, process in processes.items():
+            if index in results:
+                continue
+            if process.is_alive():
+                process.terminate()
+                results[index] = {'error': f"stopped because {reason}"}
+            else:
+                results[index] = {'error': f"worker process exited with code {process.exitcode} without reporting"}
+
+
+def _drain_results(result_queue, results):
+    # Results posted just before a process exited may still be in flight.
+    while True:
+        try:
+            index, payload = result_queue.get(timeout=1)
+        except queue.Empty:
+            return
+        results[index] = payload
+
+
+def find_best_packing(results: List[ColocationResult], num_members: int):
+    by_strategy = {}
+    for result in results:
+        by_strategy.setdefault(result.strategy, []).append(result)
+
+    feasible = [
+        (sum(r.colo_throughput for r in members), strategy)
+        for strategy, members in by_strategy.items()
+        if len(members) == num_members and all(r.slo_met for r in members)
+    ]
+    if not feasible:
+        return None
+    return max(feasible)[1]
@@ -1,11 +1,17 @@
+import itertools
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional, Union
 import yaml
 
 @dataclass
 class BenchmarkConfig:
     warmup_iterations: int
     measured_iterations: int
+    input_pool_size: int = 1
+    cache_flush: bool = False
+    cache_flush_mb: Optional[int] = None
+    measure_energy: bool = True
+    powercap_root: str = "/sys/class/powercap"
 
 @dataclass
 class ModelConfig:
@@ -13,18 +19,142 @@ class ModelConfig:
     input_shape: List[int]
     batch_sizes: List[int]
     precision: str
+    params: dict = field(default_factory=dict)
+    
+    def to_spec(self):
+        return {'name': self.name, 'input_shape': list(self.input_shape), 'params': dict(self.params)}
+    
+    @classmethod
+    def expand(cls, entry):
+        entry = dict(entry)
+        sweep = entry.pop('sweep', None) or {}
+        base_params = entry.pop('params', None) or {}
+        if not sweep:
+            return [cls(params=base_params, **entry)]
+        
+        keys = list(sweep.keys())
+        configs = []
+        for values in itertools.product(*(sweep[key] for key in keys)):
+            params = dict(base_params)
+            params.update(zip(keys, values))
+            configs.append(cls(params=params, **entry))
+        return configs
 
 @dataclass
 class OutputConfig:
     format: str
     save_path: str
 
+@dataclass
+class TelemetryConfig:
+    enabled: bool = False
+    jsonl_path: Optional[str] = "results/telemetry.jsonl"
+    prometheus_port: Optional[int] = None
+    queue_size: int = 10000
+    progress_interval: int = 25
+
+@dataclass
+class ColocationMemberConfig:
+    model: str
+    input_shape: List[int]
+    compiler: Union[str, dict]
+    batch_size: int = 1
+    slo_ms: Optional[float] = None
+    params: dict = field(default_factory=dict)
+
+@dataclass
+class ColocationConfig:
+    mix: List[ColocationMemberConfig]
+    strategies: List[str] = field(default_factory=lambda: ["shared", "disjoint"])
+    warmup_iterations: int = 10
+    duration_sec: float = 30.0
+    barrier_timeout_sec: float = 900.0
+    save_path: str = "results/colocation_results.csv"
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['mix'] = [ColocationMemberConfig(**entry) for entry in data['mix']]
+        return cls(**data)
+
+@dataclass
+class SoakConfig:
+    model: str
+    input_shape: List[int]
+    compiler: Union[str, dict]
+    batch_size: int = 1
+    params: dict = field(default_factory=dict)
+    duration_sec: float = 3600.0
+    window_sec: float = 60.0
+    warmup_iterations: int = 10
+    latency_drift_threshold_pct_per_hour: float = 5.0
+    rss_growth_threshold_mb_per_hour: float = 50.0
+    save_path: str = "results/soak_windows.csv"
+
+@dataclass
+class PipelineConfig:
+    compile_workers: int = 2
+    measure_cores: Optional[List[int]] = None
+    lookahead: Optional[int] = None
+    artifact_dir: str = "results/pipeline_artifacts"
+    keep_artifacts: bool = False
+    save_path: str = "results/pipelined_results.csv"
+
+@dataclass
+class E2EConfig:
+    models: List[str] = field(default_factory=lambda: ["resnet50"])
+    compilers: List[Union[str, dict]] = field(default_factory=lambda: ["pytorch_eager"])
+    batch_sizes: List[int] = field(default_factory=lambda: [32])
+    image_dir: Optional[str] = None
+    generated_images: int = 256
+    generated_image_size: List[int] = field(default_factory=lambda: [480, 640])
+    resize_size: int = 256
+    crop_size: int = 224
+    num_workers: int = 4
+    pin_memory: bool = True
+    prefetch_factor: int = 2
+    fuse_normalize: bool = True
+    warmup_batches: int = 5
+    measured_batches: int = 50
+    save_path: str = "results/e2e_results.csv"
+
+@dataclass
+class ReplicasConfig:
+    model: str
+    input_shape: List[int]
+    compilers: List[Union[str, dict]]
+    batch_size: int = 1
+    params: dict = field(default_factory=dict)
+    replicas: int = 4
+    warmup_iterations: int = 10
+    measured_iterations: int = 100
+    save_path: str = "results/replica_results.csv"
+
 @dataclass
 class Config:
     benchmark: BenchmarkConfig
     models: List[ModelConfig]
-    compilers: List[str]
+    compilers: List[Union[str, dict]]
     output: OutputConfig
+    telemetry: TelemetryConfig = field(default_factory=TelemetryConfig)
+    colocation: Optional[ColocationConfig] = None
+    soak: Optional[SoakConfig] = None
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
+    e2e: Optional[E2EConfig] = None
+    replicas: Optional[ReplicasConfig] = None
+    
+    def expand_jobs(self):
+        jobs = []
+        for model_cfg in self.models:
+            for compiler_spec in self.compilers:
+                for batch_size in model_cfg.batch_sizes:
+                    jobs.append({
+                        'job_id': len(jobs),
+                        'model': model_cfg.to_spec(),
+                        'compiler': compiler_spec,
+                        'batch_size': batch_size,
+                    })
+        return jobs
     
     @classmethod
     def from_yaml(cls, path: str):
@@ -38,11 +168,17 @@ class Config:
         else:
             raise ValueError("Config must specify 'model' or 'models'")
         
-        model_configs = [ModelConfig(**entry) for entry in model_entries]
+        model_configs = [config for entry in model_entries for config in ModelConfig.expand(entry)]
         
         return cls(
             benchmark=BenchmarkConfig(**data['benchmark']),
             models=model_configs,
             compilers=data['compilers'],
-            output=OutputConfig(**data['output'])
+            output=OutputConfig(**data['output']),
+            telemetry=TelemetryConfig(**data.get('telemetry', {})),
+            colocation=ColocationConfig.from_dict(data['colocation']) if data.get('colocation') else None,
+            soak=SoakConfig(**data['soak']) if data.get('soak') else None,
+            pipeline=PipelineConfig(**(data.get('pipeline') or {})),
+            e2e=E2EConfig(**data['e2e']) if data.get('e2e') else None,
+            replicas=ReplicasConfig(**data['replicas']) if data.get('replicas') else None
         )
\ No newline at end of file
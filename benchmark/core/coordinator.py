@@ -0,0 +1,237 @@
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class JobQueue:
+
+    def __init__(self, jobs, lease_timeout_sec: float = 120.0, max_attempts: int = 3):
+        self.lease_timeout_sec = lease_timeout_sec
+        self.max_attempts = max_attempts
+        self._pending = deque(jobs)
+        self._jobs = {job['job_id']: job for job in jobs}
+        self._leases = {}
+        self._attempts = {job['job_id']: 0 for job in jobs}
+        self._completed = set()
+        self._failed = {}
+        self._lock = threading.Lock()
+
+    def lease(self, worker_id: str, host: str):
+        with self._lock:
+            self._reclaim_expired()
+            while self._pending:
+                job = self._pending.popleft()
+                job_id = job['job_id']
+                if job_id in self._completed or job_id in self._failed:
+                    continue
+                self._attempts[job_id] += 1
+                self._leases[job_id] = {
+                    'worker_id': worker_id,
+                    'host': host,
+                    'deadline': time.monotonic() + self.lease_timeout_sec,
+                }
+                return dict(job, attempt=self._attempts[job_id])
+            return None
+
+    def heartbeat(self, worker_id: str, job_id: int) -> bool:
+        with self._lock:
+            lease = self._leases.get(job_id)
+            if lease is None or lease['worker_id'] != worker_id:
+                return False
+            lease['deadline'] = time.monotonic() + self.lease_timeout_sec
+            return True
+
+    def complete(self, worker_id: str, job_id: int) -> bool:
+        with self._lock:
+            if job_id in self._completed or job_id not in self._jobs:
+                return False
+            lease = self._leases.get(job_id)
+            if lease is not None and lease['worker_id'] == worker_id:
+                del self._leases[job_id]
+            # A late result from a worker whose lease already expired is still
+            # valid; the requeued copy is skipped when it reaches the front.
+            self._completed.add(job_id)
+            self._failed.pop(job_id, None)
+            return True
+
+    def fail(self, worker_id: str, job_id: int, error: str):
+        with self._lock:
+            lease = self._leases.get(job_id)
+            if lease is None or lease['worker_id'] != worker_id:
+                return
+            del self._leases[job_id]
+            self._requeue(job_id, error)
+
+    def _reclaim_expired(self):
+        now = time.monotonic()
+        for job_id, lease in list(self._leases.items()):
+            if lease['deadline'] < now:
+                del self._leases[job_id]
+                print(f"Lease expired: job {job_id} on {lease['host']} ({lease['worker_id']}); requeueing")
+                self._requeue(job_id, f"lease expired on {lease['host']}")
+
+    def _requeue(self, job_id, error):
+        if self._attempts[job_id] >= self.max_attempts:
+            self._failed[job_id] = error
+            print(f"Job {job_id} failed after {self._attempts[job_id]} attempts: {error}")
+        else:
+            self._pending.appendleft(self._jobs[job_id])
+
+    def is_done(self) -> bool:
+        with self._lock:
+            self._reclaim_expired()
+            return len(self._completed) + len(self._failed) == len(self._jobs)
+
+    def status(self):
+        with self._lock:
+            return {
+                'total': len(self._jobs),
+                'pending': sum(1 for job in self._pending
+                               if job['job_id'] not in self._completed and job['job_id'] not in self._failed),
+                'running': {str(job_id): lease['host'] for job_id, lease in self._leases.items()},
+                'completed': len(self._completed),
+                'failed': {str(job_id): error for job_id, error in self._failed.items()},
+            }
+
+
+class ResultStore:
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self._fieldnames = None
+        self._lock = threading.Lock()
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+    def add(self, row: dict):
+        with self._lock:
+            write_header = self._fieldnames is None
+            if write_header:
+                self._fieldnames = list(row.keys())
+            with open(self.output_path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self._fieldnames, extrasaction='ignore', restval="N/A")
+                if write_header:
+                    writer.writeheader()
+                writer.writerow(row)
+
+
+class CoordinatorServer:
+
+    def __init__(self, jobs, output_path: str, benchmark_settings: dict, host: str = "0.0.0.0", port: int = 8765,
+                 lease_timeout_sec: float = 120.0, max_attempts: int = 3, shutdown_grace_sec: float = 30.0):
+        self.benchmark_settings = benchmark_settings
+        self.shutdown_grace_sec = shutdown_grace_sec
+        self._workers_seen = set()
+        self._workers_released = set()
+        self._workers_lock = threading.Lock()
+        self.queue = JobQueue(jobs, lease_timeout_sec=lease_timeout_sec, max_attempts=max_attempts)
+        self.store = ResultStore(output_path)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="coordinator-http", daemon=True)
+        self._thread.start()
+
+    def wait(self, poll_sec: float = 2.0, progress_sec: float = 30.0):
+        last_report = 0.0
+        while not self.queue.is_done():
+            if time.monotonic() - last_report >= progress_sec:
+                status = self.queue.status()
+                print(f"Progress: {status['completed']}/{status['total']} done, {status['pending']} pending, "
+                      f"{len(status['running'])} running, {len(status['failed'])} failed")
+                last_report = time.monotonic()
+            time.sleep(poll_sec)
+
+        # Stay up so workers sleeping between polls are told the sweep is done instead of finding the port closed.
+        deadline = time.monotonic() + self.shutdown_grace_sec
+        while time.monotonic() < deadline:
+            with self._workers_lock:
+                if self._workers_seen <= self._workers_released:
+                    return
+            time.sleep(min(poll_sec, 0.2))
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, path, payload):
+        if path == "/lease":
+            job = self.queue.lease(payload['worker_id'], payload['host'])
+            if job is not None:
+                print(f"Leased job {job['job_id']} (attempt {job['attempt']}) to {payload['host']} "
+                      f"({payload['worker_id']})")
+            done = job is None and self.queue.is_done()
+            with self._workers_lock:
+                self._workers_seen.add(payload['worker_id'])
+                if done:
+                    self._workers_released.add(payload['worker_id'])
+            return {
+                'job': job,
+                'benchmark': self.benchmark_settings,
+                'done': done,
+            }
+        if path == "/heartbeat":
+            return {'ok': self.queue.heartbeat(payload['worker_id'], payload['job_id'])}
+        if path == "/complete":
+            accepted = self.queue.complete(payload['worker_id'], payload['job_id'])
+            if accepted:
+                row = dict(payload['result'], host=payload['host'], worker_id=payload['worker_id'],
+                           job_id=payload['job_id'])
+                self.store.add(row)
+            return {'ok': accepted, 'done': self.queue.is_done()}
+        if path == "/fail":
+            print(f"Job {payload['job_id']} failed on {payload['host']}: {payload['error']}")
+            self.queue.fail(payload['worker_id'], payload['job_id'], payload['error'])
+            return {'ok': True, 'done': self.queue.is_done()}
+        return None
+
+    def _make_handler(self):
+        coordinator = self
+
+        class _CoordinatorHandler(BaseHTTPRequestHandler):
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == "/status":
+                    self._reply(200, coordinator.queue.status())
+                else:
+                    self._reply(404, {'error': "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                    body = coordinator._handle(self.path, payload)
+                except (KeyError, ValueError) as exc:
+                    self._reply(400, {'error': str(exc)})
+                    return
+                if body is None:
+                    self._reply(404, {'error': "not found"})
+                else:
+                    self._reply(200, body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _CoordinatorHandler
@@ -0,0 +1,306 @@
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, Dataset
+
+from ..models.base import ModelWrapper
+from ..utils.device import GPUMonitor
+from ..utils.telemetry import NullTelemetry
+from .metrics import format_optional
+
+VISION_MODELS = ("resnet50", "mobilenet_v3", "vgg16")
+IMAGENET_MEAN = (0.485, 0.456, 0.406)
+IMAGENET_STD = (0.229, 0.224, 0.225)
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def generate_images(output_dir: str, count: int, height: int = 480, width: int = 640, seed: int = 0):
+    # Smooth noise, so the JPEGs compress (and decode) like photos.
+    from torchvision.io import write_jpeg
+
+    os.makedirs(output_dir, exist_ok=True)
+    existing = sorted(name for name in os.listdir(output_dir) if name.endswith(".jpg"))
+    if len(existing) >= count:
+        return output_dir
+
+    generator = torch.Generator().manual_seed(seed)
+    for i in range(count):
+        coarse = torch.rand(1, 3, height // 16, width // 16, generator=generator)
+        image = nn.functional.interpolate(coarse, size=(height, width), mode="bilinear", align_corners=False)
+        image = image + 0.05 * torch.randn(1, 3, height, width, generator=generator)
+        image = (image.clamp(0, 1)[0] * 255).to(torch.uint8)
+        write_jpeg(image, os.path.join(output_dir, f"image_{i:05d}.jpg"), quality=90)
+    return output_dir
+
+
+class ImageFolderDataset(Dataset):
+
+    def __init__(self, image_dir: str, resize_size: int = 256, crop_size: int = 224, normalize: bool = True):
+        self.paths = sorted(
+            os.path.join(image_dir, name) for name in os.listdir(image_dir)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.paths:
+            raise ValueError(f"No images found in {image_dir}")
+        self.resize_size = resize_size
+        self.crop_size = crop_size
+        self.normalize = normalize
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        from torchvision.io import ImageReadMode, decode_image, read_file
+        from torchvision.transforms import functional as F
+
+        image = decode_image(read_file(self.paths[index]), mode=ImageReadMode.RGB)
+        image = F.resize(image, [self.resize_size], antialias=True)
+        image = F.center_crop(image, [self.crop_size, self.crop_size])
+        if not self.normalize:
+            return image
+        return F.normalize(image.float().div_(255), IMAGENET_MEAN, IMAGENET_STD)
+
+
+class NormalizedModel(nn.Module):
+
+    def __init__(self, model: nn.Module):
+        super().__init__()
+        self.model = model
+        self.register_buffer("mean", torch.tensor(IMAGENET_MEAN).view(1, 3, 1, 1) * 255)
+        self.register_buffer("std", torch.tensor(IMAGENET_STD).view(1, 3, 1, 1) * 255)
+
+    def forward(self, images):
+        return self.model((images.float() - self.mean) / self.std)
+
+
+class FusedNormalizationWrapper(ModelWrapper):
+
+    def __init__(self, model_wrapper: ModelWrapper, crop_size: int = 224):
+        self.base = model_wrapper
+        self.crop_size = crop_size
+        self.model = NormalizedModel(model_wrapper.get_model()).eval()
+
+    def get_model(self) -> nn.Module:
+        return self.model
+
+    def get_example_input(self, batch_size, device):
+        return torch.randint(0, 256, (batch_size, 3, self.crop_size, self.crop_size), dtype=torch.uint8, device=device)
+
+    def get_name(self) -> str:
+        return self.base.get_name()
+
+    def get_num_parameters(self) -> int:
+        return self.base.get_num_parameters()
+
+
+@dataclass
+class E2EResult:
+    model_name: str
+    compiler_name: str
+    batch_size: int
+    num_workers: int
+    pin_memory: bool
+    prefetch_factor: int
+    fuse_normalize: bool
+
+    model_only_throughput: float
+    loader_only_throughput: float
+    e2e_throughput: float
+    e2e_interval_p95: float
+    bottleneck: str
+
+    @property
+    def overlap_efficiency(self):
+        # 1.0 means loading is fully hidden behind inference (or vice versa).
+        return self.e2e_throughput / min(self.model_only_throughput, self.loader_only_throughput)
+
+    def to_dict(self):
+        return {
+            'model': self.model_name,
+            'compiler': self.compiler_name,
+            'batch_size': self.batch_size,
+            'num_workers': self.num_workers,
+            'pin_memory': self.pin_memory,
+            'prefetch_factor': self.prefetch_factor,
+            'fuse_normalize': self.fuse_normalize,
+            'model_only_images_per_sec': f"{self.model_only_throughput:.2f}",
+            'loader_only_images_per_sec': f"{self.loader_only_throughput:.2f}",
+            'e2e_images_per_sec': f"{self.e2e_throughput:.2f}",
+            'e2e_batch_interval_p95_ms': format_optional(self.e2e_interval_p95, ".3f"),
+            'overlap_efficiency': f"{self.overlap_efficiency:.3f}",
+            'bottleneck': self.bottleneck,
+        }
+
+
+class _DevicePrefetcher:
+    # Copies the next batch on a side stream so the H2D transfer overlaps inference on the current one.
+
+    def __init__(self, batches, device):
+        self.batches = batches
+        self.device = device
+        self.stream = torch.cuda.Stream(device) if device.type == 'cuda' else None
+
+    def __iter__(self):
+        pending = None
+        for batch in self.batches:
+            copied = self._copy(batch)
+            if pending is not None:
+                yield self._ready(*pending)
+            pending = copied
+        if pending is not None:
+            yield self._ready(*pending)
+
+    def _copy(self, batch):
+        if self.stream is None:
+            return batch.to(self.device), None
+        with torch.cuda.stream(self.stream):
+            batch = batch.to(self.device, non_blocking=True)
+            copied = torch.cuda.Event()
+            copied.record(self.stream)
+        return batch, copied
+
+    def _ready(self, batch, copied):
+        if copied is not None:
+            # Wait on this batch's copy only; waiting on the whole side stream would also wait for the next copy.
+            current = torch.cuda.current_stream(self.device)
+            current.wait_event(copied)
+            batch.record_stream(current)
+        return batch
+
+
+def _cycle(loader, num_batches):
+    produced = 0
+    while produced < num_batches:
+        for batch in loader:
+            yield batch
+            produced += 1
+            if produced == num_batches:
+                return
+
+
+class E2ERunner:
+
+    def __init__(self, device: torch.device, e2e_config, telemetry=None):
+        self.device = device
+        self.config = e2e_config
+        self.gpu_monitor = GPUMonitor(device)
+        self.telemetry = telemetry or NullTelemetry()
+
+    def build_loader(self, image_dir, batch_size):
+        cfg = self.config
+        dataset = ImageFolderDataset(image_dir, cfg.resize_size, cfg.crop_size, normalize=not cfg.fuse_normalize)
+        kwargs = {}
+        if cfg.num_workers > 0:
+            kwargs = {'prefetch_factor': cfg.prefetch_factor, 'persistent_workers': True}
+        return DataLoader(
+            dataset,
+            batch_size=batch_size,
+            shuffle=False,
+            drop_last=len(dataset) >= batch_size,
+            num_workers=cfg.num_workers,
+            pin_memory=cfg.pin_memory and self.device.type == 'cuda',
+            **kwargs,
+        )
+
+    def run(self, model_wrapper, compiler, batch_size, image_dir) -> E2EResult:
+        cfg = self.config
+        if cfg.fuse_normalize:
+            model_wrapper = FusedNormalizationWrapper(model_wrapper, cfg.crop_size)
+        labels = {
+            'model': model_wrapper.get_name(),
+            'compiler': compiler.get_name(),
+            'batch_size': batch_size,
+        }
+        print(f"\n{'='*60}")
+        print(f"End-to-end: {labels['model']} | {labels['compiler']} | batch_size={batch_size} | "
+              f"workers={cfg.num_workers} | fused normalize={cfg.fuse_normalize}")
+        print(f"{'='*60}")
+
+        model = model_wrapper.get_model().to(self.device)
+        example_input = model_wrapper.get_example_input(batch_size, self.device)
+        print("Compiling model...")
+        compiled_model = compiler.compile(model, example_input)
+
+        print(f"Model only ({cfg.measured_batches} batches)...")
+        model_only = self._model_only(compiled_model, example_input)
+
+        loader = self.build_loader(image_dir, batch_size)
+        print(f"Loader only ({cfg.measured_batches} batches)...")
+        loader_only = self._loader_only(loader)
+
+        print(f"End-to-end ({cfg.measured_batches} batches)...")
+        e2e_throughput, e2e_p95 = self._end_to_end(compiled_model, loader)
+
+        bottleneck = "input_pipeline" if loader_only < model_only else "model"
+        result = E2EResult(
+            model_name=labels['model'],
+            compiler_name=labels['compiler'],
+            batch_size=batch_size,
+            num_workers=cfg.num_workers,
+            pin_memory=cfg.pin_memory,
+            prefetch_factor=cfg.prefetch_factor,
+            fuse_normalize=cfg.fuse_normalize,
+            model_only_throughput=model_only,
+            loader_only_throughput=loader_only,
+            e2e_throughput=e2e_throughput,
+            e2e_interval_p95=e2e_p95,
+            bottleneck=bottleneck,
+        )
+        print(f"  Model only:  {model_only:.2f} images/sec")
+        print(f"  Loader only: {loader_only:.2f} images/sec")
+        print(f"  End-to-end:  {e2e_throughput:.2f} images/sec "
+              f"(overlap efficiency {result.overlap_efficiency:.2f}, bottleneck: {bottleneck})")
+        self.telemetry.emit("e2e_end", **result.to_dict())
+
+        del model, compiled_model, example_input, loader
+        if self.device.type == 'cuda':
+            torch.cuda.empty_cache()
+        return result
+
+    def _model_only(self, compiled_model, example_input):
+        with torch.no_grad():
+            for _ in range(self.config.warmup_batches):
+                _ = compiled_model(example_input)
+                self.gpu_monitor.synchronize()
+            start = time.perf_counter()
+            for _ in range(self.config.measured_batches):
+                _ = compiled_model(example_input)
+                self.gpu_monitor.synchronize()
+            elapsed = time.perf_counter() - start
+        return self.config.measured_batches * example_input.shape[0] / elapsed
+
+    def _loader_only(self, loader):
+        batches = _DevicePrefetcher(_cycle(loader, self.config.warmup_batches), self.device)
+        for _ in batches:
+            pass
+        images = 0
+        start = time.perf_counter()
+        for batch in _DevicePrefetcher(_cycle(loader, self.config.measured_batches), self.device):
+            images += batch.shape[0]
+        self.gpu_monitor.synchronize()
+        return images / (time.perf_counter() - start)
+
+    def _end_to_end(self, compiled_model, loader):
+        batch_latencies = []
+        images = 0
+        with torch.no_grad():
+            for batch in _DevicePrefetcher(_cycle(loader, self.config.warmup_batches), self.device):
+                _ = compiled_model(batch)
+                self.gpu_monitor.synchronize()
+
+            start = time.perf_counter()
+            last = start
+            for batch in _DevicePrefetcher(_cycle(loader, self.config.measured_batches), self.device):
+                _ = compiled_model(batch)
+                self.gpu_monitor.synchronize()
+                now = time.perf_counter()
+                batch_latencies.append(now - last)
+                last = now
+                images += batch.shape[0]
+            elapsed = time.perf_counter() - start
+        p95 = float(np.percentile(np.array(batch_latencies) * 1000, 95)) if batch_latencies else None
+        return images / elapsed, p95
@@ -0,0 +1,93 @@
+import math
+
+
+class LogHistogram:
+    # Log-bucketed like HdrHistogram: fixed memory; values above `highest` clamp into the last bucket.
+
+    def __init__(self, lowest: int = 1, highest: int = 3_600_000_000, significant_digits: int = 2):
+        if lowest < 1 or highest < 2 * lowest:
+            raise ValueError("LogHistogram needs 1 <= lowest and highest >= 2 * lowest")
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+
+        self.lowest = lowest
+        self.highest = highest
+        self.significant_digits = significant_digits
+
+        self.unit_magnitude = int(math.floor(math.log2(lowest)))
+        sub_bucket_count_magnitude = int(math.ceil(math.log2(2 * 10 ** significant_digits)))
+        self.sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self.sub_bucket_count = 1 << (self.sub_bucket_half_count_magnitude + 1)
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = (self.sub_bucket_count - 1) << self.unit_magnitude
+
+        smallest_untrackable = self.sub_bucket_count << self.unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.bucket_count = bucket_count
+
+        self.counts = [0] * ((bucket_count + 1) * self.sub_bucket_half_count)
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value = None
+        self.max_value = None
+
+    def record(self, value: int, count: int = 1):
+        value = min(max(int(value), 0), self.highest)
+        self.counts[self._index(value)] += count
+        self.total_count += count
+        self.total_sum += value * count
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+        self.max_value = value if self.max_value is None else max(self.max_value, value)
+
+    def merge(self, other: "LogHistogram"):
+        if len(other.counts) != len(self.counts) or other.unit_magnitude != self.unit_magnitude:
+            raise ValueError("Cannot merge histograms with different layouts")
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.total_count += other.total_count
+        self.total_sum += other.total_sum
+        for value in (other.min_value, other.max_value):
+            if value is not None:
+                self.min_value = value if self.min_value is None else min(self.min_value, value)
+                self.max_value = value if self.max_value is None else max(self.max_value, value)
+
+    def mean(self):
+        return self.total_sum / self.total_count if self.total_count else None
+
+    def percentile(self, percentile: float):
+        if not self.total_count:
+            return None
+        target = max(1, int(math.ceil(percentile / 100.0 * self.total_count)))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._highest_equivalent(index), self.max_value)
+        return self.max_value
+
+    def _index(self, value: int) -> int:
+        pow2_ceiling = (value | self.sub_bucket_mask).bit_length()
+        bucket = pow2_ceiling - self.unit_magnitude - (self.sub_bucket_half_count_magnitude + 1)
+        sub_bucket = value >> (bucket + self.unit_magnitude)
+        return ((bucket + 1) << self.sub_bucket_half_count_magnitude) + (sub_bucket - self.sub_bucket_half_count)
+
+    def _lowest_equivalent(self, index: int) -> int:
+        bucket = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self.sub_bucket_half_count
+            bucket = 0
+        return sub_bucket << (bucket + self.unit_magnitude)
+
+    def _highest_equivalent(self, index: int) -> int:
+        bucket = max((index >> self.sub_bucket_half_count_magnitude) - 1, 0)
+        return self._lowest_equivalent(index) + (1 << (bucket + self.unit_magnitude)) - 1
@@ -1,8 +1,14 @@
+import json
 import torch
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
+
+def format_optional(value, spec):
+    return format(value, spec) if value is not None else "N/A"
+
+
 @dataclass
 class BenchmarkMetrics:
     compiler_name: str
@@ -20,12 +26,32 @@ class BenchmarkMetrics:
     avg_memory_mb: float
     
     compile_time_sec: float = None
+    first_call_ms: float = None
+    cold_start_sec: float = None
+    compile_peak_rss_mb: float = None
+    compile_peak_gpu_mb: float = None
+    artifact_size_mb: float = None
+    steady_rss_mb: float = None
+    compile_phases: List[dict] = field(default_factory=list)
+    input_pool_size: int = 1
+    latency_cold_mean: float = None
+    latency_cold_p50: float = None
+    latency_cold_p95: float = None
+    energy_per_inference_j: float = None
+    energy_per_sample_j: float = None
+    avg_package_power_w: float = None
+    num_parameters: int = None
+    flops: int = None
+    device: str = None
+    compiler_config: dict = None
+    model_config: dict = None
     
     def to_dict(self):
         return {
             'compiler': self.compiler_name,
             'model': self.model_name,
             'batch_size': self.batch_size,
+            'device': self.device or "N/A",
             'latency_mean_ms': f"{self.latency_mean:.3f}",
             'latency_std_ms': f"{self.latency_std:.3f}",
             'latency_p50_ms': f"{self.latency_p50:.3f}",
@@ -33,7 +59,25 @@ class BenchmarkMetrics:
             'throughput_samples_per_sec': f"{self.throughput:.2f}",
             'peak_memory_mb': f"{self.peak_memory_mb:.2f}",
             'avg_memory_mb': f"{self.avg_memory_mb:.2f}",
-            'compile_time_sec': f"{self.compile_time_sec:.3f}" if self.compile_time_sec else "N/A"
+            'compile_time_sec': format_optional(self.compile_time_sec, ".3f"),
+            'first_call_ms': format_optional(self.first_call_ms, ".3f"),
+            'cold_start_sec': format_optional(self.cold_start_sec, ".3f"),
+            'compile_peak_rss_mb': format_optional(self.compile_peak_rss_mb, ".2f"),
+            'compile_peak_gpu_mb': format_optional(self.compile_peak_gpu_mb, ".2f"),
+            'artifact_size_mb': format_optional(self.artifact_size_mb, ".2f"),
+            'steady_rss_mb': format_optional(self.steady_rss_mb, ".2f"),
+            'compile_phases': json.dumps(self.compile_phases) if self.compile_phases else "N/A",
+            'input_pool_size': self.input_pool_size,
+            'latency_cold_mean_ms': format_optional(self.latency_cold_mean, ".3f"),
+            'latency_cold_p50_ms': format_optional(self.latency_cold_p50, ".3f"),
+            'latency_cold_p95_ms': format_optional(self.latency_cold_p95, ".3f"),
+            'energy_per_inference_j': format_optional(self.energy_per_inference_j, ".6f"),
+            'energy_per_sample_j': format_optional(self.energy_per_sample_j, ".6f"),
+            'avg_package_power_w': format_optional(self.avg_package_power_w, ".2f"),
+            'num_parameters': format_optional(self.num_parameters, "d"),
+            'gflops': format_optional(self.flops / 1e9 if self.flops is not None else None, ".4f"),
+            'compiler_config': json.dumps(self.compiler_config) if self.compiler_config else "N/A",
+            'model_config': json.dumps(self.model_config) if self.model_config else "N/A"
         }
 
 
@@ -63,4 +107,14 @@ class MetricsCollector:
             'peak_memory_mb': peak_memory,
             'avg_memory_mb': avg_memory,
             'compile_time_sec': compile_time
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def linear_slope(xs, ys):
+        if len(xs) < 2:
+            return None
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        if np.all(x == x[0]):
+            return None
+        return float(np.polyfit(x, y, 1)[0])
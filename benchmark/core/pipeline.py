@@ -0,0 +1,207 @@
+import multiprocessing as mp
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import torch
+
+from ..registry import describe_compiler, get_compiler, get_model
+from ..utils import bundle_loader
+from ..utils.device import PeakRSSSampler
+from ..utils.telemetry import NullTelemetry
+
+
+def split_cores(cores, measure_cores=None):
+    cores = sorted(cores)
+    if measure_cores:
+        measure = sorted(set(measure_cores))
+        missing = [core for core in measure if core not in cores]
+        if missing:
+            raise ValueError(f"Measurement cores {missing} are not available to this process")
+    else:
+        measure = cores[:max(1, len(cores) // 2)]
+    compile_cores = [core for core in cores if core not in measure]
+    if not compile_cores:
+        raise ValueError(f"No cores left for compile workers ({len(cores)} available, {len(measure)} reserved)")
+    return measure, compile_cores
+
+
+def _pin_compile_worker(cores):
+    os.sched_setaffinity(0, cores)
+    torch.set_num_threads(len(cores))
+
+
+def _compile_artifact(job, device_type, artifact_dir):
+    device = torch.device(device_type)
+    model_spec = job['model']
+    model_wrapper = get_model(model_spec['name'], model_spec['input_shape'], model_spec.get('params'))
+    compiler = get_compiler(job['compiler'])
+    model = model_wrapper.get_model().to(device)
+    example_input = model_wrapper.get_example_input(job['batch_size'], device)
+
+    os.makedirs(artifact_dir, exist_ok=True)
+    compiler.reset_compile_phases()
+    sampler = PeakRSSSampler()
+    sampler.start()
+    start = time.perf_counter()
+    artifact = compiler.export_artifact(model, example_input, artifact_dir)
+    compile_time = time.perf_counter() - start
+    peak_rss = sampler.stop()
+
+    phases = [phase.to_dict() for phase in compiler.get_compile_phases()]
+    if not phases:
+        phases = [{
+            'name': "export",
+            'duration_sec': round(compile_time, 6),
+            'peak_rss_mb': round(peak_rss / (1024 ** 2), 2),
+            'peak_gpu_mb': 0.0,
+        }]
+    return {
+        'artifact_dir': artifact_dir,
+        'artifact': artifact,
+        'compile_time_sec': compile_time,
+        'compile_peak_rss_bytes': peak_rss,
+        'compile_peak_gpu_bytes': int(max(phase['peak_gpu_mb'] for phase in phases) * 1024 ** 2),
+        'compile_phases': phases,
+        'artifact_size_bytes': os.path.getsize(os.path.join(artifact_dir, artifact['file'])),
+    }
+
+
+def _supports_export(compiler_spec):
+    try:
+        return get_compiler(compiler_spec).supports_export()
+    except RuntimeError:
+        # Missing backend: run the job inline so it fails with the usual per-config error.
+        return False
+
+
+def _job_labels(job):
+    # Match the labels BenchmarkRunner emits on success; fall back to the raw spec if construction is what failed.
+    model_spec = job['model']
+    try:
+        model_name = get_model(model_spec['name'], model_spec['input_shape'], model_spec.get('params')).get_name()
+    except Exception:
+        model_name = model_spec['name']
+    try:
+        compiler_name = get_compiler(job['compiler']).get_name()
+    except Exception:
+        compiler_name = describe_compiler(job['compiler'])
+    return model_name, compiler_name
+
+
+class PipelinedSweep:
+
+    def __init__(self, runner, jobs, pipeline_config, telemetry=None, cores=None):
+        self.runner = runner
+        self.jobs = jobs
+        self.config = pipeline_config
+        self.telemetry = telemetry or NullTelemetry()
+        self.measure_cores, self.compile_cores = split_cores(
+            cores or os.sched_getaffinity(0), pipeline_config.measure_cores
+        )
+        self.lookahead = pipeline_config.lookahead or 2 * pipeline_config.compile_workers
+        self.serial_estimate_sec = 0.0
+        self.stall_sec = 0.0
+        self.wall_time_sec = 0.0
+
+    def run(self):
+        os.sched_setaffinity(0, self.measure_cores)
+        torch.set_num_threads(len(self.measure_cores))
+
+        if self.runner.device.type == 'cuda':
+            print("Note: compile workers create their own CUDA contexts on the measured GPU; "
+                  "their memory and any device work during compilation overlap with measurement.")
+        exportable = {job['job_id']: _supports_export(job['compiler']) for job in self.jobs}
+        executor = ProcessPoolExecutor(
+            max_workers=self.config.compile_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_pin_compile_worker,
+            initargs=(self.compile_cores,),
+        )
+        futures = {}
+        results = []
+        sweep_start = time.perf_counter()
+        try:
+            for index, job in enumerate(self.jobs):
+                for upcoming in self.jobs[index:index + self.lookahead + 1]:
+                    if exportable[upcoming['job_id']] and upcoming['job_id'] not in futures:
+                        futures[upcoming['job_id']] = executor.submit(
+                            _compile_artifact, upcoming, self.runner.device.type, self._artifact_dir(upcoming)
+                        )
+                self._report_queue(index, futures)
+
+                try:
+                    if exportable[job['job_id']]:
+                        metrics = self._measure_artifact(job, futures.pop(job['job_id']))
+                    else:
+                        metrics = self._measure_inline(job)
+                    results.append(metrics)
+                except Exception as e:
+                    print(f"\nERROR: Benchmarking {job['model']['name']} with {job['compiler']} "
+                          f"(batch={job['batch_size']}): {e}")
+                    model_name, compiler_name = _job_labels(job)
+                    self.telemetry.emit(
+                        "config_error",
+                        model=model_name,
+                        compiler=compiler_name,
+                        batch_size=job['batch_size'],
+                        error=str(e),
+                    )
+                    print("Continuing with next configuration...\n")
+                finally:
+                    if exportable[job['job_id']] and not self.config.keep_artifacts:
+                        shutil.rmtree(self._artifact_dir(job), ignore_errors=True)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            self.wall_time_sec = time.perf_counter() - sweep_start
+        return results
+
+    def _artifact_dir(self, job):
+        return os.path.join(self.config.artifact_dir, f"job_{job['job_id']:04d}")
+
+    def _measure_artifact(self, job, future):
+        wait_start = time.perf_counter()
+        if not future.done():
+            print(f"\nWaiting for compile worker to finish job {job['job_id']}...")
+        compile_stats = future.result()
+        self.stall_sec += time.perf_counter() - wait_start
+
+        model_spec = job['model']
+        model_wrapper = get_model(model_spec['name'], model_spec['input_shape'], model_spec.get('params'))
+        compiler = get_compiler(job['compiler'])
+
+        start = time.perf_counter()
+        metadata = {'device': self.runner.device.type, 'artifact': compile_stats['artifact']}
+        compiled_model = bundle_loader.load_artifact(compile_stats['artifact_dir'], metadata, self.runner.device)
+        compile_stats['load_time_sec'] = time.perf_counter() - start
+        metrics = self.runner.run_precompiled(
+            model_wrapper, compiler, job['batch_size'], compiled_model, compile_stats, model_config=model_spec
+        )
+        self.serial_estimate_sec += compile_stats['compile_time_sec'] + time.perf_counter() - start
+        return metrics
+
+    def _measure_inline(self, job):
+        model_spec = job['model']
+        start = time.perf_counter()
+        model_wrapper = get_model(model_spec['name'], model_spec['input_shape'], model_spec.get('params'))
+        compiler = get_compiler(job['compiler'])
+        try:
+            return self.runner.run_benchmark(model_wrapper, compiler, job['batch_size'], model_config=model_spec)
+        finally:
+            self.serial_estimate_sec += time.perf_counter() - start
+
+    def _report_queue(self, index, futures):
+        ready = sum(1 for future in futures.values() if future.done())
+        compiling = sum(1 for future in futures.values() if future.running())
+        waiting = len(futures) - ready - compiling
+        print(f"\n[pipeline] job {index + 1}/{len(self.jobs)} | artifacts ready: {ready} | "
+              f"compiling: {compiling} | queued: {waiting}")
+        self.telemetry.emit(
+            "pipeline_queue",
+            index=index,
+            total=len(self.jobs),
+            ready=ready,
+            compiling=compiling,
+            queued=waiting,
+        )
@@ -0,0 +1,187 @@
+import gc
+import multiprocessing as mp
+import queue
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import torch
+
+from ..utils.device import GPUMonitor, get_process_rss
+from .metrics import MetricsCollector, format_optional
+
+REPLICA_MODES = ("unshared", "shared")
+
+
+@dataclass
+class ReplicaResult:
+    model_name: str
+    compiler_name: str
+    batch_size: int
+    mode: str
+    replicas: int
+
+    base_rss_mb: float
+    first_replica_mb: float
+    marginal_mb_per_replica: float
+    total_replicas_mb: float
+    gpu_memory_mb: float
+    marginal_gpu_mb_per_replica: float
+    rss_curve_mb: List[float]
+
+    latency_mean: float
+    latency_p95: float
+
+    memory_saving_pct: Optional[float] = None
+    latency_overhead_pct: Optional[float] = None
+
+    def to_dict(self):
+        return {
+            'model': self.model_name,
+            'compiler': self.compiler_name,
+            'batch_size': self.batch_size,
+            'mode': self.mode,
+            'replicas': self.replicas,
+            'base_rss_mb': f"{self.base_rss_mb:.2f}",
+            'first_replica_mb': f"{self.first_replica_mb:.2f}",
+            'marginal_mb_per_replica': f"{self.marginal_mb_per_replica:.2f}",
+            'total_replicas_mb': f"{self.total_replicas_mb:.2f}",
+            'gpu_memory_mb': f"{self.gpu_memory_mb:.2f}",
+            'marginal_gpu_mb_per_replica': f"{self.marginal_gpu_mb_per_replica:.2f}",
+            'rss_curve_mb': " ".join(f"{value:.1f}" for value in self.rss_curve_mb),
+            'latency_mean_ms': f"{self.latency_mean:.3f}",
+            'latency_p95_ms': f"{self.latency_p95:.3f}",
+            'memory_saving_pct': format_optional(self.memory_saving_pct, ".1f"),
+            'latency_overhead_pct': format_optional(self.latency_overhead_pct, ".1f"),
+        }
+
+
+def _build_replicas(spec, mode, count, warmup_iters, measured_iters, result_queue):
+    try:
+        from ..registry import get_compiler, get_model
+
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        gpu_monitor = GPUMonitor(device)
+        model_wrapper = get_model(spec['model'], spec['input_shape'], spec.get('params'))
+        compiler = get_compiler(spec['compiler'])
+        model = model_wrapper.get_model().to(device)
+        example_input = model_wrapper.get_example_input(spec['batch_size'], device)
+
+        gc.collect()
+        base_rss = get_process_rss()
+        replicas, rss_curve, gpu_curve = [], [], []
+        for replica in compiler.iter_replicas(model, example_input, count, share_weights=(mode == "shared")):
+            replicas.append(replica)
+            with torch.no_grad():
+                _ = replica(example_input)
+                gpu_monitor.synchronize()
+            gc.collect()
+            rss_curve.append(get_process_rss())
+            gpu_curve.append(gpu_monitor.get_current_memory())
+
+        # Round-robin over the replicas, as a multi-replica server would.
+        latencies = []
+        with torch.no_grad():
+            for i in range(warmup_iters):
+                _ = replicas[i % count](example_input)
+                gpu_monitor.synchronize()
+            for i in range(measured_iters):
+                t0 = time.perf_counter()
+                _ = replicas[i % count](example_input)
+                gpu_monitor.synchronize()
+                latencies.append(time.perf_counter() - t0)
+
+        result_queue.put({
+            'model_name': model_wrapper.get_name(),
+            'compiler_name': compiler.get_name(),
+            'base_rss': base_rss,
+            'rss_curve': rss_curve,
+            'gpu_curve': gpu_curve,
+            'stats': MetricsCollector.compute_metrics(
+                latencies=latencies,
+                memory_readings=[gpu_monitor.get_peak_memory()],
+                batch_size=spec['batch_size'],
+            ),
+        })
+    except Exception as exc:
+        result_queue.put({'error': f"{type(exc).__name__}: {exc}"})
+
+
+class ReplicaRunner:
+    # Marginal cost is the median increment after the first replica, which also pays for code and runtime state.
+
+    def __init__(self, replicas: int, warmup_iters: int, measured_iters: int):
+        if replicas < 2:
+            raise ValueError("Replica mode needs at least 2 replicas to measure marginal memory")
+        self.replicas = replicas
+        self.warmup_iters = warmup_iters
+        self.measured_iters = measured_iters
+        self._ctx = mp.get_context("spawn")
+
+    def run(self, spec):
+        results = {}
+        for mode in REPLICA_MODES:
+            print(f"\nBuilding {self.replicas} {mode} replicas: {spec['model']} | {spec['compiler']} | "
+                  f"batch_size={spec['batch_size']}")
+            payload = self._run_mode(spec, mode)
+            if 'error' in payload:
+                print(f"  ERROR ({mode}): {payload['error']}")
+                continue
+            results[mode] = self._to_result(spec, mode, payload)
+            self._print_result(results[mode])
+
+        unshared, shared = results.get("unshared"), results.get("shared")
+        if unshared is not None and shared is not None:
+            if unshared.marginal_mb_per_replica > 0:
+                shared.memory_saving_pct = (
+                    1 - shared.marginal_mb_per_replica / unshared.marginal_mb_per_replica
+                ) * 100
+            shared.latency_overhead_pct = (shared.latency_mean / unshared.latency_mean - 1) * 100
+        return [results[mode] for mode in REPLICA_MODES if mode in results]
+
+    def _run_mode(self, spec, mode):
+        result_queue = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_build_replicas,
+            args=(spec, mode, self.replicas, self.warmup_iters, self.measured_iters, result_queue),
+        )
+        process.start()
+        payload = None
+        while payload is None:
+            try:
+                payload = result_queue.get(timeout=5)
+            except queue.Empty:
+                if not process.is_alive():
+                    payload = {'error': f"replica process exited with code {process.exitcode}"}
+        process.join()
+        return payload
+
+    def _to_result(self, spec, mode, payload):
+        to_mb = 1024 ** 2
+        curve = [value / to_mb for value in payload['rss_curve']]
+        base = payload['base_rss'] / to_mb
+        increments = np.diff(curve)
+        return ReplicaResult(
+            model_name=payload['model_name'],
+            compiler_name=payload['compiler_name'],
+            batch_size=spec['batch_size'],
+            mode=mode,
+            replicas=self.replicas,
+            base_rss_mb=base,
+            first_replica_mb=curve[0] - base,
+            marginal_mb_per_replica=float(np.median(increments)),
+            total_replicas_mb=curve[-1] - base,
+            gpu_memory_mb=payload['gpu_curve'][-1] / to_mb,
+            marginal_gpu_mb_per_replica=float(np.median(np.diff(payload['gpu_curve']))) / to_mb,
+            rss_curve_mb=curve,
+            latency_mean=payload['stats']['latency_mean'],
+            latency_p95=payload['stats']['latency_p95'],
+        )
+
+    def _print_result(self, result):
+        print(f"  First replica:  {result.first_replica_mb:.1f} MB")
+        print(f"  Per extra replica (median): {result.marginal_mb_per_replica:.1f} MB")
+        print(f"  All {result.replicas} replicas: {result.total_replicas_mb:.1f} MB above base RSS "
+              f"({result.base_rss_mb:.1f} MB)")
+        print(f"  Latency (mean/p95, round-robin): {result.latency_mean:.3f} / {result.latency_p95:.3f} ms")
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+
+import torch
+from torch.utils.flop_counter import FlopCounterMode
+
+from .metrics import format_optional
+
+BOUND_COMPUTE = "compute"
+BOUND_MEMORY = "memory"
+BOUND_OVERHEAD = "overhead"
+
+
+@dataclass
+class ModelCost:
+    flops: int
+    param_bytes: int
+    activation_bytes: int
+    input_bytes: int
+
+    @property
+    def bytes_moved(self):
+        # Minimum DRAM traffic if nothing stays cache-resident between layers:
+        # weights and the input are read once, each activation written once and read once.
+        return self.param_bytes + self.input_bytes + 2 * self.activation_bytes
+
+    @property
+    def arithmetic_intensity(self):
+        if self.flops is None or not self.bytes_moved:
+            return None
+        return self.flops / self.bytes_moved
+
+
+def _tensors(value):
+    if isinstance(value, torch.Tensor):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [tensor for item in value for tensor in _tensors(item)]
+    if isinstance(value, dict):
+        return [tensor for item in value.values() for tensor in _tensors(item)]
+    return []
+
+
+def _tensor_bytes(value):
+    return sum(tensor.numel() * tensor.element_size() for tensor in _tensors(value))
+
+
+def profile_model(model_wrapper, batch_size: int, device: torch.device = torch.device("cpu")) -> ModelCost:
+    # Activations are leaf-module outputs, so functional ops between modules are not counted.
+    model = model_wrapper.get_model().to(device).eval()
+    example_input = model_wrapper.get_example_input(batch_size, device)
+
+    activation_bytes = 0
+
+    def record_output(module, inputs, output):
+        nonlocal activation_bytes
+        # In-place modules such as ReLU(inplace=True) return their input; that is not a new activation.
+        input_ptrs = {tensor.data_ptr() for tensor in _tensors(inputs)}
+        activation_bytes += sum(
+            tensor.numel() * tensor.element_size()
+            for tensor in _tensors(output) if tensor.data_ptr() not in input_ptrs
+        )
+
+    hooks = [
+        module.register_forward_hook(record_output)
+        for module in model.modules() if not list(module.children())
+    ]
+    try:
+        flop_counter = FlopCounterMode(display=False)
+        with torch.no_grad(), flop_counter:
+            model(example_input)
+    finally:
+        for hook in hooks:
+            hook.remove()
+
+    # None when neither the counter nor the wrapper knows the FLOPs, so the point is reported as N/A.
+    flops = flop_counter.get_total_flops() or model_wrapper.estimate_flops(batch_size) or None
+    param_bytes = sum(_tensor_bytes(tensor) for tensor in list(model.parameters()) + list(model.buffers()))
+    return ModelCost(
+        flops=flops,
+        param_bytes=param_bytes,
+        activation_bytes=activation_bytes,
+        input_bytes=_tensor_bytes(example_input),
+    )
+
+
+@dataclass
+class RooflinePoint:
+    model_name: str
+    compiler_name: str
+    batch_size: int
+    cost: ModelCost
+    latency_mean_ms: float
+    peak_gflops: float
+    memory_bandwidth_gbs: float
+    overhead_threshold_pct: float = 20.0
+    device: str = None
+
+    @property
+    def achieved_gflops(self):
+        if self.cost.flops is None:
+            return None
+        return self.cost.flops / (self.latency_mean_ms / 1000) / 1e9
+
+    @property
+    def attainable_gflops(self):
+        intensity = self.cost.arithmetic_intensity
+        if intensity is None:
+            return self.peak_gflops
+        return min(self.peak_gflops, intensity * self.memory_bandwidth_gbs)
+
+    @property
+    def pct_of_roofline(self):
+        achieved = self.achieved_gflops
+        return achieved / self.attainable_gflops * 100 if achieved is not None else None
+
+    @property
+    def bound(self):
+        # Far below the roof means time goes to framework/dispatch overhead,
+        # not to compute or DRAM traffic.
+        pct = self.pct_of_roofline
+        if pct is None:
+            return None
+        if pct < self.overhead_threshold_pct:
+            return BOUND_OVERHEAD
+        ridge_point = self.peak_gflops / self.memory_bandwidth_gbs
+        intensity = self.cost.arithmetic_intensity
+        return BOUND_COMPUTE if intensity is None or intensity >= ridge_point else BOUND_MEMORY
+
+    def to_dict(self):
+        return {
+            'model': self.model_name,
+            'compiler': self.compiler_name,
+            'batch_size': self.batch_size,
+            'device': self.device or "N/A",
+            'gflops': format_optional(self.cost.flops / 1e9 if self.cost.flops is not None else None, ".4f"),
+            'param_mb': f"{self.cost.param_bytes / 1024 ** 2:.2f}",
+            'activation_mb': f"{self.cost.activation_bytes / 1024 ** 2:.2f}",
+            'bytes_moved_mb': f"{self.cost.bytes_moved / 1024 ** 2:.2f}",
+            'arithmetic_intensity': format_optional(self.cost.arithmetic_intensity, ".2f"),
+            'latency_mean_ms': f"{self.latency_mean_ms:.3f}",
+            'achieved_gflops': format_optional(self.achieved_gflops, ".2f"),
+            'attainable_gflops': f"{self.attainable_gflops:.2f}",
+            'pct_of_roofline': format_optional(self.pct_of_roofline, ".1f"),
+            'bound': self.bound or "N/A",
+            'peak_gflops': f"{self.peak_gflops:.1f}",
+            'memory_bandwidth_gbs': f"{self.memory_bandwidth_gbs:.1f}",
+        }
@@ -0,0 +1,78 @@
+import csv
+import json
+import math
+
+POLICIES = ("min_p95", "max_throughput", "amortized")
+
+_FLOAT_FIELDS = (
+    'latency_mean_ms',
+    'latency_p95_ms',
+    'throughput_samples_per_sec',
+    'peak_memory_mb',
+    'compile_time_sec',
+    'cold_start_sec',
+    'artifact_size_mb',
+    'steady_rss_mb',
+)
+
+
+def _parse_optional_float(value):
+    if value in (None, "", "N/A"):
+        return None
+    return float(value)
+
+
+def load_results(csv_path: str):
+    rows = []
+    with open(csv_path, 'r') as f:
+        for raw in csv.DictReader(f):
+            if not raw.get('compiler'):
+                continue
+            row = dict(raw)
+            row['batch_size'] = int(raw['batch_size'])
+            for key in _FLOAT_FIELDS:
+                row[key] = _parse_optional_float(raw.get(key))
+            for key in ('compiler_config', 'model_config'):
+                value = raw.get(key)
+                row[key] = json.loads(value) if value not in (None, "", "N/A") else None
+            rows.append(row)
+    return rows
+
+
+def memory_footprint_mb(row):
+    # Device peak memory is only tracked on CUDA; CPU rows report 0 and are
+    # capped on the process RSS after measurement instead.
+    if row.get('peak_memory_mb'):
+        return row['peak_memory_mb']
+    return row.get('steady_rss_mb')
+
+
+def policy_cost(row, policy: str, expected_requests: int | None = None):
+    # Lower is better for every policy.
+    if policy == "min_p95":
+        return row['latency_p95_ms']
+    if policy == "max_throughput":
+        return -row['throughput_samples_per_sec']
+    if policy == "amortized":
+        if not expected_requests:
+            raise ValueError("The 'amortized' policy needs expected_requests")
+        startup = row['cold_start_sec'] if row['cold_start_sec'] is not None else (row['compile_time_sec'] or 0.0)
+        batches = math.ceil(expected_requests / row['batch_size'])
+        return startup + batches * row['latency_mean_ms'] / 1000
+    raise ValueError(f"Unknown policy: {policy} (expected one of {', '.join(POLICIES)})")
+
+
+def rank_candidates(rows, policy: str, memory_cap_mb: float | None = None, expected_requests: int | None = None):
+    ranked = {}
+    for row in rows:
+        if memory_cap_mb is not None:
+            # A row with no memory figure cannot be shown to fit, so it is excluded.
+            footprint = memory_footprint_mb(row)
+            if footprint is None or footprint > memory_cap_mb:
+                continue
+        cost = policy_cost(row, policy, expected_requests)
+        ranked.setdefault(row['model'], []).append((cost, row))
+
+    for model in ranked:
+        ranked[model].sort(key=lambda item: item[0])
+    return ranked
@@ -0,0 +1,195 @@
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import torch
+
+from ..utils.device import GPUMonitor, get_process_rss
+from ..utils.telemetry import NullTelemetry
+from .histogram import LogHistogram
+from .metrics import MetricsCollector, format_optional
+
+
+def _us_to_ms(value):
+    return value / 1000.0 if value is not None else None
+
+
+@dataclass
+class SoakWindow:
+    index: int
+    start_sec: float
+    end_sec: float
+    iterations: int
+
+    latency_mean: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+
+    rss_mb: float
+    gpu_memory_mb: float
+
+    def to_dict(self):
+        return {
+            'window': self.index,
+            'start_sec': f"{self.start_sec:.1f}",
+            'end_sec': f"{self.end_sec:.1f}",
+            'iterations': self.iterations,
+            'latency_mean_ms': format_optional(self.latency_mean, ".3f"),
+            'latency_p50_ms': format_optional(self.latency_p50, ".3f"),
+            'latency_p95_ms': format_optional(self.latency_p95, ".3f"),
+            'latency_p99_ms': format_optional(self.latency_p99, ".3f"),
+            'latency_max_ms': format_optional(self.latency_max, ".3f"),
+            'rss_mb': f"{self.rss_mb:.2f}",
+            'gpu_memory_mb': f"{self.gpu_memory_mb:.2f}",
+        }
+
+
+@dataclass
+class SoakReport:
+    model_name: str
+    compiler_name: str
+    batch_size: int
+    windows: List[SoakWindow]
+
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    total_iterations: int
+
+    latency_drift_ms_per_hour: float = None
+    latency_drift_pct_per_hour: float = None
+    rss_growth_mb_per_hour: float = None
+    warnings: List[str] = field(default_factory=list)
+
+
+class SoakRunner:
+
+    def __init__(self, device: torch.device, duration_sec: float, window_sec: float, warmup_iters: int,
+                 latency_drift_threshold_pct_per_hour: float = 5.0,
+                 rss_growth_threshold_mb_per_hour: float = 50.0, telemetry=None):
+        self.device = device
+        self.duration_sec = duration_sec
+        self.window_sec = window_sec
+        self.warmup_iters = warmup_iters
+        self.latency_drift_threshold_pct_per_hour = latency_drift_threshold_pct_per_hour
+        self.rss_growth_threshold_mb_per_hour = rss_growth_threshold_mb_per_hour
+        self.gpu_monitor = GPUMonitor(device)
+        self.telemetry = telemetry or NullTelemetry()
+
+    def run(self, model_wrapper, compiler, batch_size) -> SoakReport:
+        labels = {
+            'model': model_wrapper.get_name(),
+            'compiler': compiler.get_name(),
+            'batch_size': batch_size,
+        }
+        print(f"\n{'='*60}")
+        print(f"Soak: {labels['model']} | {labels['compiler']} | batch_size={batch_size} | "
+              f"{self.duration_sec:.0f}s in {self.window_sec:.0f}s windows")
+        print(f"{'='*60}")
+
+        model = model_wrapper.get_model().to(self.device)
+        example_input = model_wrapper.get_example_input(batch_size, self.device)
+
+        print("Compiling model...")
+        compiled_model = compiler.compile(model, example_input)
+
+        print(f"Warming up ({self.warmup_iters} iterations)...")
+        with torch.no_grad():
+            for _ in range(self.warmup_iters):
+                _ = compiled_model(example_input)
+                self.gpu_monitor.synchronize()
+
+        overall = LogHistogram()
+        window_hist = LogHistogram()
+        windows = []
+        self.telemetry.emit("soak_start", duration_sec=self.duration_sec, window_sec=self.window_sec, **labels)
+
+        run_start = time.perf_counter()
+        window_start = run_start
+        deadline = run_start + self.duration_sec
+        with torch.no_grad():
+            while True:
+                t0 = time.perf_counter()
+                _ = compiled_model(example_input)
+                self.gpu_monitor.synchronize()
+                t1 = time.perf_counter()
+                window_hist.record(round((t1 - t0) * 1e6))
+
+                if t1 - window_start >= self.window_sec or t1 >= deadline:
+                    window = self._close_window(len(windows), window_start - run_start, t1 - run_start, window_hist)
+                    windows.append(window)
+                    overall.merge(window_hist)
+                    window_hist.reset()
+                    window_start = t1
+                    self._print_window(window)
+                    self.telemetry.emit("soak_window", **window.to_dict(), **labels)
+                    if t1 >= deadline:
+                        break
+
+        report = self._build_report(labels, batch_size, windows, overall)
+
+        del model, compiled_model, example_input
+        if self.device.type == 'cuda':
+            torch.cuda.empty_cache()
+        return report
+
+    def _close_window(self, index, start_sec, end_sec, hist):
+        return SoakWindow(
+            index=index,
+            start_sec=start_sec,
+            end_sec=end_sec,
+            iterations=hist.total_count,
+            latency_mean=_us_to_ms(hist.mean()),
+            latency_p50=_us_to_ms(hist.percentile(50)),
+            latency_p95=_us_to_ms(hist.percentile(95)),
+            latency_p99=_us_to_ms(hist.percentile(99)),
+            latency_max=_us_to_ms(hist.max_value),
+            rss_mb=get_process_rss() / (1024 ** 2),
+            gpu_memory_mb=self.gpu_monitor.get_current_memory() / (1024 ** 2),
+        )
+
+    def _print_window(self, window):
+        print(f"  Window {window.index:>3} [{window.start_sec:>8.1f}s-{window.end_sec:>8.1f}s] "
+              f"n={window.iterations:<7} p50={window.latency_p50:.3f} p95={window.latency_p95:.3f} "
+              f"p99={window.latency_p99:.3f} ms | RSS {window.rss_mb:.1f} MB")
+
+    def _build_report(self, labels, batch_size, windows, overall):
+        report = SoakReport(
+            model_name=labels['model'],
+            compiler_name=labels['compiler'],
+            batch_size=batch_size,
+            windows=windows,
+            latency_p50=_us_to_ms(overall.percentile(50)),
+            latency_p95=_us_to_ms(overall.percentile(95)),
+            latency_p99=_us_to_ms(overall.percentile(99)),
+            total_iterations=overall.total_count,
+        )
+
+        # The first window absorbs allocator and cache warm-up, so leave it out
+        # of the trend fit once there is enough data to do so.
+        trend_windows = windows[1:] if len(windows) > 2 else windows
+        hours = [(w.start_sec + w.end_sec) / 2 / 3600 for w in trend_windows if w.iterations]
+        p50s = [w.latency_p50 for w in trend_windows if w.iterations]
+        rss = [w.rss_mb for w in trend_windows if w.iterations]
+
+        report.latency_drift_ms_per_hour = MetricsCollector.linear_slope(hours, p50s)
+        report.rss_growth_mb_per_hour = MetricsCollector.linear_slope(hours, rss)
+        if report.latency_drift_ms_per_hour is not None and p50s[0] > 0:
+            report.latency_drift_pct_per_hour = report.latency_drift_ms_per_hour / p50s[0] * 100
+
+        if (report.latency_drift_pct_per_hour is not None
+                and report.latency_drift_pct_per_hour > self.latency_drift_threshold_pct_per_hour):
+            report.warnings.append(
+                f"p50 latency drifts {report.latency_drift_pct_per_hour:+.2f}%/hour "
+                f"(threshold {self.latency_drift_threshold_pct_per_hour:.2f}%/hour); "
+                f"check thermal throttling or allocator fragmentation"
+            )
+        if (report.rss_growth_mb_per_hour is not None
+                and report.rss_growth_mb_per_hour > self.rss_growth_threshold_mb_per_hour):
+            report.warnings.append(
+                f"RSS grows {report.rss_growth_mb_per_hour:+.2f} MB/hour "
+                f"(threshold {self.rss_growth_threshold_mb_per_hour:.2f} MB/hour); possible memory leak"
+            )
+        return report
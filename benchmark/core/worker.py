@@ -0,0 +1,156 @@
+import fcntl
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+import urllib.error
+import urllib.request
+import uuid
+from contextlib import contextmanager
+
+DEFAULT_LOCK_PATH = "/tmp/ml-benchmark-worker.lock"
+
+
+def run_benchmark_job(job, benchmark_settings):
+    import torch
+
+    from ..registry import get_compiler, get_model
+    from ..utils.device import get_device
+    from ..utils.energy import DEFAULT_POWERCAP_ROOT
+    from .benchmark_runner import BenchmarkRunner
+
+    device = get_device()
+    runner = BenchmarkRunner(
+        device=device,
+        warmup_iters=benchmark_settings['warmup_iterations'],
+        measured_iters=benchmark_settings['measured_iterations'],
+        input_pool_size=benchmark_settings.get('input_pool_size', 1),
+        cache_flush=benchmark_settings.get('cache_flush', False),
+        cache_flush_mb=benchmark_settings.get('cache_flush_mb'),
+        measure_energy=benchmark_settings.get('measure_energy', True),
+        powercap_root=benchmark_settings.get('powercap_root', DEFAULT_POWERCAP_ROOT),
+    )
+    model_spec = job['model']
+    model_wrapper = get_model(model_spec['name'], model_spec['input_shape'], model_spec.get('params'))
+    compiler = get_compiler(job['compiler'])
+    metrics = runner.run_benchmark(model_wrapper, compiler, job['batch_size'], model_config=model_spec)
+
+    del model_wrapper
+    if device.type == 'cuda':
+        torch.cuda.empty_cache()
+    return metrics.to_dict()
+
+
+class WorkerAgent:
+
+    def __init__(self, coordinator_url: str, worker_id: str | None = None, host: str | None = None,
+                 lock_path: str | None = DEFAULT_LOCK_PATH, heartbeat_interval_sec: float = 10.0,
+                 poll_interval_sec: float = 5.0, max_retries: int = 5, retry_backoff_sec: float = 1.0,
+                 job_runner=run_benchmark_job):
+        self.coordinator_url = coordinator_url.rstrip("/")
+        self.host = host or socket.gethostname()
+        self.worker_id = worker_id or f"{self.host}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lock_path = lock_path
+        self.heartbeat_interval_sec = heartbeat_interval_sec
+        self.poll_interval_sec = poll_interval_sec
+        self.max_retries = max_retries
+        self.retry_backoff_sec = retry_backoff_sec
+        self.job_runner = job_runner
+
+    def run(self):
+        jobs_run = 0
+        queue_drained = False
+        while True:
+            with self._host_lock():
+                try:
+                    response = self._post_with_retry("/lease", {'worker_id': self.worker_id, 'host': self.host})
+                except ConnectionRefusedError:
+                    if not queue_drained:
+                        raise
+                    # The coordinator shuts down once the last in-flight job reports.
+                    print(f"Coordinator has shut down after the queue drained ({jobs_run} jobs run by {self.worker_id})")
+                    return jobs_run
+                job = response.get('job')
+                queue_drained = job is None
+                if job is not None:
+                    queue_drained = self._run_job(job, response['benchmark']).get('done', False)
+                    jobs_run += 1
+                    continue
+            if response.get('done'):
+                print(f"Coordinator reports the sweep is complete ({jobs_run} jobs run by {self.worker_id})")
+                return jobs_run
+            time.sleep(self.poll_interval_sec)
+
+    def _run_job(self, job, benchmark_settings):
+        print(f"\n[{self.worker_id}] Running job {job['job_id']} (attempt {job['attempt']}): "
+              f"{job['model']['name']} | {job['compiler']} | batch_size={job['batch_size']}")
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job['job_id'], stop), daemon=True)
+        heartbeat.start()
+        try:
+            result = self.job_runner(job, benchmark_settings)
+        except Exception as exc:
+            traceback.print_exc()
+            return self._post_with_retry("/fail", {
+                'worker_id': self.worker_id,
+                'host': self.host,
+                'job_id': job['job_id'],
+                'error': f"{type(exc).__name__}: {exc}",
+            })
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        return self._post_with_retry("/complete", {
+            'worker_id': self.worker_id,
+            'host': self.host,
+            'job_id': job['job_id'],
+            'result': result,
+        })
+
+    def _heartbeat(self, job_id, stop):
+        while not stop.wait(self.heartbeat_interval_sec):
+            try:
+                self._post("/heartbeat", {'worker_id': self.worker_id, 'job_id': job_id})
+            except OSError as exc:
+                print(f"[{self.worker_id}] Heartbeat failed: {exc}")
+
+    @contextmanager
+    def _host_lock(self):
+        if not self.lock_path:
+            yield
+            return
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _post_with_retry(self, path, payload):
+        delay = self.retry_backoff_sec
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._post(path, payload)
+            except urllib.error.HTTPError:
+                raise
+            except OSError as exc:
+                reason = getattr(exc, "reason", exc)
+                if attempt == self.max_retries:
+                    # Surface the underlying error (e.g. ConnectionRefusedError) rather than the URLError wrapper.
+                    raise reason if isinstance(reason, OSError) else exc
+                print(f"[{self.worker_id}] {path} failed ({reason}); retrying in {delay:.0f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+    def _post(self, path, payload):
+        request = urllib.request.Request(
+            self.coordinator_url + path,
+            data=json.dumps(payload, default=str).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())
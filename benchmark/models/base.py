@@ -13,4 +13,10 @@ class ModelWrapper(ABC):
     
     @abstractmethod
     def get_name(self) -> str:
-        pass
\ No newline at end of file
+        pass
+    
+    def get_num_parameters(self) -> int:
+        return sum(p.numel() for p in self.get_model().parameters())
+    
+    def estimate_flops(self, batch_size: int):
+        return None
@@ -0,0 +1,183 @@
+import contextlib
+
+import torch
+import torch.nn as nn
+
+from .base import ModelWrapper
+
+
+def _with_overrides(name, overrides):
+    # Append every parameter that differs from its default so swept variants never share a name.
+    for tag, value, default in overrides:
+        if value != default:
+            name += f"_{tag}{'x'.join(map(str, value)) if isinstance(value, tuple) else value}"
+    return name
+
+
+@contextlib.contextmanager
+def _seeded(seed):
+    # Seed only the weight init; the caller's global RNG stream is restored afterwards.
+    with torch.random.fork_rng(devices=[]):
+        torch.manual_seed(seed)
+        yield
+
+
+class SyntheticConvWrapper(ModelWrapper):
+
+    def __init__(self, input_shape=(3, 224, 224), channels=64, depth=8, kernel_size=3,
+                 num_classes=1000, seed=0):
+        self.input_shape = tuple(input_shape)
+        self.channels = channels
+        self.depth = depth
+        self.kernel_size = kernel_size
+        self.num_classes = num_classes
+        self.seed = seed
+
+        padding = kernel_size // 2
+        with _seeded(seed):
+            layers = [
+                nn.Conv2d(self.input_shape[0], channels, kernel_size, padding=padding, bias=False),
+                nn.BatchNorm2d(channels),
+                nn.ReLU(inplace=True),
+            ]
+            for _ in range(depth):
+                layers += [
+                    nn.Conv2d(channels, channels, kernel_size, padding=padding, bias=False),
+                    nn.BatchNorm2d(channels),
+                    nn.ReLU(inplace=True),
+                ]
+            layers += [nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(channels, num_classes)]
+            self.model = nn.Sequential(*layers)
+        self.model.eval()
+
+    def get_model(self) -> nn.Module:
+        return self.model
+
+    def get_example_input(self, batch_size, device):
+        return torch.randn(batch_size, *self.input_shape, device=device)
+
+    def get_name(self) -> str:
+        return _with_overrides(f"synthetic_conv_c{self.channels}_d{self.depth}", [
+            ("k", self.kernel_size, 3),
+            ("cls", self.num_classes, 1000),
+            ("in", self.input_shape, (3, 224, 224)),
+            ("seed", self.seed, 0),
+        ])
+
+    def estimate_flops(self, batch_size):
+        in_channels, height, width = self.input_shape
+        k2 = self.kernel_size ** 2
+        macs = height * width * k2 * in_channels * self.channels
+        macs += self.depth * height * width * k2 * self.channels * self.channels
+        macs += self.channels * self.num_classes
+        return 2 * macs * batch_size
+
+
+class SyntheticMLPWrapper(ModelWrapper):
+
+    def __init__(self, input_features=1024, hidden_size=1024, depth=4, output_features=1000, seed=0):
+        self.input_features = input_features
+        self.hidden_size = hidden_size
+        self.depth = depth
+        self.output_features = output_features
+        self.seed = seed
+
+        with _seeded(seed):
+            layers = [nn.Linear(input_features, hidden_size), nn.ReLU(inplace=True)]
+            for _ in range(depth - 1):
+                layers += [nn.Linear(hidden_size, hidden_size), nn.ReLU(inplace=True)]
+            layers.append(nn.Linear(hidden_size, output_features))
+            self.model = nn.Sequential(*layers)
+        self.model.eval()
+
+    def get_model(self) -> nn.Module:
+        return self.model
+
+    def get_example_input(self, batch_size, device):
+        return torch.randn(batch_size, self.input_features, device=device)
+
+    def get_name(self) -> str:
+        return _with_overrides(f"synthetic_mlp_h{self.hidden_size}_d{self.depth}", [
+            ("in", self.input_features, 1024),
+            ("out", self.output_features, 1000),
+            ("seed", self.seed, 0),
+        ])
+
+    def estimate_flops(self, batch_size):
+        macs = self.input_features * self.hidden_size
+        macs += (self.depth - 1) * self.hidden_size * self.hidden_size
+        macs += self.hidden_size * self.output_features
+        return 2 * macs * batch_size
+
+
+class _TransformerLM(nn.Module):
+
+    def __init__(self, vocab_size, seq_length, d_model, num_heads, num_layers, ff_mult):
+        super().__init__()
+        self.token_embedding = nn.Embedding(vocab_size, d_model)
+        self.position_embedding = nn.Parameter(torch.zeros(1, seq_length, d_model))
+        layer = nn.TransformerEncoderLayer(
+            d_model=d_model,
+            nhead=num_heads,
+            dim_feedforward=ff_mult * d_model,
+            dropout=0.0,
+            activation="gelu",
+            batch_first=True,
+            norm_first=True,
+        )
+        self.encoder = nn.TransformerEncoder(layer, num_layers=num_layers, enable_nested_tensor=False)
+        self.norm = nn.LayerNorm(d_model)
+        self.lm_head = nn.Linear(d_model, vocab_size, bias=False)
+
+    def forward(self, input_ids: torch.Tensor) -> torch.Tensor:
+        hidden = self.token_embedding(input_ids) + self.position_embedding[:, :input_ids.shape[1]]
+        hidden = self.encoder(hidden)
+        return self.lm_head(self.norm(hidden))
+
+
+class SyntheticTransformerWrapper(ModelWrapper):
+
+    def __init__(self, seq_length=128, d_model=512, num_layers=4, num_heads=8, ff_mult=4,
+                 vocab_size=32000, seed=0):
+        if d_model % num_heads != 0:
+            raise ValueError(f"d_model ({d_model}) must be divisible by num_heads ({num_heads})")
+
+        self.seq_length = seq_length
+        self.d_model = d_model
+        self.num_layers = num_layers
+        self.num_heads = num_heads
+        self.ff_mult = ff_mult
+        self.vocab_size = vocab_size
+        self.seed = seed
+
+        with _seeded(seed):
+            self.model = _TransformerLM(vocab_size, seq_length, d_model, num_heads, num_layers, ff_mult)
+        self.model.eval()
+
+    def get_model(self) -> nn.Module:
+        return self.model
+
+    def get_example_input(self, batch_size, device):
+        return torch.randint(
+            0,
+            self.vocab_size,
+            (batch_size, self.seq_length),
+            device=device,
+            dtype=torch.long,
+        )
+
+    def get_name(self) -> str:
+        return _with_overrides(f"synthetic_transformer_l{self.num_layers}_h{self.num_heads}_d{self.d_model}", [
+            ("ff", self.ff_mult, 4),
+            ("seq", self.seq_length, 128),
+            ("vocab", self.vocab_size, 32000),
+            ("seed", self.seed, 0),
+        ])
+
+    def estimate_flops(self, batch_size):
+        seq, d = self.seq_length, self.d_model
+        per_layer = 4 * seq * d * d          # q, k, v and output projections
+        per_layer += 2 * seq * seq * d       # attention scores and weighted sum
+        per_layer += 2 * seq * d * self.ff_mult * d
+        macs = self.num_layers * per_layer + seq * d * self.vocab_size
+        return 2 * macs * batch_size
@@ -0,0 +1,76 @@
+from .models.resnet import ResNetWrapper
+from .models.mobilenet import MobileNetWrapper
+from .models.vgg import VGGWrapper
+from .models.gpt2 import Gpt2Wrapper
+from .models.synthetic import SyntheticConvWrapper, SyntheticMLPWrapper, SyntheticTransformerWrapper
+from .compilers.pytorch_eager import PyTorchEagerCompiler
+from .compilers.torch_inductor import TorchInductorCompiler
+from .compilers.aot_inductor import AOTInductorCompiler
+from .compilers.torchscript import TorchScriptCompiler
+from .compilers.onnx_runtime import OnnxRuntimeCompiler
+from .compilers.tvm_compiler import TVMCompiler
+
+
+def describe_compiler(compiler_spec):
+    if isinstance(compiler_spec, dict):
+        options = ", ".join(f"{key}={value}" for key, value in compiler_spec.items() if key != "name")
+        return f"{compiler_spec['name']}({options})"
+    return compiler_spec
+
+
+def get_compiler(compiler_spec):
+    if isinstance(compiler_spec, dict):
+        options = dict(compiler_spec)
+        compiler_name = options.pop("name")
+    else:
+        compiler_name, options = compiler_spec, {}
+    
+    if compiler_name == "pytorch_eager":
+        return PyTorchEagerCompiler()
+    elif compiler_name == "torch_inductor":
+        return TorchInductorCompiler(**{"mode": "default", **options})
+    elif compiler_name.startswith("torch_inductor_"):
+        return TorchInductorCompiler(**{**options, "mode": compiler_name[len("torch_inductor_"):]})
+    elif compiler_name == "aot_inductor":
+        return AOTInductorCompiler()
+    elif compiler_name == "torchscript" or compiler_name == "torchscript_trace":
+        return TorchScriptCompiler(method="trace")
+    elif compiler_name == "torchscript_script":
+        return TorchScriptCompiler(method="script")
+    elif compiler_name == "onnxruntime":
+        # ORT's default level is ENABLE_ALL; pin it so this entry and onnxruntime_all report one configuration.
+        return OnnxRuntimeCompiler(**{"graph_optimization_level": "all", **options})
+    elif compiler_name in ("onnxruntime_disabled", "onnxruntime_basic", "onnxruntime_extended", "onnxruntime_all"):
+        level = compiler_name[len("onnxruntime_"):]
+        return OnnxRuntimeCompiler(**{"graph_optimization_level": level, **options})
+    elif compiler_name == "tvm":
+        return TVMCompiler(**options)
+    elif compiler_name == "tvm_llvm_native":
+        return TVMCompiler(**{"target": "llvm", **options})
+    elif compiler_name == "tvm_llvm_generic":
+        return TVMCompiler(**{"target": "llvm", "host_tuned": False, **options})
+    else:
+        raise ValueError(f"Unknown compiler: {compiler_name}")
+
+
+def get_model(model_name, input_shape, params=None):
+    params = params or {}
+    if model_name == "resnet50":
+        return ResNetWrapper(input_shape=tuple(input_shape), pretrained=True)
+    elif model_name == "mobilenet_v3":
+        return MobileNetWrapper(input_shape=tuple(input_shape), pretrained=True)
+    elif model_name == "vgg16":
+        return VGGWrapper(input_shape=tuple(input_shape), pretrained=True)
+    elif model_name == "gpt2":
+        seq_len = input_shape[0] if input_shape else 128
+        return Gpt2Wrapper(seq_length=seq_len, pretrained=True)
+    elif model_name == "synthetic_conv":
+        return SyntheticConvWrapper(input_shape=tuple(input_shape), **params)
+    elif model_name == "synthetic_mlp":
+        input_features = input_shape[0] if input_shape else 1024
+        return SyntheticMLPWrapper(input_features=input_features, **params)
+    elif model_name == "synthetic_transformer":
+        seq_len = input_shape[0] if input_shape else 128
+        return SyntheticTransformerWrapper(seq_length=seq_len, **params)
+    else:
+        raise ValueError(f"Unknown model: {model_name}")
@@ -0,0 +1,85 @@
+import json
+import os
+import shutil
+
+import torch
+
+from ..registry import get_compiler, get_model
+from . import bundle_loader
+
+
+def _dtype_name(dtype: torch.dtype) -> str:
+    return str(dtype).replace("torch.", "")
+
+
+def is_exportable(row) -> bool:
+    if not row.get('model_config') or not row.get('compiler_config'):
+        return False
+    try:
+        return get_compiler(row['compiler_config']).supports_export()
+    except (ValueError, RuntimeError):
+        # Unknown or unavailable backends cannot be rebuilt here, so they cannot be exported either.
+        return False
+
+
+def export_bundle(row, output_dir: str, device: torch.device):
+    if not row.get('model_config') or not row.get('compiler_config'):
+        raise ValueError(
+            f"Result row for {row['model']} / {row['compiler']} has no model/compiler config; "
+            f"re-run the benchmark to record them"
+        )
+
+    model_config = row['model_config']
+    compiler = get_compiler(row['compiler_config'])
+    if not compiler.supports_export():
+        raise ValueError(f"{compiler.get_name()} does not produce a deployable artifact")
+
+    model_wrapper = get_model(model_config['name'], model_config['input_shape'], model_config.get('params'))
+    model = model_wrapper.get_model().to(device)
+    example_input = model_wrapper.get_example_input(row['batch_size'], device)
+
+    # ORT and TVM exports move the model to the CPU in place, so run it before exporting.
+    with torch.no_grad():
+        reference_output = model(example_input)
+
+    os.makedirs(output_dir, exist_ok=True)
+    artifact = compiler.export_artifact(model, example_input, output_dir)
+    input_spec = {
+        'shape': list(example_input.shape),
+        'dtype': _dtype_name(example_input.dtype),
+    }
+    if not example_input.dtype.is_floating_point:
+        input_spec['high'] = getattr(model_wrapper, 'vocab_size', int(example_input.max().item()) + 1)
+
+    metadata = {
+        'model': row['model'],
+        'compiler': row['compiler'],
+        'batch_size': row['batch_size'],
+        'device': device.type,
+        'model_config': model_config,
+        'compiler_config': row['compiler_config'],
+        'artifact': artifact,
+        'input': input_spec,
+        'output': {
+            'shape': list(reference_output.shape),
+            'dtype': _dtype_name(reference_output.dtype),
+        },
+        'benchmark': {
+            'latency_mean_ms': row['latency_mean_ms'],
+            'latency_p95_ms': row['latency_p95_ms'],
+            'throughput_samples_per_sec': row['throughput_samples_per_sec'],
+        },
+        'torch_version': torch.__version__,
+    }
+    with open(os.path.join(output_dir, bundle_loader.METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    shutil.copyfile(bundle_loader.__file__, os.path.join(output_dir, "loader.py"))
+    return metadata
+
+
+def verify_bundle(output_dir: str, iterations: int = 100, warmup: int = 10):
+    metadata = bundle_loader.read_metadata(output_dir)
+    module = bundle_loader.load_artifact(output_dir, metadata)
+    example_input = bundle_loader.make_example_input(metadata)
+    return bundle_loader.measure_latency(module, example_input, iterations, warmup)
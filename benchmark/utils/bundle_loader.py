@@ -0,0 +1,187 @@
+"""Bundle loader, copied into each bundle as loader.py; must not import the benchmark package."""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+METADATA_FILE = "metadata.json"
+
+_TORCH_DTYPES = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+    "int64": torch.int64,
+    "int32": torch.int32,
+    "uint8": torch.uint8,
+}
+
+
+class _OnnxBundleModule(nn.Module):
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+        self.output_names = [output.name for output in session.get_outputs()]
+
+    def forward(self, inputs):
+        outputs = self.session.run(self.output_names, {self.input_name: inputs.detach().cpu().numpy()})
+        if len(outputs) == 1:
+            return torch.from_numpy(outputs[0]).to(inputs.device)
+        return tuple(torch.from_numpy(output).to(inputs.device) for output in outputs)
+
+
+class _TVMBundleModule(nn.Module):
+
+    def __init__(self, graph_module, tvm, tvm_device, input_name):
+        super().__init__()
+        self.graph_module = graph_module
+        self._tvm = tvm
+        self.tvm_device = tvm_device
+        self.input_name = input_name
+
+    def forward(self, inputs):
+        array = inputs.detach().cpu().numpy()
+        self.graph_module.set_input(self.input_name, self._tvm.nd.array(array, device=self.tvm_device))
+        self.graph_module.run()
+        self.tvm_device.sync()
+        return torch.from_numpy(self.graph_module.get_output(0).numpy()).to(inputs.device)
+
+
+class _AOTInductorBundleModule(nn.Module):
+
+    def __init__(self, runner):
+        super().__init__()
+        self.runner = runner
+
+    def forward(self, inputs):
+        outputs = self.runner(inputs)
+        if isinstance(outputs, (list, tuple)) and len(outputs) == 1:
+            return outputs[0]
+        return outputs
+
+
+def read_metadata(bundle_dir):
+    with open(os.path.join(bundle_dir, METADATA_FILE), "r") as f:
+        return json.load(f)
+
+
+def load_artifact(bundle_dir, metadata=None, device=None):
+    metadata = metadata or read_metadata(bundle_dir)
+    artifact = metadata["artifact"]
+    path = os.path.join(bundle_dir, artifact["file"])
+    fmt = artifact["format"]
+    device = torch.device(device or metadata.get("device", "cpu"))
+    if device.type == "cuda" and not torch.cuda.is_available():
+        device = torch.device("cpu")
+
+    if fmt == "onnx":
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        level = artifact.get("graph_optimization_level")
+        if level:
+            options.graph_optimization_level = getattr(ort.GraphOptimizationLevel, level)
+        for key, value in artifact.get("session_config", {}).items():
+            options.add_session_config_entry(key, str(value))
+
+        providers = artifact.get("providers")
+        if not providers:
+            providers = ["CPUExecutionProvider"]
+            if device.type == "cuda" and "CUDAExecutionProvider" in ort.get_available_providers():
+                providers.insert(0, "CUDAExecutionProvider")
+
+        kwargs = {}
+        if artifact.get("disabled_optimizers"):
+            kwargs["disabled_optimizers"] = artifact["disabled_optimizers"]
+        session = ort.InferenceSession(path, sess_options=options, providers=providers, **kwargs)
+        return _OnnxBundleModule(session)
+
+    if fmt == "tvm":
+        import tvm
+        from tvm.contrib import graph_executor
+
+        lib = tvm.runtime.load_module(path)
+        tvm_device = tvm.cuda(0) if "cuda" in artifact.get("target", "") else tvm.cpu(0)
+        graph_module = graph_executor.GraphModule(lib["default"](tvm_device))
+        return _TVMBundleModule(graph_module, tvm, tvm_device, artifact["input_name"])
+
+    if fmt == "torchscript":
+        module = torch.jit.load(path, map_location=device)
+        module.eval()
+        return module
+
+    if fmt == "aot_inductor":
+        if path.endswith(".pt2"):
+            import torch._inductor
+
+            return _AOTInductorBundleModule(torch._inductor.aoti_load_package(path))
+        import torch._export
+
+        return _AOTInductorBundleModule(torch._export.aot_load(path, device.type))
+
+    raise ValueError(f"Unknown artifact format: {fmt}")
+
+
+def make_example_input(metadata, device=None):
+    spec = metadata["input"]
+    dtype = _TORCH_DTYPES[spec["dtype"]]
+    device = torch.device(device or metadata.get("device", "cpu"))
+    if device.type == "cuda" and not torch.cuda.is_available():
+        device = torch.device("cpu")
+    if dtype.is_floating_point:
+        return torch.randn(*spec["shape"], dtype=dtype, device=device)
+    high = spec.get("high", 2)
+    return torch.randint(0, high, tuple(spec["shape"]), dtype=dtype, device=device)
+
+
+def measure_latency(module, example_input, iterations=100, warmup=10):
+    synchronize = torch.cuda.synchronize if example_input.device.type == "cuda" else (lambda: None)
+    latencies = []
+    with torch.no_grad():
+        for _ in range(warmup):
+            module(example_input)
+            synchronize()
+        for _ in range(iterations):
+            t0 = time.perf_counter()
+            module(example_input)
+            synchronize()
+            latencies.append((time.perf_counter() - t0) * 1000)
+    latencies = np.array(latencies)
+    return {
+        "latency_mean_ms": float(np.mean(latencies)),
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p95_ms": float(np.percentile(latencies, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load this bundle and measure its latency")
+    parser.add_argument("--bundle-dir", default=os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args()
+
+    metadata = read_metadata(args.bundle_dir)
+    load_start = time.perf_counter()
+    module = load_artifact(args.bundle_dir, metadata, args.device)
+    load_time = time.perf_counter() - load_start
+
+    example_input = make_example_input(metadata, args.device)
+    stats = measure_latency(module, example_input, args.iterations, args.warmup)
+    expected = metadata.get("benchmark", {})
+
+    print(f"Model:    {metadata['model']} | {metadata['compiler']} | batch_size={metadata['batch_size']}")
+    print(f"Load:     {load_time:.3f} s (no compile step)")
+    print(f"Latency:  mean {stats['latency_mean_ms']:.3f} ms | p95 {stats['latency_p95_ms']:.3f} ms")
+    if expected:
+        print(f"Recorded: mean {expected['latency_mean_ms']:.3f} ms | p95 {expected['latency_p95_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
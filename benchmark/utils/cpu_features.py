@@ -0,0 +1,153 @@
+import glob
+import os
+import platform
+
+CPUINFO_PATH = "/proc/cpuinfo"
+CPU_CACHE_SYSFS = "/sys/devices/system/cpu/cpu0/cache"
+
+# cpuinfo flag -> LLVM target attribute
+_X86_ATTRS = {
+    "sse4_2": "+sse4.2",
+    "avx": "+avx",
+    "avx2": "+avx2",
+    "fma": "+fma",
+    "f16c": "+f16c",
+    "avx512f": "+avx512f",
+    "avx512cd": "+avx512cd",
+    "avx512bw": "+avx512bw",
+    "avx512dq": "+avx512dq",
+    "avx512vl": "+avx512vl",
+    "avx512_vnni": "+avx512vnni",
+    "avx512_bf16": "+avx512bf16",
+    "avx_vnni": "+avxvnni",
+    "amx_tile": "+amx-tile",
+    "amx_int8": "+amx-int8",
+    "amx_bf16": "+amx-bf16",
+}
+
+_AARCH64_ATTRS = {
+    "asimd": "+neon",
+    "asimddp": "+dotprod",
+    "asimdhp": "+fullfp16",
+    "i8mm": "+i8mm",
+    "bf16": "+bf16",
+    "sve": "+sve",
+    "sve2": "+sve2",
+}
+
+
+def read_cpuinfo(cpuinfo_path: str = CPUINFO_PATH):
+    info = {"vendor": "", "model_name": "", "flags": set(), "cache_size_kb": None}
+    try:
+        with open(cpuinfo_path, "r") as f:
+            text = f.read()
+    except OSError:
+        return info
+
+    # Only the first processor block is needed; all cores report the same features.
+    for line in text.split("\n\n")[0].splitlines():
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        if key == "vendor_id":
+            info["vendor"] = value
+        elif key == "model name":
+            info["model_name"] = value
+        elif key in ("flags", "Features"):
+            info["flags"] = set(value.split())
+        elif key == "cache size":
+            try:
+                info["cache_size_kb"] = int(value.split()[0])
+            except (ValueError, IndexError):
+                pass
+    return info
+
+
+def _x86_mcpu(vendor: str, flags) -> str:
+    if vendor == "AuthenticAMD":
+        if "avx512f" in flags:
+            return "znver4"
+        if "vaes" in flags and "avx2" in flags:
+            return "znver3"
+        if "clwb" in flags and "avx2" in flags:
+            return "znver2"
+        if "avx2" in flags:
+            return "znver1"
+    else:
+        if "amx_tile" in flags:
+            return "sapphirerapids"
+        if "avx512_bf16" in flags:
+            return "cooperlake"
+        if "avx512_vbmi2" in flags:
+            return "icelake-server"
+        if "avx512_vnni" in flags:
+            return "cascadelake"
+        if "avx512f" in flags and "avx512bw" in flags:
+            return "skylake-avx512"
+        if "avx2" in flags and "fma" in flags:
+            return "haswell"
+    if "avx" in flags:
+        return "sandybridge"
+    return "x86-64"
+
+
+def detect_llvm_target(cpuinfo_path: str = CPUINFO_PATH, machine: str | None = None):
+    # e.g. ("cascadelake", ["+avx2", ...])
+    machine = machine or platform.machine()
+    info = read_cpuinfo(cpuinfo_path)
+    flags = info["flags"]
+
+    if machine in ("aarch64", "arm64"):
+        mattrs = [attr for flag, attr in _AARCH64_ATTRS.items() if flag in flags]
+        return "generic", mattrs
+
+    if not flags:
+        return None, []
+
+    mattrs = [attr for flag, attr in _X86_ATTRS.items() if flag in flags]
+    return _x86_mcpu(info["vendor"], flags), mattrs
+
+
+def host_llvm_target_string(cpuinfo_path: str = CPUINFO_PATH, machine: str | None = None) -> str:
+    machine = machine or platform.machine()
+    mcpu, mattrs = detect_llvm_target(cpuinfo_path, machine)
+    parts = ["llvm"]
+    if machine in ("aarch64", "arm64"):
+        parts.append("-mtriple=aarch64-linux-gnu")
+    if mcpu:
+        parts.append(f"-mcpu={mcpu}")
+    if mattrs:
+        parts.append(f"-mattr={','.join(mattrs)}")
+    return " ".join(parts)
+
+
+def _parse_cache_size(text: str) -> int:
+    text = text.strip().upper()
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+
+def get_llc_size_bytes(cache_sysfs: str = CPU_CACHE_SYSFS, cpuinfo_path: str = CPUINFO_PATH) -> int | None:
+    best_level, best_size = -1, None
+    for index_dir in glob.glob(os.path.join(cache_sysfs, "index*")):
+        try:
+            with open(os.path.join(index_dir, "level")) as f:
+                level = int(f.read())
+            with open(os.path.join(index_dir, "type")) as f:
+                cache_type = f.read().strip()
+            with open(os.path.join(index_dir, "size")) as f:
+                size = _parse_cache_size(f.read())
+        except (OSError, ValueError):
+            continue
+        if cache_type == "Instruction":
+            continue
+        if level > best_level or (level == best_level and size > (best_size or 0)):
+            best_level, best_size = level, size
+
+    if best_size is not None:
+        return best_size
+
+    cache_size_kb = read_cpuinfo(cpuinfo_path)["cache_size_kb"]
+    return cache_size_kb * 1024 if cache_size_kb else None
@@ -1,5 +1,11 @@
+import os
+import resource
+import threading
+
 import torch
 
+from .cpu_features import get_llc_size_bytes
+
 class GPUMonitor:
 
     def __init__(self, device):
@@ -24,6 +30,74 @@ class GPUMonitor:
             torch.cuda.synchronize(self.device)
 
 
+def get_process_rss():
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class PeakRSSSampler:
+
+    def __init__(self, interval_sec: float = 0.005):
+        self.interval_sec = interval_sec
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        self.peak_bytes = get_process_rss()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.peak_bytes = max(self.peak_bytes, get_process_rss())
+        return self.peak_bytes
+
+    def _sample(self):
+        while not self._stop.wait(self.interval_sec):
+            self.peak_bytes = max(self.peak_bytes, get_process_rss())
+
+
+class CacheFlusher:
+    # Writing a buffer larger than the LLC (or GPU L2) evicts weights and activations.
+
+    DEFAULT_CPU_LLC_BYTES = 32 * 1024 ** 2
+    DEFAULT_GPU_L2_BYTES = 6 * 1024 ** 2
+
+    def __init__(self, device, size_bytes: int | None = None, llc_multiplier: int = 2):
+        self.device = device
+        if size_bytes is None:
+            size_bytes = self._detect_cache_size() * llc_multiplier
+        self.size_bytes = size_bytes
+        self._buffer = torch.empty(size_bytes // 4, dtype=torch.float32, device=device)
+
+    def _detect_cache_size(self):
+        if self.device.type == 'cuda':
+            props = torch.cuda.get_device_properties(self.device)
+            return getattr(props, "L2_cache_size", 0) or self.DEFAULT_GPU_L2_BYTES
+        return get_llc_size_bytes() or self.DEFAULT_CPU_LLC_BYTES
+
+    def flush(self):
+        self._buffer.add_(1.0)
+        if self.device.type == 'cuda':
+            torch.cuda.synchronize(self.device)
+
+
 def get_device():
     if torch.cuda.is_available():
         device = torch.device('cuda')
@@ -0,0 +1,107 @@
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+DEFAULT_POWERCAP_ROOT = "/sys/class/powercap"
+
+# Top-level zones are packages (intel-rapl:0, intel-rapl:1, ...); subzones such
+# as intel-rapl:0:0 (core) are already included in their package's counter.
+_PACKAGE_ZONE = re.compile(r"^(intel|amd)-rapl:\d+$")
+
+
+def _read_int(path):
+    with open(path, "r") as f:
+        return int(f.read().strip())
+
+
+@dataclass
+class RaplDomain:
+    name: str
+    path: str
+    max_energy_range_uj: int
+
+    def read_energy_uj(self) -> int:
+        return _read_int(os.path.join(self.path, "energy_uj"))
+
+
+@dataclass
+class EnergyReading:
+    joules: float
+    duration_sec: float
+    domains: List[str]
+
+    @property
+    def avg_power_w(self):
+        return self.joules / self.duration_sec if self.duration_sec > 0 else None
+
+
+def discover_package_domains(root: str = DEFAULT_POWERCAP_ROOT) -> List[RaplDomain]:
+    if not os.path.isdir(root):
+        return []
+
+    domains = []
+    for entry in sorted(os.listdir(root)):
+        if not _PACKAGE_ZONE.match(entry):
+            continue
+        path = os.path.join(root, entry)
+        try:
+            with open(os.path.join(path, "name"), "r") as f:
+                name = f.read().strip()
+            if not name.startswith("package"):
+                continue
+            domain = RaplDomain(name=f"{entry}/{name}", path=path,
+                                max_energy_range_uj=_read_int(os.path.join(path, "max_energy_range_uj")))
+            domain.read_energy_uj()
+        except (OSError, ValueError):
+            # energy_uj is root-only on kernels patched for CVE-2020-8694.
+            continue
+        domains.append(domain)
+    return domains
+
+
+class EnergyMonitor:
+    # Counters wrap at max_energy_range_uj; only one wrap between readings is detectable, so sample() often.
+
+    def __init__(self, root: str = DEFAULT_POWERCAP_ROOT):
+        self.root = root
+        self.domains = discover_package_domains(root)
+        self._last = None
+        self._energy_uj = None
+        self._start_time = None
+
+    @property
+    def available(self) -> bool:
+        return bool(self.domains)
+
+    def start(self):
+        if not self.available:
+            return
+        self._last = [domain.read_energy_uj() for domain in self.domains]
+        self._energy_uj = [0] * len(self.domains)
+        self._start_time = time.perf_counter()
+
+    def sample(self):
+        if self._last is None:
+            return
+        for i, domain in enumerate(self.domains):
+            current = domain.read_energy_uj()
+            delta = current - self._last[i]
+            if delta < 0:
+                delta += domain.max_energy_range_uj
+            self._energy_uj[i] += delta
+            self._last[i] = current
+
+    def stop(self) -> Optional[EnergyReading]:
+        if self._last is None:
+            return None
+        self.sample()
+        duration = time.perf_counter() - self._start_time
+        reading = EnergyReading(
+            joules=sum(self._energy_uj) / 1e6,
+            duration_sec=duration,
+            domains=[domain.name for domain in self.domains],
+        )
+        self._last = None
+        return reading
@@ -0,0 +1,84 @@
+import json
+import os
+import socket
+import time
+
+import torch
+
+from .cpu_features import get_llc_size_bytes
+
+DEFAULT_CACHE_PATH = "results/host_peaks.json"
+
+
+def host_key(device: torch.device) -> str:
+    if device.type == 'cuda':
+        return f"{socket.gethostname()}|{torch.cuda.get_device_name(device)}"
+    # CPU peaks depend on how many cores torch's thread pool may use.
+    return f"{socket.gethostname()}|cpu|{torch.get_num_threads()}threads"
+
+
+def _synchronize(device):
+    if device.type == 'cuda':
+        torch.cuda.synchronize(device)
+
+
+def _best_time(fn, device, iterations, warmup=2):
+    for _ in range(warmup):
+        fn()
+    _synchronize(device)
+    best = float("inf")
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        _synchronize(device)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_peak_gemm_gflops(device: torch.device, size: int = 4096, iterations: int = 10) -> float:
+    a = torch.randn(size, size, device=device)
+    b = torch.randn(size, size, device=device)
+    out = torch.empty(size, size, device=device)
+    elapsed = _best_time(lambda: torch.mm(a, b, out=out), device, iterations)
+    return 2 * size ** 3 / elapsed / 1e9
+
+
+def measure_memory_bandwidth_gbs(device: torch.device, size_bytes: int | None = None, iterations: int = 10) -> float:
+    # Copy bandwidth counts read + write bytes over a buffer well beyond the last-level cache.
+    if size_bytes is None:
+        if device.type == 'cuda':
+            cache_bytes = getattr(torch.cuda.get_device_properties(device), "L2_cache_size", 0)
+        else:
+            cache_bytes = get_llc_size_bytes() or 0
+        size_bytes = max(4 * cache_bytes, 256 * 1024 ** 2)
+    src = torch.ones(size_bytes // 4, dtype=torch.float32, device=device)
+    dst = torch.empty_like(src)
+    elapsed = _best_time(lambda: dst.copy_(src), device, iterations)
+    return 2 * size_bytes / elapsed / 1e9
+
+
+def load_host_peaks(device: torch.device, cache_path: str = DEFAULT_CACHE_PATH, refresh: bool = False) -> dict:
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+
+    key = host_key(device)
+    if key in cache and not refresh:
+        return cache[key]
+
+    print(f"Measuring host peaks for {key} (cached in {cache_path})...")
+    peaks = {
+        'peak_gflops': measure_peak_gemm_gflops(device),
+        'memory_bandwidth_gbs': measure_memory_bandwidth_gbs(device),
+        'measured_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    print(f"  Peak GEMM: {peaks['peak_gflops']:.1f} GFLOP/s | Memory bandwidth: {peaks['memory_bandwidth_gbs']:.1f} GB/s")
+
+    cache[key] = peaks
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_path, "w") as f:
+        json.dump(cache, f, indent=2)
+    return peaks
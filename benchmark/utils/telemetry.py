@@ -0,0 +1,152 @@
+import json
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class NullTelemetry:
+
+    def emit(self, event: str, **fields):
+        pass
+
+    def close(self):
+        pass
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class TelemetryEmitter:
+    # emit() never blocks: events that do not fit in the queue are dropped and counted.
+
+    _SENTINEL = object()
+
+    def __init__(self, jsonl_path: str | None = None, prometheus_port: int | None = None,
+                 prometheus_host: str = "127.0.0.1", queue_size: int = 10000):
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._gauges = {}
+        self._gauges_lock = threading.Lock()
+        self.dropped_events = 0
+
+        self._file = None
+        if jsonl_path:
+            output_dir = os.path.dirname(jsonl_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            self._file = open(jsonl_path, "a", buffering=1)
+
+        self._server = None
+        if prometheus_port is not None:
+            self._server = ThreadingHTTPServer((prometheus_host, prometheus_port), self._make_handler())
+            self._server.daemon_threads = True
+            threading.Thread(target=self._server.serve_forever, name="telemetry-http", daemon=True).start()
+            print(f"Telemetry metrics served at http://{prometheus_host}:{self._server.server_address[1]}/metrics")
+
+        self._thread = threading.Thread(target=self._drain, name="telemetry-drain", daemon=True)
+        self._thread.start()
+
+    def emit(self, event: str, **fields):
+        record = {"ts": time.time(), "event": event}
+        record.update(fields)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_events += 1
+
+    def close(self):
+        self._queue.put(self._SENTINEL)
+        self._thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def render_prometheus(self) -> str:
+        with self._gauges_lock:
+            gauges = dict(self._gauges)
+
+        lines = []
+        seen = set()
+        for (name, labels), value in sorted(gauges.items()):
+            if name not in seen:
+                metric_type = "counter" if name.endswith("_total") else "gauge"
+                lines.append(f"# TYPE {name} {metric_type}")
+                seen.add(name)
+            label_str = ",".join(f'{key}="{_escape_label_value(val)}"' for key, val in labels)
+            lines.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+        lines.append("# TYPE benchmark_telemetry_dropped_events_total counter")
+        lines.append(f"benchmark_telemetry_dropped_events_total {self.dropped_events}")
+        return "\n".join(lines) + "\n"
+
+    def _drain(self):
+        while True:
+            record = self._queue.get()
+            if record is self._SENTINEL:
+                break
+            if self._file is not None:
+                self._file.write(json.dumps(record, default=str) + "\n")
+            self._update_gauges(record)
+
+    def _update_gauges(self, record):
+        labels = tuple(
+            (key, str(record[key])) for key in ("model", "compiler", "batch_size", "cache") if key in record
+        )
+        event = record["event"]
+        updates = {}
+
+        if event == "progress":
+            updates["benchmark_progress_ratio"] = record["iteration"] / max(record["total"], 1)
+            for key in ("latency_p50_ms", "latency_p95_ms", "latency_p99_ms", "memory_bytes", "rss_bytes"):
+                if record.get(key) is not None:
+                    updates[f"benchmark_{key}"] = record[key]
+        elif event == "compile_end":
+            updates["benchmark_compile_time_sec"] = record["compile_time_sec"]
+        elif event == "config_end":
+            for key in ("latency_mean_ms", "latency_p95_ms", "throughput", "peak_memory_mb"):
+                if record.get(key) is not None:
+                    updates[f"benchmark_result_{key}"] = record[key]
+
+        with self._gauges_lock:
+            for name, value in updates.items():
+                self._gauges[(name, labels)] = value
+            if event in ("config_end", "config_error"):
+                status = "ok" if event == "config_end" else "error"
+                key = ("benchmark_configs_finished_total", (("status", status),))
+                self._gauges[key] = self._gauges.get(key, 0) + 1
+
+    def _make_handler(self):
+        emitter = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = emitter.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _MetricsHandler
+
+
+def create_telemetry(telemetry_config):
+    if telemetry_config is None or not telemetry_config.enabled:
+        return NullTelemetry()
+    return TelemetryEmitter(
+        jsonl_path=telemetry_config.jsonl_path,
+        prometheus_port=telemetry_config.prometheus_port,
+        queue_size=telemetry_config.queue_size,
+    )
@@ -2,46 +2,10 @@ import os
 import torch
 from benchmark.core.config import Config
 from benchmark.core.benchmark_runner import BenchmarkRunner
-from benchmark.models.resnet import ResNetWrapper
-from benchmark.models.mobilenet import MobileNetWrapper
-from benchmark.models.vgg import VGGWrapper
-from benchmark.models.gpt2 import Gpt2Wrapper
-from benchmark.compilers.pytorch_eager import PyTorchEagerCompiler
-from benchmark.compilers.torch_inductor import TorchInductorCompiler
-from benchmark.compilers.torchscript import TorchScriptCompiler
-from benchmark.compilers.onnx_runtime import OnnxRuntimeCompiler
-from benchmark.compilers.tvm_compiler import TVMCompiler
+from benchmark.registry import describe_compiler, get_compiler, get_model
 from benchmark.utils.device import get_device
 from benchmark.utils.output import ResultsWriter
-
-def get_compiler(compiler_name: str):
-    if compiler_name == "pytorch_eager":
-        return PyTorchEagerCompiler()
-    elif compiler_name == "torch_inductor":
-        return TorchInductorCompiler(mode="default")
-    elif compiler_name == "torchscript" or compiler_name == "torchscript_trace":
-        return TorchScriptCompiler(method="trace")
-    elif compiler_name == "torchscript_script":
-        return TorchScriptCompiler(method="script")
-    elif compiler_name == "onnxruntime":
-        return OnnxRuntimeCompiler()
-    elif compiler_name == "tvm":
-        return TVMCompiler()
-    else:
-        raise ValueError(f"Unknown compiler: {compiler_name}")
-
-def get_model(model_name, input_shape):
-    if model_name == "resnet50":
-        return ResNetWrapper(input_shape=tuple(input_shape), pretrained=True)
-    elif model_name == "mobilenet_v3":
-        return MobileNetWrapper(input_shape=tuple(input_shape), pretrained=True)
-    elif model_name == "vgg16":
-        return VGGWrapper(input_shape=tuple(input_shape), pretrained=True)
-    elif model_name == "gpt2":
-        seq_len = input_shape[0] if input_shape else 128
-        return Gpt2Wrapper(seq_length=seq_len, pretrained=True)
-    else:
-        raise ValueError(f"Unknown model: {model_name}")
+from benchmark.utils.telemetry import create_telemetry
 
 def main():
     cfg = Config.from_yaml("config.yaml")
@@ -50,17 +14,27 @@ def main():
     print("ML COMPILER BENCHMARK FRAMEWORK")
     print("="*70)
     print(f"Models: {', '.join(model_cfg.name for model_cfg in cfg.models)}")
-    print(f"Compilers: {', '.join(cfg.compilers)}")
+    print(f"Compilers: {', '.join(describe_compiler(spec) for spec in cfg.compilers)}")
     print(f"Warmup iterations: {cfg.benchmark.warmup_iterations}")
     print(f"Measured iterations: {cfg.benchmark.measured_iterations}")
+    print(f"Input pool size: {cfg.benchmark.input_pool_size}")
+    print(f"Cache-cold pass: {'enabled' if cfg.benchmark.cache_flush else 'disabled'}")
     print("="*70)
     
     device = get_device()
+    telemetry = create_telemetry(cfg.telemetry)
     
     runner = BenchmarkRunner(
         device=device,
         warmup_iters=cfg.benchmark.warmup_iterations,
-        measured_iters=cfg.benchmark.measured_iterations
+        measured_iters=cfg.benchmark.measured_iterations,
+        telemetry=telemetry,
+        progress_interval=cfg.telemetry.progress_interval,
+        input_pool_size=cfg.benchmark.input_pool_size,
+        cache_flush=cfg.benchmark.cache_flush,
+        cache_flush_mb=cfg.benchmark.cache_flush_mb,
+        measure_energy=cfg.benchmark.measure_energy,
+        powercap_root=cfg.benchmark.powercap_root
     )
     
     output_path = f"{cfg.output.save_path}/benchmark_results.csv"
@@ -69,32 +43,59 @@ def main():
         os.remove(output_path)
         print(f"Cleared previous results at: {output_path}\n")
     
-    for model_idx, model_cfg in enumerate(cfg.models):
-        print(f"\n{'='*70}")
-        print(f"PROCESSING MODEL {model_idx + 1}/{len(cfg.models)}: {model_cfg.name}")
-        print(f"{'='*70}")
+    telemetry.emit(
+        "sweep_start",
+        models=[model_cfg.name for model_cfg in cfg.models],
+        compilers=cfg.compilers,
+        warmup_iterations=cfg.benchmark.warmup_iterations,
+        measured_iterations=cfg.benchmark.measured_iterations,
+    )
+    
+    try:
+        for model_idx, model_cfg in enumerate(cfg.models):
+            print(f"\n{'='*70}")
+            params_note = f" {model_cfg.params}" if model_cfg.params else ""
+            print(f"PROCESSING MODEL {model_idx + 1}/{len(cfg.models)}: {model_cfg.name}{params_note}")
+            print(f"{'='*70}")
         
-        model_wrapper = get_model(model_cfg.name, model_cfg.input_shape)
-        model_results = []
+            telemetry.emit("model_start", model=model_cfg.name, index=model_idx, total=len(cfg.models))
+            model_wrapper = get_model(model_cfg.name, model_cfg.input_shape, model_cfg.params)
+            model_results = []
         
-        for compiler_name in cfg.compilers:
-            compiler = get_compiler(compiler_name)
+            for compiler_spec in cfg.compilers:
+                compiler_name = describe_compiler(compiler_spec)
+                compiler = None
             
-            for batch_size in model_cfg.batch_sizes:
-                try:
-                    run_stats = runner.run_benchmark(model_wrapper, compiler, batch_size)
-                    model_results.append(run_stats)
-                except Exception as e:
-                    print(f"\nERROR: Benchmarking {model_cfg.name} with {compiler_name} (batch={batch_size}): {e}")
-                    print("Continuing with next configuration...\n")
+                for batch_size in model_cfg.batch_sizes:
+                    try:
+                        # A backend missing from this environment fails only its own configurations.
+                        if compiler is None:
+                            compiler = get_compiler(compiler_spec)
+                        run_stats = runner.run_benchmark(
+                            model_wrapper, compiler, batch_size, model_config=model_cfg.to_spec()
+                        )
+                        model_results.append(run_stats)
+                    except Exception as e:
+                        print(f"\nERROR: Benchmarking {model_cfg.name} with {compiler_name} (batch={batch_size}): {e}")
+                        telemetry.emit(
+                            "config_error",
+                            model=model_wrapper.get_name(),
+                            compiler=compiler.get_name() if compiler is not None else compiler_name,
+                            batch_size=batch_size,
+                            error=str(e),
+                        )
+                        print("Continuing with next configuration...\n")
         
-        if model_results:
-            ResultsWriter.write_csv(model_results, output_path, append=(model_idx > 0))
+            if model_results:
+                ResultsWriter.write_csv(model_results, output_path, append=(model_idx > 0))
         
-        del model_wrapper
-        if device.type == 'cuda':
-            torch.cuda.empty_cache()
-            torch.cuda.synchronize()
+            del model_wrapper
+            if device.type == 'cuda':
+                torch.cuda.empty_cache()
+                torch.cuda.synchronize()
+    finally:
+        telemetry.emit("sweep_end")
+        telemetry.close()
     
     print("\n" + "="*70)
     print("BENCHMARK COMPLETE!")
@@ -0,0 +1,49 @@
+import sys
+from benchmark.core.config import Config
+from benchmark.core.colocation import ColocationRunner, find_best_packing
+from benchmark.utils.output import ResultsWriter
+
+def main(config_path="config.yaml"):
+    cfg = Config.from_yaml(config_path)
+    if cfg.colocation is None:
+        print(f"Error: no 'colocation' section in {config_path}")
+        return
+    
+    colo_cfg = cfg.colocation
+    print("="*70)
+    print("CO-LOCATION INTERFERENCE BENCHMARK")
+    print("="*70)
+    for member in colo_cfg.mix:
+        slo = f"{member.slo_ms} ms" if member.slo_ms is not None else "none"
+        print(f"  {member.model} | {member.compiler} | batch_size={member.batch_size} | p95 SLO: {slo}")
+    print(f"Strategies: {', '.join(colo_cfg.strategies)}")
+    print(f"Duration per run: {colo_cfg.duration_sec}s")
+    print("="*70)
+    
+    runner = ColocationRunner(colo_cfg)
+    results = runner.run()
+    
+    print("\n" + "="*70)
+    print("DEGRADATION vs SOLO")
+    print("="*70)
+    print(f"{'Strategy':<10} {'Model':<20} {'Compiler':<25} {'Cores':<10} {'p95 solo→colo (ms)':<22} {'Lat x':<7} {'Tput -%':<8} {'SLO':<5}")
+    print("-" * 110)
+    for result in results:
+        p95_str = f"{result.solo_latency_p95:.2f}→{result.colo_latency_p95:.2f}"
+        slo_str = "-" if result.slo_ms is None else ("ok" if result.slo_met else "MISS")
+        print(f"{result.strategy:<10} {result.model_name:<20} {result.compiler_name:<25} "
+              f"{result.to_dict()['cores']:<10} {p95_str:<22} {result.latency_degradation:<7.2f} "
+              f"{result.throughput_degradation_pct:<8.1f} {slo_str:<5}")
+    
+    best = find_best_packing(results, len(colo_cfg.mix))
+    print()
+    if best is None:
+        print("No core partitioning strategy meets every member's p95 SLO.")
+    else:
+        total = sum(r.colo_throughput for r in results if r.strategy == best)
+        print(f"Best packing: '{best}' (all SLOs met, aggregate throughput {total:.2f} samples/sec)")
+    
+    ResultsWriter.write_csv(results, colo_cfg.save_path)
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
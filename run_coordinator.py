@@ -0,0 +1,56 @@
+import argparse
+from dataclasses import asdict
+from benchmark.core.config import Config
+from benchmark.core.coordinator import CoordinatorServer
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve benchmark jobs to worker agents")
+    parser.add_argument("config", nargs="?", default="config.yaml")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--lease-timeout", type=float, default=120.0,
+                        help="seconds without a heartbeat before a job is requeued")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--grace", type=float, default=30.0,
+                        help="seconds to keep serving after the last job so polling workers see the sweep end")
+    parser.add_argument("--output", default=None, help="merged results CSV (default: <save_path>/distributed_results.csv)")
+    args = parser.parse_args()
+    
+    cfg = Config.from_yaml(args.config)
+    jobs = cfg.expand_jobs()
+    output_path = args.output or f"{cfg.output.save_path}/distributed_results.csv"
+    
+    coordinator = CoordinatorServer(
+        jobs,
+        output_path=output_path,
+        benchmark_settings=asdict(cfg.benchmark),
+        host=args.host,
+        port=args.port,
+        lease_timeout_sec=args.lease_timeout,
+        max_attempts=args.max_attempts,
+        shutdown_grace_sec=args.grace
+    )
+    coordinator.start()
+    
+    print("="*70)
+    print("SWEEP COORDINATOR")
+    print("="*70)
+    print(f"Jobs: {len(jobs)}")
+    print(f"Listening on: {coordinator.address}")
+    print(f"Results: {output_path}")
+    print("="*70)
+    
+    try:
+        coordinator.wait()
+    finally:
+        status = coordinator.queue.status()
+        coordinator.stop()
+    
+    print("\n" + "="*70)
+    print(f"SWEEP COMPLETE: {status['completed']}/{status['total']} jobs, {len(status['failed'])} failed")
+    for job_id, error in status['failed'].items():
+        print(f"  Job {job_id}: {error}")
+    print("="*70)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import sys
+from benchmark.core.config import Config
+from benchmark.core.e2e import VISION_MODELS, E2ERunner, generate_images
+from benchmark.registry import describe_compiler, get_compiler, get_model
+from benchmark.utils.device import get_device
+from benchmark.utils.output import ResultsWriter
+from benchmark.utils.telemetry import create_telemetry
+
+def main(config_path="config.yaml"):
+    cfg = Config.from_yaml(config_path)
+    if cfg.e2e is None:
+        print(f"Error: no 'e2e' section in {config_path}")
+        return
+    
+    e2e_cfg = cfg.e2e
+    unsupported = [name for name in e2e_cfg.models if name not in VISION_MODELS]
+    if unsupported:
+        print(f"Error: end-to-end mode supports {', '.join(VISION_MODELS)}; got {', '.join(unsupported)}")
+        return
+    
+    image_dir = e2e_cfg.image_dir
+    if image_dir is None:
+        height, width = e2e_cfg.generated_image_size
+        image_dir = generate_images("results/e2e_images", e2e_cfg.generated_images, height, width)
+    
+    print("="*70)
+    print("END-TO-END INPUT PIPELINE BENCHMARK")
+    print("="*70)
+    print(f"Models: {', '.join(e2e_cfg.models)}")
+    print(f"Compilers: {', '.join(describe_compiler(spec) for spec in e2e_cfg.compilers)}")
+    print(f"Images: {image_dir} (resize {e2e_cfg.resize_size}, crop {e2e_cfg.crop_size})")
+    print(f"Loader: {e2e_cfg.num_workers} workers, pin_memory={e2e_cfg.pin_memory}, prefetch_factor={e2e_cfg.prefetch_factor}")
+    print(f"Normalization: {'fused into the compiled graph' if e2e_cfg.fuse_normalize else 'in loader workers'}")
+    print("="*70)
+    
+    device = get_device()
+    telemetry = create_telemetry(cfg.telemetry)
+    runner = E2ERunner(device, e2e_cfg, telemetry=telemetry)
+    
+    results = []
+    try:
+        for model_name in e2e_cfg.models:
+            input_shape = [3, e2e_cfg.crop_size, e2e_cfg.crop_size]
+            for compiler_spec in e2e_cfg.compilers:
+                for batch_size in e2e_cfg.batch_sizes:
+                    try:
+                        model_wrapper = get_model(model_name, input_shape)
+                        compiler = get_compiler(compiler_spec)
+                        results.append(runner.run(model_wrapper, compiler, batch_size, image_dir))
+                    except Exception as e:
+                        print(f"\nERROR: {model_name} with {describe_compiler(compiler_spec)} (batch={batch_size}): {e}")
+                        print("Continuing with next configuration...\n")
+    finally:
+        telemetry.close()
+    
+    print("\n" + "="*70)
+    print("MODEL-ONLY vs END-TO-END THROUGHPUT (images/sec)")
+    print("="*70)
+    print(f"{'Model':<20} {'Compiler':<25} {'Batch':<6} {'Model':<10} {'Loader':<10} {'E2E':<10} {'Overlap':<8} {'Bottleneck':<15}")
+    print("-" * 110)
+    for result in results:
+        print(f"{result.model_name:<20} {result.compiler_name:<25} {result.batch_size:<6} "
+              f"{result.model_only_throughput:<10.1f} {result.loader_only_throughput:<10.1f} "
+              f"{result.e2e_throughput:<10.1f} {result.overlap_efficiency:<8.2f} {result.bottleneck:<15}")
+    
+    ResultsWriter.write_csv(results, e2e_cfg.save_path)
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
@@ -0,0 +1,69 @@
+import os
+import sys
+from benchmark.core.config import Config
+from benchmark.core.benchmark_runner import BenchmarkRunner
+from benchmark.core.pipeline import PipelinedSweep
+from benchmark.registry import describe_compiler
+from benchmark.utils.device import get_device
+from benchmark.utils.output import ResultsWriter
+from benchmark.utils.telemetry import create_telemetry
+
+def main(config_path="config.yaml"):
+    cfg = Config.from_yaml(config_path)
+    jobs = cfg.expand_jobs()
+    device = get_device()
+    telemetry = create_telemetry(cfg.telemetry)
+    
+    runner = BenchmarkRunner(
+        device=device,
+        warmup_iters=cfg.benchmark.warmup_iterations,
+        measured_iters=cfg.benchmark.measured_iterations,
+        telemetry=telemetry,
+        progress_interval=cfg.telemetry.progress_interval,
+        input_pool_size=cfg.benchmark.input_pool_size,
+        cache_flush=cfg.benchmark.cache_flush,
+        cache_flush_mb=cfg.benchmark.cache_flush_mb,
+        # RAPL counters cover the whole package, which the compile workers share during measurement.
+        measure_energy=False
+    )
+    sweep = PipelinedSweep(runner, jobs, cfg.pipeline, telemetry=telemetry)
+    
+    print("="*70)
+    print("PIPELINED BENCHMARK SWEEP")
+    print("="*70)
+    print(f"Models: {', '.join(model_cfg.name for model_cfg in cfg.models)}")
+    print(f"Compilers: {', '.join(describe_compiler(spec) for spec in cfg.compilers)}")
+    print(f"Jobs: {len(jobs)}")
+    print(f"Measurement cores: {sweep.measure_cores}")
+    print(f"Compile cores: {sweep.compile_cores} ({cfg.pipeline.compile_workers} workers, lookahead {sweep.lookahead})")
+    print("="*70)
+    
+    if os.path.exists(cfg.pipeline.save_path):
+        os.remove(cfg.pipeline.save_path)
+    
+    telemetry.emit("sweep_start", jobs=len(jobs), pipelined=True)
+    try:
+        results = sweep.run()
+    finally:
+        telemetry.emit(
+            "sweep_end",
+            wall_time_sec=sweep.wall_time_sec,
+            serial_estimate_sec=sweep.serial_estimate_sec,
+        )
+        telemetry.close()
+    
+    ResultsWriter.write_csv(results, cfg.pipeline.save_path)
+    
+    print("\n" + "="*70)
+    print("SWEEP TIME")
+    print("="*70)
+    print(f"Pipelined wall time:            {sweep.wall_time_sec:.1f}s")
+    print(f"Estimated serial time:          {sweep.serial_estimate_sec:.1f}s "
+          f"(sum of per-job compile + measure, not a measured serial run)")
+    if sweep.wall_time_sec > 0:
+        print(f"Estimated speedup:              {sweep.serial_estimate_sec / sweep.wall_time_sec:.2f}x")
+    print(f"Measurement stalled on compile: {sweep.stall_sec:.1f}s")
+    print("="*70)
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
@@ -0,0 +1,48 @@
+import sys
+from benchmark.core.config import Config
+from benchmark.core.replicas import ReplicaRunner
+from benchmark.registry import describe_compiler
+from benchmark.utils.output import ResultsWriter
+
+def main(config_path="config.yaml"):
+    cfg = Config.from_yaml(config_path)
+    if cfg.replicas is None:
+        print(f"Error: no 'replicas' section in {config_path}")
+        return
+    
+    rep_cfg = cfg.replicas
+    print("="*70)
+    print("SHARED-WEIGHT REPLICA BENCHMARK")
+    print("="*70)
+    print(f"Model: {rep_cfg.model} | batch_size={rep_cfg.batch_size} | {rep_cfg.replicas} replicas")
+    print(f"Compilers: {', '.join(describe_compiler(spec) for spec in rep_cfg.compilers)}")
+    print("="*70)
+    
+    runner = ReplicaRunner(rep_cfg.replicas, rep_cfg.warmup_iterations, rep_cfg.measured_iterations)
+    results = []
+    for compiler_spec in rep_cfg.compilers:
+        spec = {
+            'model': rep_cfg.model,
+            'input_shape': rep_cfg.input_shape,
+            'params': rep_cfg.params,
+            'compiler': compiler_spec,
+            'batch_size': rep_cfg.batch_size,
+        }
+        results.extend(runner.run(spec))
+    
+    print("\n" + "="*70)
+    print("MARGINAL MEMORY PER EXTRA REPLICA")
+    print("="*70)
+    print(f"{'Compiler':<25} {'Mode':<10} {'First (MB)':<12} {'Extra (MB)':<12} {'Total (MB)':<12} {'Mean (ms)':<11} {'Saving':<9} {'Latency':<9}")
+    print("-" * 105)
+    for result in results:
+        saving = f"{result.memory_saving_pct:.1f}%" if result.memory_saving_pct is not None else "-"
+        overhead = f"{result.latency_overhead_pct:+.1f}%" if result.latency_overhead_pct is not None else "-"
+        print(f"{result.compiler_name:<25} {result.mode:<10} {result.first_replica_mb:<12.1f} "
+              f"{result.marginal_mb_per_replica:<12.1f} {result.total_replicas_mb:<12.1f} "
+              f"{result.latency_mean:<11.3f} {saving:<9} {overhead:<9}")
+    
+    ResultsWriter.write_csv(results, rep_cfg.save_path)
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
@@ -0,0 +1,58 @@
+import sys
+from benchmark.core.config import Config
+from benchmark.core.soak import SoakRunner
+from benchmark.registry import get_compiler, get_model
+from benchmark.utils.device import get_device
+from benchmark.utils.output import ResultsWriter
+from benchmark.utils.telemetry import create_telemetry
+
+def main(config_path="config.yaml"):
+    cfg = Config.from_yaml(config_path)
+    if cfg.soak is None:
+        print(f"Error: no 'soak' section in {config_path}")
+        return
+    
+    soak_cfg = cfg.soak
+    print("="*70)
+    print("SOAK TEST")
+    print("="*70)
+    
+    device = get_device()
+    telemetry = create_telemetry(cfg.telemetry)
+    runner = SoakRunner(
+        device=device,
+        duration_sec=soak_cfg.duration_sec,
+        window_sec=soak_cfg.window_sec,
+        warmup_iters=soak_cfg.warmup_iterations,
+        latency_drift_threshold_pct_per_hour=soak_cfg.latency_drift_threshold_pct_per_hour,
+        rss_growth_threshold_mb_per_hour=soak_cfg.rss_growth_threshold_mb_per_hour,
+        telemetry=telemetry
+    )
+    
+    try:
+        model_wrapper = get_model(soak_cfg.model, soak_cfg.input_shape, soak_cfg.params)
+        compiler = get_compiler(soak_cfg.compiler)
+        report = runner.run(model_wrapper, compiler, soak_cfg.batch_size)
+    finally:
+        telemetry.close()
+    
+    def fmt(value, suffix):
+        return f"{value:+.3f} {suffix}" if value is not None else "N/A (not enough windows)"
+    
+    print("\n" + "="*70)
+    print("SOAK SUMMARY")
+    print("="*70)
+    print(f"  {report.model_name} | {report.compiler_name} | batch_size={report.batch_size}")
+    print(f"  Iterations:      {report.total_iterations} in {len(report.windows)} windows")
+    print(f"  Latency p50/p95/p99: {report.latency_p50:.3f} / {report.latency_p95:.3f} / {report.latency_p99:.3f} ms")
+    print(f"  Latency drift:   {fmt(report.latency_drift_ms_per_hour, 'ms/hour')}")
+    print(f"  RSS growth:      {fmt(report.rss_growth_mb_per_hour, 'MB/hour')}")
+    for warning in report.warnings:
+        print(f"  WARNING: {warning}")
+    if not report.warnings:
+        print("  No drift or memory growth above thresholds.")
+    
+    ResultsWriter.write_csv(report.windows, soak_cfg.save_path)
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "config.yaml")
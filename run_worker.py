@@ -0,0 +1,24 @@
+import argparse
+from benchmark.core.worker import DEFAULT_LOCK_PATH, WorkerAgent
+
+def main():
+    parser = argparse.ArgumentParser(description="Run benchmark jobs leased from a coordinator")
+    parser.add_argument("--coordinator", default="http://127.0.0.1:8765")
+    parser.add_argument("--worker-id", default=None)
+    parser.add_argument("--host-tag", default=None, help="host name recorded with results (default: hostname)")
+    parser.add_argument("--lock-file", default=DEFAULT_LOCK_PATH,
+                        help="per-host lock that keeps agents on one machine from measuring concurrently")
+    parser.add_argument("--heartbeat", type=float, default=10.0)
+    args = parser.parse_args()
+    
+    agent = WorkerAgent(
+        coordinator_url=args.coordinator,
+        worker_id=args.worker_id,
+        host=args.host_tag,
+        lock_path=args.lock_file,
+        heartbeat_interval_sec=args.heartbeat
+    )
+    agent.run()
+
+if __name__ == "__main__":
+    main()
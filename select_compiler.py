@@ -0,0 +1,79 @@
+import argparse
+import os
+from benchmark.core.selection import POLICIES, load_results, memory_footprint_mb, rank_candidates
+
+def main():
+    parser = argparse.ArgumentParser(description="Pick the best (compiler, options, batch) per model and export it")
+    parser.add_argument("csv_path", nargs="?", default="results/benchmark_results.csv")
+    parser.add_argument("--policy", choices=POLICIES, default="min_p95")
+    parser.add_argument("--memory-cap-mb", type=float, default=None,
+                        help="drop candidates whose peak GPU memory (or steady-state RSS on CPU) exceeds this")
+    parser.add_argument("--expected-requests", type=int, default=None,
+                        help="request count to amortize compile/cold-start time over ('amortized' policy)")
+    parser.add_argument("--batch-size", type=int, default=None, help="only consider this batch size")
+    parser.add_argument("--export", metavar="DIR", default=None,
+                        help="write a deployment bundle per model under DIR")
+    parser.add_argument("--verify", action="store_true", help="reload each bundle and re-measure its latency")
+    parser.add_argument("--exportable-only", action="store_true",
+                        help="rank only configurations that produce a deployable artifact")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.csv_path):
+        print(f"Error: Results file not found")
+        return
+    
+    rows = load_results(args.csv_path)
+    if args.batch_size is not None:
+        rows = [row for row in rows if row['batch_size'] == args.batch_size]
+    if args.exportable_only:
+        from benchmark.utils.bundle import is_exportable
+        rows = [row for row in rows if is_exportable(row)]
+    ranked = rank_candidates(rows, args.policy, args.memory_cap_mb, args.expected_requests)
+    
+    print("="*80)
+    print(f"COMPILER SELECTION (policy: {args.policy})")
+    print("="*80)
+    
+    if args.memory_cap_mb is not None:
+        unmeasured = [row for row in rows if memory_footprint_mb(row) is None]
+        if unmeasured:
+            print(f"Excluded {len(unmeasured)} candidate(s) with no memory measurement from the "
+                  f"{args.memory_cap_mb:.0f} MB cap (re-run the benchmark to record steady_rss_mb)")
+    
+    if args.export:
+        import torch
+        from benchmark.utils.bundle import export_bundle, verify_bundle
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+    
+    for model in sorted(ranked):
+        candidates = ranked[model]
+        print(f"\n{model}:")
+        for rank, (cost, row) in enumerate(candidates[:5]):
+            marker = "*" if rank == 0 else " "
+            print(f"  {marker} {row['compiler']:<32} batch {row['batch_size']:<4} "
+                  f"p95 {row['latency_p95_ms']:>9.3f} ms | {row['throughput_samples_per_sec']:>10.2f} samples/s | "
+                  f"cost {cost:.4g}")
+        
+        if not args.export:
+            continue
+        
+        # Export only the winner; silently deploying a runner-up would misreport the selection.
+        cost, row = candidates[0]
+        bundle_dir = os.path.join(args.export, f"{model}_{row['compiler']}_b{row['batch_size']}".replace(" ", "_"))
+        try:
+            export_bundle(row, bundle_dir, device)
+        except (ValueError, RuntimeError) as e:
+            print(f"  Best configuration {row['compiler']} cannot be deployed: {e}")
+            if not args.exportable_only:
+                print("  Re-run with --exportable-only to select among deployable configurations")
+            continue
+        print(f"  Exported bundle: {bundle_dir}")
+        if args.verify:
+            stats = verify_bundle(bundle_dir)
+            print(f"  Reloaded latency: mean {stats['latency_mean_ms']:.3f} ms, p95 {stats['latency_p95_ms']:.3f} ms "
+                  f"(benchmarked p95 {row['latency_p95_ms']:.3f} ms)")
+    
+    print("\n" + "="*80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import csv
+import threading
+import time
+
+from benchmark.core.coordinator import CoordinatorServer
+from benchmark.core.worker import WorkerAgent
+
+
+def _jobs(count):
+    return [
+        {
+            'job_id': job_id,
+            'model': {'name': "synthetic_mlp", 'input_shape': [64], 'params': {}},
+            'compiler': "pytorch_eager",
+            'batch_size': 1,
+        }
+        for job_id in range(count)
+    ]
+
+
+def _fake_runner(job, benchmark_settings):
+    time.sleep(0.05)
+    return {'model': job['model']['name'], 'compiler': job['compiler'], 'batch_size': job['batch_size'],
+            'latency_mean_ms': "1.000"}
+
+
+def _start_worker(coordinator, worker_id, results, job_runner=_fake_runner, poll_interval_sec=0.1):
+    agent = WorkerAgent(
+        coordinator.address,
+        worker_id=worker_id,
+        host=f"host-{worker_id}",
+        lock_path=None,
+        heartbeat_interval_sec=0.1,
+        poll_interval_sec=poll_interval_sec,
+        retry_backoff_sec=0.05,
+        job_runner=job_runner,
+    )
+
+    def run():
+        try:
+            results[worker_id] = agent.run()
+        except Exception as exc:
+            results[worker_id] = exc
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_two_workers_drain_the_queue(tmp_path):
+    output_path = tmp_path / "distributed_results.csv"
+    coordinator = CoordinatorServer(
+        _jobs(8), str(output_path), benchmark_settings={}, host="127.0.0.1", port=0, shutdown_grace_sec=5.0
+    )
+    coordinator.start()
+    results = {}
+    threads = [_start_worker(coordinator, worker_id, results) for worker_id in ("a", "b")]
+    try:
+        coordinator.wait(poll_sec=0.05)
+    finally:
+        coordinator.stop()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert sum(results.values()) == 8
+    with open(output_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(int(row['job_id']) for row in rows) == list(range(8))
+    assert {row['worker_id'] for row in rows} <= {"a", "b"}
+
+
+def test_failing_job_is_retried_then_reported(tmp_path):
+    def flaky_runner(job, benchmark_settings):
+        if job['job_id'] == 1:
+            raise RuntimeError("boom")
+        return _fake_runner(job, benchmark_settings)
+
+    coordinator = CoordinatorServer(
+        _jobs(3), str(tmp_path / "results.csv"), benchmark_settings={}, host="127.0.0.1", port=0,
+        max_attempts=2, shutdown_grace_sec=5.0,
+    )
+    coordinator.start()
+    results = {}
+    threads = [_start_worker(coordinator, worker_id, results, flaky_runner) for worker_id in ("a", "b")]
+    try:
+        coordinator.wait(poll_sec=0.05)
+        status = coordinator.queue.status()
+    finally:
+        coordinator.stop()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert status['completed'] == 2
+    assert status['failed'] == {'1': "RuntimeError: boom"}
+    assert all(isinstance(value, int) for value in results.values())
+
+
+def test_idle_worker_exits_cleanly_when_coordinator_is_gone(tmp_path):
+    coordinator = CoordinatorServer(
+        _jobs(1), str(tmp_path / "results.csv"), benchmark_settings={}, host="127.0.0.1", port=0,
+        shutdown_grace_sec=0.0,
+    )
+    coordinator.start()
+    release = threading.Event()
+
+    def slow_runner(job, benchmark_settings):
+        release.wait(timeout=10)
+        return _fake_runner(job, benchmark_settings)
+
+    results = {}
+    busy = _start_worker(coordinator, "busy", results, slow_runner)
+    # The idle worker leases nothing and sleeps between polls while the only job runs elsewhere.
+    time.sleep(0.2)
+    idle = _start_worker(coordinator, "idle", results, poll_interval_sec=0.5)
+    time.sleep(0.1)
+    release.set()
+    try:
+        coordinator.wait(poll_sec=0.05)
+    finally:
+        coordinator.stop()
+    busy.join(timeout=10)
+    idle.join(timeout=10)
+
+    assert results == {'busy': 1, 'idle': 0}
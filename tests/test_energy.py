@@ -0,0 +1,55 @@
+import pytest
+
+from benchmark.utils.energy import EnergyMonitor, discover_package_domains
+
+
+def _zone(root, entry, name, energy_uj, max_energy_range_uj=1_000_000):
+    zone = root / entry
+    zone.mkdir()
+    (zone / "name").write_text(f"{name}\n")
+    (zone / "energy_uj").write_text(f"{energy_uj}\n")
+    (zone / "max_energy_range_uj").write_text(f"{max_energy_range_uj}\n")
+    return zone
+
+
+def _set_energy(zone, energy_uj):
+    (zone / "energy_uj").write_text(f"{energy_uj}\n")
+
+
+def test_discovers_only_package_zones(tmp_path):
+    _zone(tmp_path, "intel-rapl:0", "package-0", 100)
+    _zone(tmp_path, "intel-rapl:1", "package-1", 100)
+    _zone(tmp_path, "intel-rapl:0:0", "core", 100)
+    _zone(tmp_path, "intel-rapl:2", "psys", 100)
+    _zone(tmp_path, "intel-rapl-mmio:0", "package-0", 100)
+
+    names = [domain.name for domain in discover_package_domains(str(tmp_path))]
+
+    assert names == ["intel-rapl:0/package-0", "intel-rapl:1/package-1"]
+
+
+def test_accumulates_across_packages_and_wraparound(tmp_path):
+    package0 = _zone(tmp_path, "intel-rapl:0", "package-0", 999_000)
+    package1 = _zone(tmp_path, "amd-rapl:1", "package-1", 10_000)
+    monitor = EnergyMonitor(str(tmp_path))
+    assert monitor.available
+
+    monitor.start()
+    _set_energy(package0, 200_000)   # wrapped: 1_000 uJ to the top, then 200_000
+    _set_energy(package1, 110_000)
+    monitor.sample()
+    _set_energy(package0, 400_000)
+    _set_energy(package1, 310_000)
+    reading = monitor.stop()
+
+    assert reading.joules == pytest.approx((201_000 + 200_000 + 100_000 + 200_000) / 1e6)
+    assert reading.domains == ["amd-rapl:1/package-1", "intel-rapl:0/package-0"]
+    assert reading.duration_sec > 0
+
+
+def test_unreadable_tree_is_unavailable(tmp_path):
+    monitor = EnergyMonitor(str(tmp_path / "missing"))
+
+    assert not monitor.available
+    monitor.start()
+    assert monitor.stop() is None